@@ -0,0 +1,102 @@
+"""
+loop_allocations.py
+
+Measures how many environments Pulse loops allocate per iteration.
+
+Each benchmark program is run twice on the selected engine: once with every
+loop scope treated as captured, which forces a fresh environment per
+iteration (the behaviour of loops whose variables escape into a closure), and
+once with the resolver's capture analysis in effect, where loops rebind a
+single environment. Environment allocations are counted by wrapping
+`Environment.__init__`, and wall-clock time is reported alongside.
+
+Usage:
+    python benchmarks/loop_allocations.py [iterations] [--engine tree|closure|vm]
+"""
+
+import io
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from src.lexer import Lexer
+from src.parser import Parser
+from src.resolver import Resolver
+from src.environment import Environment
+from src.error import PulseRuntimeError
+from pulse import ENGINES
+
+PROGRAMS = {
+    "for": """
+total = 0
+for i in range(N):
+    x = i * 2
+    total = total + x
+""",
+    "while": """
+total = 0
+i = 0
+while i < N:
+    x = i * 2
+    total = total + x
+    i = i + 1
+""",
+    "listcomp": """
+xs = [i * 2 for i in range(N)]
+""",
+}
+
+class _AllocationCounter:
+    def __init__(self) -> None:
+        self.count = 0
+        self._original = Environment.__init__
+    
+    def __enter__(self) -> "_AllocationCounter":
+        original = self._original
+        counter = self
+        
+        def counting_init(env, *args, **kwargs):
+            counter.count += 1
+            original(env, *args, **kwargs)
+        Environment.__init__ = counting_init
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        Environment.__init__ = self._original
+
+def run(source: str, engine: str, fresh_scopes: bool) -> tuple[int, float]:
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = ENGINES[engine](Environment())
+    Resolver(interp).resolve(ast)
+    if fresh_scopes:
+        interp.captured_scopes.update(interp.scope_layouts)
+    PulseRuntimeError.clear_stack()
+    
+    with _AllocationCounter() as counter, redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        interp.interpret(ast, source)
+        elapsed = time.perf_counter() - start
+    return counter.count, elapsed
+
+def main(argv: list[str]) -> None:
+    engine = "tree"
+    if "--engine" in argv:
+        index = argv.index("--engine")
+        engine = argv[index + 1]
+        del argv[index:index + 2]
+    iterations = int(argv[0]) if argv else 100_000
+    
+    print(f"engine: {engine}, iterations: {iterations}")
+    print(f"{'program':<10} {'mode':<8} {'envs/iter':>10} {'time (ms)':>10}")
+    for name, template in PROGRAMS.items():
+        source = template.replace("N", str(iterations))
+        for mode, fresh in (("fresh", True), ("reused", False)):
+            count, elapsed = run(source, engine, fresh)
+            print(f"{name:<10} {mode:<8} {count / iterations:>10.2f} {elapsed * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
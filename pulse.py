@@ -11,6 +11,10 @@ from src.tokens import TokenType
 from src.lexer import Lexer
 from src.parser import Parser
 from src.interpreter import Interpreter
+from src.closure_compiler import ClosureInterpreter
+from src.vm import VirtualMachine
+from src.bytecode import disassemble
+from src.optimizer import Optimizer
 from src.resolver import Resolver
 from src.environment import Environment
 from src.error import PulseError, report_error
@@ -20,10 +24,31 @@ import argparse
 from time import perf_counter
 import codeop
 
+# Execution engines selectable with --engine
+ENGINES = {
+    "tree": Interpreter,
+    "closure": ClosureInterpreter,
+    "vm": VirtualMachine,
+}
+
 # Global runtime environment
 global_env = Environment()
 interpreter = Interpreter(global_env)
 
+# Whether the optimizer pass runs between parsing and resolving
+optimize_enabled = True
+
+def select_engine(name: str) -> None:
+    """Replace the global interpreter with a fresh one of the requested engine."""
+    global global_env, interpreter
+    global_env = Environment()
+    interpreter = ENGINES[name](global_env)
+
+def set_optimize(enabled: bool) -> None:
+    """Turn the AST optimizer pass on or off for subsequent runs."""
+    global optimize_enabled
+    optimize_enabled = enabled
+
 # Core pipeline
 def run(source: str) -> any:
     # 1. Lexing
@@ -34,11 +59,15 @@ def run(source: str) -> any:
     parser = Parser(tokens, source)
     statements = parser.parse()
     
-    # 3. Resolving (static analysis)
+    # 3. Optimizing (constant folding, literal pre-boxing)
+    if optimize_enabled:
+        statements = Optimizer(interpreter).optimize(statements)
+    
+    # 4. Resolving (static analysis)
     resolver = Resolver(interpreter)
     resolver.resolve(statements)
     
-    # 4. Interpretation
+    # 5. Interpretation
     return interpreter.interpret(statements, source)
 
 def run_with_time(source: str) -> any:
@@ -54,6 +83,11 @@ def run_with_time(source: str) -> any:
     statements = parser.parse()
     parse_time = perf_counter() - start
     
+    start = perf_counter()
+    if optimize_enabled:
+        statements = Optimizer(interpreter).optimize(statements)
+    optimize_time = perf_counter() - start
+    
     start = perf_counter()
     resolver = Resolver(interpreter)
     resolver.resolve(statements)
@@ -68,14 +102,25 @@ def run_with_time(source: str) -> any:
     print("\n=== Pipeline Timing ===")
     print(f"Lexing:        {lex_time:.6f}s")
     print(f"Parsing:       {parse_time:.6f}s")
+    print(f"Optimize:      {optimize_time:.6f}s")
     print(f"Resolving:     {resolve_time:.6f}s")
     print(f"Interpret:     {interpret_time:.6f}s")
     print(f"Total:         {total_time:.6f}s")
     
     return result
 
+def disassemble_source(source: str) -> str:
+    """Compile source for the bytecode VM and return its disassembly."""
+    vm = VirtualMachine(Environment())
+    tokens = Lexer(source).scan_tokens()
+    statements = Parser(tokens, source).parse()
+    if optimize_enabled:
+        statements = Optimizer(vm).optimize(statements)
+    Resolver(vm).resolve(statements)
+    return disassemble(vm.compiler.compile_program(statements))
+
 # File Execution
-def run_file(path: str, show_time: bool) -> None:
+def run_file(path: str, show_time: bool, show_dis: bool = False) -> None:
     try:
         with open(path, "r", encoding="utf-8") as f:
             source = f.read()
@@ -84,7 +129,9 @@ def run_file(path: str, show_time: bool) -> None:
         sys.exit(1)
     
     try:
-        if show_time:
+        if show_dis:
+            print(disassemble_source(source))
+        elif show_time:
             run_with_time(source)
         else:
             run(source)
@@ -223,6 +270,13 @@ USAGE
   py pulse.py <file.pul>          Run a Pulse program
   py pulse.py                     Start interactive REPL
   py pulse.py <file.pul> --time   Run with pipeline timing
+  py pulse.py <file.pul> --engine=closure
+                                  Run on the closure-compiled engine
+  py pulse.py <file.pul> --engine=vm
+                                  Run on the bytecode virtual machine
+  py pulse.py --dis <file.pul>    Show the bytecode for a program
+  py pulse.py <file.pul> --no-optimize
+                                  Run without constant folding
   py pulse.py --info              Show this reference guide
 
 
@@ -268,16 +322,16 @@ CONTROL FLOW
       print("zero")
   else:
       print("negative")
-
+  
   while x > 0:
       x -= 1
-
+  
   for item in [1, 2, 3]:
       print(item)
-
+  
   for i, val in enumerate(items):
       print(i, val)
-
+  
   match status:
       case 200:
           print("OK")
@@ -291,16 +345,16 @@ CONTROL FLOW
 FUNCTIONS
   def add(a, b):
       return a + b
-
+  
   def greet(name, msg="hello"):
       print(f"{{msg}}, {{name}}!")
-
+  
   def sum_all(*args):
       total = 0
       for n in args:
           total += n
       return total
-
+  
   double = lambda x: x * 2
 
 CLASSES
@@ -310,7 +364,7 @@ CLASSES
           self.name = name
       def speak(self):
           print(f"{{self.name}} speaks")
-
+  
   class Dog(Animal):
       def speak(self):
           print(f"{{self.name}} barks")
@@ -326,7 +380,7 @@ ERROR HANDLING
       print("Success")
   finally:
       print("Done")
-
+  
   raise ValueError("something went wrong")
 
 LIST OPERATIONS
@@ -377,7 +431,7 @@ DEL
 {line2}
   BUILT-IN FUNCTIONS
 {line2}
-
+  
   print(x, sep=" ", end="\\n")
   input(prompt)
   str(x)      int(x)      float(x)    bool(x)
@@ -394,26 +448,26 @@ DEL
 {line2}
   STANDARD LIBRARY
 {line2}
-
+  
   math        sqrt, floor, ceil, log, log2, log10, exp,
               sin, cos, tan, abs, pow, pi, e, inf, tau
-
+  
   io          read_file, write_file, append_file,
               file_exists, read_lines
-
+  
   os          getcwd, chdir, listdir, mkdir, makedirs,
               rmdir, removedirs, rmtree, remove, rename, copy,
               exists, is_file, is_dir, is_abs, join, basename,
               dirname, abspath, splitext, split, getsize,
               stat, getenv, setenv, env_vars, platform, sep
-
+  
   time        now, clock, sleep
-
+  
   random      random, randint, uniform, randrange,
               choice, choices, sample, shuffle,
               gauss, normalvariate, expovariate,
               triangular, seed, get_state
-
+  
   models      LinearRegression, LogisticRegression,
               DecisionTree, RandomForest, KMeans,
               KNN, SVC, NeuralNetwork, Model.auto
@@ -421,15 +475,15 @@ DEL
               → model.predict(X)
               → model.score(X, y)
               → model.explain(feature_names)
-
+  
   preprocess  normalize, standardize, min_max_scale,
               train_test_split, shuffle, flatten_data,
               one_hot_encode
-
+  
   metrics     accuracy, precision, recall, f1,
               confusion_matrix, classification_report,
               mse, rmse, mae, r2, mape, summary
-
+  
   learn       example, topics
               → learn.example("linear_regression")
               → learn.example("logistic_regression")
@@ -438,7 +492,7 @@ DEL
               → learn.example("random_forest")
               → learn.example("kmeans")
               → learn.example("neural_network")
-
+  
   datasets    iris, wine, digits, breast_cancer,
               diabetes, make_classfication, make_regression,
               make_blobs, make_moons, make_circles, load_csv
@@ -447,7 +501,7 @@ DEL
 {line2}
   TENSOR OPERATIONS
 {line2}
-
+  
   t = @[[1, 2, 3], [4, 5, 6]]
   t.shape      t.ndim       t.size       t.dtype
   t.T          t.flatten()  t.reshape(2, 3)
@@ -465,8 +519,17 @@ def main() -> int:
     parser.add_argument("file", nargs="?", help="Pulse source file (.pul)")
     parser.add_argument("--time", action="store_true", help="Show pipeline timing")
     parser.add_argument("--info", action="store_true", help="Show language reference")
+    parser.add_argument("--engine", choices=sorted(ENGINES), default="tree", help="Execution engine (default: tree)")
+    parser.add_argument("--dis", action="store_true", help="Print the bytecode disassembly instead of running")
+    parser.add_argument("--no-optimize", action="store_true", help="Skip the AST optimizer pass")
     args = parser.parse_args()
     
+    if args.no_optimize:
+        set_optimize(False)
+    
+    if args.engine != "tree":
+        select_engine(args.engine)
+    
     if args.info:
         _show_help()
         return 0
@@ -481,7 +544,7 @@ def main() -> int:
         report_error(PulseError(f'Unsupported file type: "{args.file}". Expected a .pul file.'))
         return 1
     
-    run_file(args.file, args.time)
+    run_file(args.file, args.time, args.dis)
     return 0
 
 # Entry point
@@ -0,0 +1,718 @@
+"""
+bytecode.py
+
+Defines the bytecode format and the bytecode compiler for the Pulse programming language.
+
+The compiler lowers the resolved AST into a flat list of instructions for the
+stack-based virtual machine in `vm.py`. Each compilation unit (a program, a
+function body, or a standalone statement/expression) becomes a CodeObject
+holding parallel arrays of opcodes, arguments and source lines, together with
+a constant pool of pre-boxed literal values.
+
+Control flow is expressed with jumps: `if`, `while`, `for`, `break` and
+`continue` are compiled to conditional and unconditional jumps with resolved
+targets, and lexical scopes are opened and closed with explicit
+PUSH_SCOPE/POP_SCOPE instructions that mirror the scopes created by the
+resolver. Loops also record a handler entry so that a `break` or `continue`
+reported by a delegated node can be routed to the right jump target.
+
+Node types without a dedicated lowering (classes, try/except, match, imports
+and a few expressions) are emitted as EXEC_NODE/EVAL_NODE instructions, which
+hand the node back to the tree-walking visitor. Their children still run on
+the virtual machine through the interpreter's `execute`/`evaluate`.
+
+This module primarily provides:
+- The opcode constants and their names
+- The CodeObject class, a compiled unit of bytecode
+- The Compiler class, which translates AST nodes into CodeObjects
+- The disassemble function, which renders a CodeObject as readable text
+"""
+
+from __future__ import annotations
+import operator as py_operator
+from typing import Any, Optional
+from src.values import PulseString, PulseNull, PulseValue
+import src.expressions as expressions
+import src.statements as statements
+
+# Opcodes
+LOAD_CONST = 0
+LOAD_LOCAL = 1
+LOAD_OUTER = 2
+LOAD_NAME = 3
+STORE_LOCAL = 4
+STORE_OUTER = 5
+STORE_GLOBAL = 6
+POP_TOP = 7
+STORE_RESULT = 8
+CLEAR_RESULT = 9
+BINARY_ARITH = 10
+BINARY_DIV = 11
+COMPARE = 12
+BINARY_OP = 13
+UNARY_NEGATIVE = 14
+UNARY_NOT = 15
+UNARY_OP = 16
+JUMP = 17
+POP_JUMP_IF_FALSE = 18
+JUMP_IF_TRUE_OR_POP = 19
+JUMP_IF_FALSE_OR_POP = 20
+BUILD_LIST = 21
+BUILD_DICT = 22
+BUILD_STRING = 23
+LIST_APPEND = 24
+GET_INDEX = 25
+SET_INDEX = 26
+GET_MEMBER = 27
+SET_MEMBER = 28
+CALL = 29
+RETURN_VALUE = 30
+PUSH_SCOPE = 31
+POP_SCOPE = 32
+NEW_SCOPE = 33
+ENTER_SCOPE = 34
+RESET_SCOPE = 35
+GET_ITER = 36
+GET_COMP_ITER = 37
+FOR_ITER = 38
+DEFINE_LOOP = 39
+DEFINE_NAME = 40
+UNPACK_LOOP = 41
+MAKE_FUNCTION = 42
+EXEC_NODE = 43
+EVAL_NODE = 44
+HALT = 45
+LOAD_METHOD = 46
+CALL_METHOD = 47
+
+OPNAMES = {
+    value: name for name, value in list(globals().items())
+    if name.isupper() and isinstance(value, int)
+}
+
+# Jump instructions whose argument is an instruction offset
+JUMPS = {JUMP, POP_JUMP_IF_FALSE, JUMP_IF_TRUE_OR_POP, JUMP_IF_FALSE_OR_POP, FOR_ITER}
+
+# Operators with a number/number fast path, keyed by lexeme
+ARITHMETIC = {
+    "+": py_operator.add,
+    "-": py_operator.sub,
+    "*": py_operator.mul,
+    "**": py_operator.pow,
+}
+
+DIVISION = {
+    "/": py_operator.truediv,
+    "%": py_operator.mod,
+    "//": lambda a, b: int(a // b),
+}
+
+COMPARISON = {
+    "<": py_operator.lt,
+    "<=": py_operator.le,
+    ">": py_operator.gt,
+    ">=": py_operator.ge,
+    "==": py_operator.eq,
+    "!=": py_operator.ne,
+}
+
+class LoopHandler:
+    """Jump targets used when a `break`/`continue` signal reaches a loop from a delegated node."""
+    __slots__ = ("start", "end", "depth", "stack_depth", "break_target", "continue_target", "has_iterator")
+    
+    def __init__(self, start: int, depth: int, stack_depth: int, has_iterator: bool) -> None:
+        self.start = start
+        self.end = start
+        self.depth = depth
+        self.stack_depth = stack_depth
+        self.break_target = start
+        self.continue_target = start
+        self.has_iterator = has_iterator
+
+class CodeObject:
+    def __init__(self, name: str, is_function: bool = False) -> None:
+        self.name = name
+        self.is_function = is_function
+        self.ops: list[int] = []
+        self.args: list[Any] = []
+        self.lines: list[Optional[int]] = []
+        self.depths: list[int] = []
+        self.notes: list[Any] = []
+        self.constants: list[Any] = []
+        self.handlers: list[LoopHandler] = []
+        self.children: list[CodeObject] = []
+        self._constant_index: dict[Any, int] = {}
+    
+    def add_constant(self, raw: Any, value: Any) -> int:
+        key = (type(raw), raw)
+        index = self._constant_index.get(key)
+        if index is None:
+            index = len(self.constants)
+            self.constants.append(value)
+            self._constant_index[key] = index
+        return index
+    
+    def find_handler(self, pc: int) -> Optional[LoopHandler]:
+        for handler in self.handlers:
+            if handler.start <= pc < handler.end:
+                return handler
+        return None
+    
+    def __len__(self) -> int:
+        return len(self.ops)
+    
+    def __repr__(self) -> str:
+        return f"<code {self.name}, {len(self.ops)} instructions>"
+
+class _Loop:
+    def __init__(self, handler: LoopHandler) -> None:
+        self.handler = handler
+        self.breaks: list[int] = []
+        self.continues: list[int] = []
+
+class Compiler:
+    def __init__(self, interpreter) -> None:
+        self.interp = interpreter
+        self.functions: dict[Any, CodeObject] = {}
+        self.units: dict[Any, CodeObject] = {}
+        
+        self.code: Optional[CodeObject] = None
+        self.depth = 0
+        self.stack_depth = 0
+        self.loops: list[_Loop] = []
+        self.line: Optional[int] = None
+        
+        self._expr_compilers = {
+            expressions.Literal: self._literal,
+            expressions.Variable: self._variable,
+            expressions.Assign: self._assign,
+            expressions.Grouping: self._grouping,
+            expressions.Unary: self._unary,
+            expressions.Binary: self._binary,
+            expressions.Logical: self._logical,
+            expressions.List: self._list,
+            expressions.Dict: self._dict,
+            expressions.Index: self._index,
+            expressions.SetIndex: self._setindex,
+            expressions.MemberAccess: self._memberaccess,
+            expressions.SetMember: self._setmember,
+            expressions.Call: self._call,
+            expressions.Ternary: self._ternary,
+            expressions.FString: self._fstring,
+            expressions.ListComp: self._listcomp,
+        }
+        
+        self._stmt_compilers = {
+            statements.Expression: self._expression_stmt,
+            statements.Block: self._block_stmt,
+            statements.If: self._if_stmt,
+            statements.While: self._while_stmt,
+            statements.For: self._for_stmt,
+            statements.Break: self._break_stmt,
+            statements.Continue: self._continue_stmt,
+            statements.Return: self._return_stmt,
+            statements.Function: self._function_stmt,
+            statements.Pass: self._pass_stmt,
+        }
+    
+    # Entry points
+    def compile_program(self, stmts: list, name: str = "<module>") -> CodeObject:
+        """Compile top-level statements; HALT yields the value of the last statement."""
+        state = self._begin_unit(CodeObject(name))
+        for stmt in stmts:
+            self.compile_stmt(stmt, keep_result=True)
+        self.emit(HALT)
+        return self._end_unit(state)
+    
+    def compile_statement(self, stmt) -> CodeObject:
+        code = self.units.get(stmt)
+        if code is None:
+            code = self.compile_program([stmt], name=f"<{type(stmt).__name__.lower()}>")
+            self.units[stmt] = code
+        return code
+    
+    def compile_expression(self, expr) -> CodeObject:
+        code = self.units.get(expr)
+        if code is None:
+            state = self._begin_unit(CodeObject(f"<{type(expr).__name__.lower()}>"))
+            self.compile_expr(expr)
+            self.emit(STORE_RESULT)
+            self.emit(HALT)
+            code = self._end_unit(state)
+            self.units[expr] = code
+        return code
+    
+    def compile_function(self, declaration) -> CodeObject:
+        code = self.functions.get(declaration)
+        if code is None:
+            state = self._begin_unit(CodeObject(declaration.name.lexeme, is_function=True))
+            self.functions[declaration] = self.code
+            for stmt in declaration.body.statements:
+                self.compile_stmt(stmt)
+            self._load_null()
+            self.emit(RETURN_VALUE)
+            code = self._end_unit(state)
+        return code
+    
+    # Unit & instruction helpers
+    def _begin_unit(self, code: CodeObject) -> tuple:
+        state = (self.code, self.depth, self.stack_depth, self.loops, self.line)
+        self.code = code
+        self.depth = 0
+        self.stack_depth = 0
+        self.loops = []
+        return state
+    
+    def _end_unit(self, state: tuple) -> CodeObject:
+        code = self.code
+        self.code, self.depth, self.stack_depth, self.loops, self.line = state
+        return code
+    
+    def emit(self, op: int, arg: Any = None, note: Any = None) -> int:
+        code = self.code
+        code.ops.append(op)
+        code.args.append(arg)
+        code.lines.append(self.line)
+        code.depths.append(self.depth)
+        code.notes.append(note)
+        return len(code.ops) - 1
+    
+    def patch(self, index: int, target: Optional[int] = None) -> None:
+        self.code.args[index] = len(self.code.ops) if target is None else target
+    
+    def _load_null(self) -> None:
+        self.emit(LOAD_CONST, self.code.add_constant(None, PulseNull()))
+    
+    def _track_line(self, node) -> None:
+        for attr in ("name", "operator", "paren", "keyword", "var"):
+            token = getattr(node, attr, None)
+            line = getattr(token, "line", None)
+            if line is not None:
+                self.line = line
+                return
+    
+    # Dispatch
+    def compile_expr(self, expr) -> None:
+        self._track_line(expr)
+        compiler = self._expr_compilers.get(type(expr))
+        if compiler is not None:
+            compiler(expr)
+        else:
+            self.emit(EVAL_NODE, expr)
+    
+    def compile_stmt(self, stmt, keep_result: bool = False) -> None:
+        self._track_line(stmt)
+        compiler = self._stmt_compilers.get(type(stmt))
+        if compiler is None:
+            self.emit(EXEC_NODE, (stmt, keep_result))
+        elif isinstance(stmt, (statements.Expression, statements.Block, statements.If)):
+            compiler(stmt, keep_result)
+        else:
+            if keep_result:
+                self.emit(CLEAR_RESULT)
+            compiler(stmt)
+    
+    # Expressions
+    def _literal(self, expr) -> None:
+        value = self.interp.visit_literal_expr(expr)
+        raw = expr.value
+        if isinstance(raw, PulseValue):
+            # Boxed by the optimizer; pool on the underlying Python value
+            raw = None if isinstance(raw, PulseNull) else raw.value
+        self.emit(LOAD_CONST, self.code.add_constant(raw, value))
+    
+    def _variable(self, expr) -> None:
+        name = expr.name.lexeme
+        distance = self.interp.locals.get(expr)
+        slot = self.interp.local_slots.get(expr)
+        
+        if name == "self" or distance is None:
+            self.emit(LOAD_NAME, (name, expr.name))
+        elif slot is None:
+            self.emit(EVAL_NODE, expr)
+        elif distance == 0:
+            self.emit(LOAD_LOCAL, slot, expr)
+        else:
+            self.emit(LOAD_OUTER, (distance, slot), expr)
+    
+    def _assign(self, expr) -> None:
+        name = expr.name.lexeme
+        distance = self.interp.locals.get(expr)
+        slot = self.interp.local_slots.get(expr)
+        
+        if distance is not None and slot is None:
+            self.emit(EVAL_NODE, expr)
+            return
+        
+        self.compile_expr(expr.value)
+        if distance is None:
+            self.emit(STORE_GLOBAL, name)
+        elif distance == 0:
+            self.emit(STORE_LOCAL, slot, name)
+        else:
+            self.emit(STORE_OUTER, (distance, slot), name)
+    
+    def _grouping(self, expr) -> None:
+        self.compile_expr(expr.expression)
+    
+    def _unary(self, expr) -> None:
+        self.compile_expr(expr.right)
+        lexeme = expr.operator.lexeme
+        
+        if lexeme == "-":
+            self.emit(UNARY_NEGATIVE, expr.operator)
+        elif lexeme in ("not", "!"):
+            self.emit(UNARY_NOT)
+        else:
+            self.emit(UNARY_OP, expr.operator)
+    
+    def _binary(self, expr) -> None:
+        self.compile_expr(expr.left)
+        self.compile_expr(expr.right)
+        tok = expr.operator
+        
+        if tok.lexeme in ARITHMETIC:
+            self.emit(BINARY_ARITH, (ARITHMETIC[tok.lexeme], tok))
+        elif tok.lexeme in DIVISION:
+            self.emit(BINARY_DIV, (DIVISION[tok.lexeme], tok))
+        elif tok.lexeme in COMPARISON:
+            self.emit(COMPARE, (COMPARISON[tok.lexeme], tok))
+        else:
+            self.emit(BINARY_OP, tok)
+    
+    def _logical(self, expr) -> None:
+        lexeme = expr.operator.lexeme
+        if lexeme not in ("or", "and"):
+            self.emit(EVAL_NODE, expr)
+            return
+        
+        self.compile_expr(expr.left)
+        jump = self.emit(JUMP_IF_TRUE_OR_POP if lexeme == "or" else JUMP_IF_FALSE_OR_POP)
+        self.compile_expr(expr.right)
+        self.patch(jump)
+    
+    def _list(self, expr) -> None:
+        for element in expr.elements:
+            self.compile_expr(element)
+        self.emit(BUILD_LIST, len(expr.elements))
+    
+    def _dict(self, expr) -> None:
+        for key, value in zip(expr.keys, expr.values):
+            self.compile_expr(key)
+            self.compile_expr(value)
+        self.emit(BUILD_DICT, len(expr.keys))
+    
+    def _index(self, expr) -> None:
+        self.compile_expr(expr.object)
+        self.compile_expr(expr.index)
+        self.emit(GET_INDEX)
+    
+    def _setindex(self, expr) -> None:
+        self.compile_expr(expr.object)
+        self.compile_expr(expr.index)
+        self.compile_expr(expr.value)
+        self.emit(SET_INDEX)
+    
+    def _memberaccess(self, expr) -> None:
+        self.compile_expr(expr.object)
+        self.emit(GET_MEMBER, expr.name)
+    
+    def _setmember(self, expr) -> None:
+        self.compile_expr(expr.object)
+        self.compile_expr(expr.value)
+        self.emit(SET_MEMBER, expr.name)
+    
+    def _call(self, expr) -> None:
+        # `obj.name(args)` keeps the receiver beside the method instead of binding it
+        is_method = expr.callee.__class__ is expressions.MemberAccess
+        if is_method:
+            self.compile_expr(expr.callee.object)
+            self.emit(LOAD_METHOD, expr.callee.name)
+        else:
+            self.compile_expr(expr.callee)
+        for argument in expr.arguments:
+            self.compile_expr(argument)
+        for _, value in expr.keyword_arguments:
+            self.compile_expr(value)
+        kwnames = tuple(name.lexeme for name, _ in expr.keyword_arguments)
+        self.emit(CALL_METHOD if is_method else CALL, (len(expr.arguments), kwnames, expr))
+    
+    def _ternary(self, expr) -> None:
+        self.compile_expr(expr.condition)
+        to_else = self.emit(POP_JUMP_IF_FALSE)
+        self.compile_expr(expr.then_expr)
+        to_end = self.emit(JUMP)
+        self.patch(to_else)
+        self.compile_expr(expr.else_expr)
+        self.patch(to_end)
+    
+    def _fstring(self, expr) -> None:
+        # Interpolated parts are lexed separately, so their tokens carry relative lines
+        line = self.line
+        for part in expr.parts:
+            self.compile_expr(part)
+            self.line = line
+        self.emit(BUILD_STRING, len(expr.parts))
+    
+    def _listcomp(self, expr) -> None:
+        reuse = self.interp._reusable_scope(expr, self.interp.scope_layouts.get(expr))
+        self.emit(BUILD_LIST, 0)
+        self.compile_expr(expr.iterable)
+        self.emit(GET_COMP_ITER)
+        if reuse:
+            self._push_scope(expr)
+        
+        head = self.emit(FOR_ITER)
+        if not reuse:
+            self._push_scope(expr)
+        self._define_loop_var(expr, expr.var.lexeme)
+        
+        skip = None
+        if expr.condition is not None:
+            self.compile_expr(expr.condition)
+            skip = self.emit(POP_JUMP_IF_FALSE)
+        self.compile_expr(expr.element)
+        self.emit(LIST_APPEND)
+        if skip is not None:
+            self.patch(skip)
+        
+        if not reuse:
+            self._pop_scope()
+        self.emit(JUMP, head)
+        self.patch(head)
+        if reuse:
+            self._pop_scope()
+    
+    # Statements
+    def _expression_stmt(self, stmt, keep_result: bool = False) -> None:
+        self.compile_expr(stmt.expression)
+        self.emit(STORE_RESULT if keep_result else POP_TOP)
+    
+    def _block_stmt(self, stmt, keep_result: bool = False) -> None:
+        if keep_result and not stmt.statements:
+            self.emit(CLEAR_RESULT)
+        
+        self._push_scope(stmt)
+        for s in stmt.statements:
+            self.compile_stmt(s, keep_result)
+        self._pop_scope()
+    
+    def _if_stmt(self, stmt, keep_result: bool = False) -> None:
+        if keep_result:
+            self.emit(CLEAR_RESULT)
+        
+        branches = [(stmt.condition, stmt.then_branch)] + list(stmt.elif_branches)
+        to_end = []
+        for i, (condition, branch) in enumerate(branches):
+            self.compile_expr(condition)
+            to_next = self.emit(POP_JUMP_IF_FALSE)
+            self.compile_stmt(branch, keep_result)
+            if i < len(branches) - 1 or stmt.else_branch is not None:
+                to_end.append(self.emit(JUMP))
+            self.patch(to_next)
+        
+        if stmt.else_branch is not None:
+            self.compile_stmt(stmt.else_branch, keep_result)
+        
+        for jump in to_end:
+            self.patch(jump)
+    
+    def _while_stmt(self, stmt) -> None:
+        body = stmt.body
+        layout = self.interp.scope_layouts.get(body)
+        if not isinstance(body, statements.Block) or not self.interp._reusable_scope(body, layout):
+            head = len(self.code)
+            loop = self._begin_loop(head, has_iterator=False)
+            
+            self.compile_expr(stmt.condition)
+            to_end = self.emit(POP_JUMP_IF_FALSE)
+            self.compile_stmt(body)
+            self.emit(JUMP, head)
+            self.patch(to_end)
+            
+            self._end_loop(loop, continue_target=head)
+            return
+        
+        # The body environment is built once and parked on the stack; the
+        # condition still runs in the enclosing scope
+        self.emit(NEW_SCOPE, layout)
+        self.stack_depth += 1
+        head = len(self.code)
+        loop = self._begin_loop(head, has_iterator=False)
+        
+        self.compile_expr(stmt.condition)
+        to_end = self.emit(POP_JUMP_IF_FALSE)
+        self.emit(ENTER_SCOPE)
+        self.depth += 1
+        for s in body.statements:
+            self.compile_stmt(s)
+        self._pop_scope()
+        self.emit(JUMP, head)
+        self.patch(to_end)
+        
+        self._end_loop(loop, continue_target=head)
+        self.emit(POP_TOP)
+        self.stack_depth -= 1
+    
+    def _for_stmt(self, stmt) -> None:
+        layout = self.interp.scope_layouts.get(stmt)
+        reuse = self.interp._reusable_scope(stmt, layout)
+        self.compile_expr(stmt.iterable)
+        self.emit(GET_ITER)
+        if reuse:
+            self._push_scope(stmt)
+        
+        head = len(self.code)
+        loop = self._begin_loop(head, has_iterator=True)
+        self.stack_depth += 1
+        
+        self.emit(FOR_ITER)
+        if not reuse:
+            self._push_scope(stmt)
+        else:
+            rebind_only = stmt.vars is None and len(layout) == 1 and stmt.var.lexeme in layout
+            self.emit(RESET_SCOPE, rebind_only)
+        if stmt.vars is not None:
+            self.emit(UNPACK_LOOP, stmt.vars)
+        else:
+            self._define_loop_var(stmt, stmt.var.lexeme)
+        
+        body = stmt.body.statements if isinstance(stmt.body, statements.Block) else [stmt.body]
+        for s in body:
+            self.compile_stmt(s)
+        if not reuse:
+            self._pop_scope()
+        self.emit(JUMP, head)
+        self.patch(head)
+        
+        self.stack_depth -= 1
+        self._end_loop(loop, continue_target=head)
+        if reuse:
+            self._pop_scope()
+    
+    def _push_scope(self, node) -> None:
+        self.emit(PUSH_SCOPE, self.interp.scope_layouts.get(node))
+        self.depth += 1
+    
+    def _pop_scope(self) -> None:
+        self.emit(POP_SCOPE, 1)
+        self.depth -= 1
+    
+    def _define_loop_var(self, node, name: str) -> None:
+        layout = self.interp.scope_layouts.get(node)
+        if layout is not None and name in layout:
+            self.emit(DEFINE_LOOP, layout[name], name)
+        else:
+            self.emit(DEFINE_NAME, name)
+    
+    def _begin_loop(self, head: int, has_iterator: bool) -> _Loop:
+        loop = _Loop(LoopHandler(head, self.depth, self.stack_depth, has_iterator))
+        self.loops.append(loop)
+        return loop
+    
+    def _end_loop(self, loop: _Loop, continue_target: int) -> None:
+        self.loops.pop()
+        handler = loop.handler
+        handler.end = len(self.code)
+        handler.break_target = handler.end
+        handler.continue_target = continue_target
+        
+        for jump in loop.breaks:
+            self.patch(jump, handler.break_target)
+        for jump in loop.continues:
+            self.patch(jump, continue_target)
+        self.code.handlers.append(handler)
+    
+    def _break_stmt(self, stmt) -> None:
+        if not self.loops:
+            self.emit(EXEC_NODE, (stmt, False))
+            return
+        
+        loop = self.loops[-1]
+        scopes = self.depth - loop.handler.depth
+        if scopes:
+            self.emit(POP_SCOPE, scopes)
+        if loop.handler.has_iterator:
+            self.emit(POP_TOP)
+        loop.breaks.append(self.emit(JUMP))
+    
+    def _continue_stmt(self, stmt) -> None:
+        if not self.loops:
+            self.emit(EXEC_NODE, (stmt, False))
+            return
+        
+        loop = self.loops[-1]
+        scopes = self.depth - loop.handler.depth
+        if scopes:
+            self.emit(POP_SCOPE, scopes)
+        loop.continues.append(self.emit(JUMP))
+    
+    def _return_stmt(self, stmt) -> None:
+        if stmt.value is not None:
+            self.compile_expr(stmt.value)
+        else:
+            self._load_null()
+        self.emit(RETURN_VALUE)
+    
+    def _function_stmt(self, stmt) -> None:
+        self.code.children.append(self.compile_function(stmt))
+        self.emit(MAKE_FUNCTION, stmt)
+    
+    def _pass_stmt(self, stmt) -> None:
+        pass
+
+# Disassembler
+def _note_name(note: Any) -> str:
+    return note.name.lexeme if hasattr(note, "name") else str(note)
+
+def _format_arg(code: CodeObject, op: int, arg: Any, note: Any = None) -> str:
+    if arg is None:
+        return ""
+    if op == LOAD_CONST:
+        value = code.constants[arg]
+        shown = repr(value.value) if isinstance(value, PulseString) else repr(value)
+        return f"{arg} ({shown})"
+    if op in (BINARY_ARITH, BINARY_DIV, COMPARE):
+        return arg[1].lexeme
+    if op in (BINARY_OP, UNARY_NEGATIVE, UNARY_OP, GET_MEMBER, SET_MEMBER, LOAD_METHOD):
+        return arg.lexeme
+    if op == LOAD_NAME:
+        return arg[0]
+    if op in (LOAD_LOCAL, STORE_LOCAL, DEFINE_LOOP):
+        return f"{arg} ({_note_name(note)})"
+    if op == LOAD_OUTER or op == STORE_OUTER:
+        return f"{arg[1]} ({_note_name(note)}, depth {arg[0]})"
+    if op == PUSH_SCOPE or op == NEW_SCOPE:
+        return ", ".join(arg) if arg else ""
+    if op == CALL or op == CALL_METHOD:
+        argc, kwnames, _ = arg
+        return f"{argc}" + (f" kw={', '.join(kwnames)}" if kwnames else "")
+    if op == UNPACK_LOOP:
+        return ", ".join(t.lexeme for t in arg)
+    if op == MAKE_FUNCTION:
+        return arg.name.lexeme
+    if op == EXEC_NODE:
+        return type(arg[0]).__name__
+    if op == EVAL_NODE:
+        return type(arg).__name__
+    if op in JUMPS:
+        return f"to {arg}"
+    return str(arg)
+
+def disassemble(code: CodeObject) -> str:
+    """Render a CodeObject (and the functions it defines) as a human-readable listing."""
+    out = [f"Disassembly of <code {code.name}>:"]
+    last_line = None
+    targets = {arg for op, arg in zip(code.ops, code.args) if op in JUMPS}
+    targets.update(h.end for h in code.handlers)
+    
+    for offset, (op, arg, line, note) in enumerate(zip(code.ops, code.args, code.lines, code.notes)):
+        line_col = f"{line:>4}" if line is not None and line != last_line else "    "
+        last_line = line if line is not None else last_line
+        marker = ">>" if offset in targets else "  "
+        out.append(f"{line_col}  {marker} {offset:>4} {OPNAMES[op]:<22} {_format_arg(code, op, arg, note)}".rstrip())
+    
+    for child in code.children:
+        out.append("")
+        out.append(disassemble(child))
+    return "\n".join(out)
@@ -0,0 +1,623 @@
+"""
+closure_compiler.py
+
+Implements the closure-compilation execution engine for the Pulse programming language.
+
+The tree-walking interpreter re-discovers the shape of the program every time a
+node runs: each expression goes through `evaluate` -> `accept` -> `visit_*`, and
+operators are chosen by comparing lexemes at runtime. The closure compiler walks
+the resolved AST once and turns every node into a small specialized Python
+closure. Decisions that never change between executions are made at compile time:
+
+- Literals are boxed once and returned as constants
+- Variable reads and writes are specialized on their resolved scope distance and slot
+- Binary operators select their handler up front and carry a number/number fast path
+- Calls, member accesses and index expressions have their operands pre-compiled
+
+Node types without a specialized form are compiled to a closure that calls the
+matching `visit_*` method of the interpreter. Their children are still compiled,
+so any nested `evaluate`/`execute` call is served from the compiled cache.
+
+This module primarily provides:
+- The ClosureCompiler class, which translates AST nodes into closures
+- The ClosureInterpreter class, an Interpreter that executes compiled closures
+"""
+
+from __future__ import annotations
+import operator as py_operator
+from functools import partial
+from typing import Any, Callable
+from src.interpreter import Interpreter
+from src.environment import Environment, UNSET
+from src.function import PulseFunction
+from src.values import PulseNumber, PulseString, PulseBoolean, PulseList, PulseDict
+from src.methods import NATIVE_METHODS
+import src.expressions as expressions
+import src.statements as statements
+from src.runtime import PulseInstance, Completion, BREAK, CONTINUE
+
+Code = Callable[[], Any]
+
+# Operators with a number/number fast path, keyed by lexeme
+_ARITHMETIC = {
+    "+": py_operator.add,
+    "-": py_operator.sub,
+    "*": py_operator.mul,
+    "**": py_operator.pow,
+}
+
+_COMPARISON = {
+    "<": py_operator.lt,
+    "<=": py_operator.le,
+    ">": py_operator.gt,
+    ">=": py_operator.ge,
+    "==": py_operator.eq,
+    "!=": py_operator.ne,
+}
+
+_DIVISION = {
+    "/": py_operator.truediv,
+    "%": py_operator.mod,
+    "//": lambda a, b: int(a // b),
+}
+
+class ClosureCompiler:
+    def __init__(self, interpreter: "ClosureInterpreter") -> None:
+        self.interp = interpreter
+        self.cache: dict[Any, Code] = {}
+        
+        self._expr_compilers = {
+            expressions.Literal: self._literal,
+            expressions.Variable: self._variable,
+            expressions.Assign: self._assign,
+            expressions.Grouping: self._grouping,
+            expressions.Unary: self._unary,
+            expressions.Binary: self._binary,
+            expressions.Logical: self._logical,
+            expressions.List: self._list,
+            expressions.Dict: self._dict,
+            expressions.Index: self._index,
+            expressions.SetIndex: self._setindex,
+            expressions.MemberAccess: self._memberaccess,
+            expressions.SetMember: self._setmember,
+            expressions.Call: self._call,
+            expressions.Ternary: self._ternary,
+            expressions.FString: self._fstring,
+        }
+        
+        self._stmt_compilers = {
+            statements.Expression: self._expression_stmt,
+            statements.Block: self._block_stmt,
+            statements.If: self._if_stmt,
+            statements.While: self._while_stmt,
+            statements.For: self._for_stmt,
+            statements.Return: self._return_stmt,
+            statements.Function: self._function_stmt,
+        }
+    
+    # Entry points
+    def compile_expr(self, expr) -> Code:
+        code = self.cache.get(expr)
+        if code is None:
+            compiler = self._expr_compilers.get(type(expr))
+            code = compiler(expr) if compiler is not None else self._generic_expr(expr)
+            self.cache[expr] = code
+        return code
+    
+    def compile_stmt(self, stmt) -> Code:
+        code = self.cache.get(stmt)
+        if code is None:
+            compiler = self._stmt_compilers.get(type(stmt))
+            code = compiler(stmt) if compiler is not None else self._generic_stmt(stmt)
+            self.cache[stmt] = code
+        return code
+    
+    def compile_program(self, stmts: list) -> list[Code]:
+        return [self.compile_stmt(s) for s in stmts]
+    
+    def _compile_function(self, declaration) -> None:
+        """Pre-compile a function body and its default values so calls hit the cache."""
+        for default in declaration.defaults:
+            if default is not None:
+                self.compile_expr(default)
+        for s in declaration.body.statements:
+            self.compile_stmt(s)
+    
+    # Fallbacks
+    def _generic_expr(self, expr) -> Code:
+        self._compile_children(expr)
+        return partial(expr.accept, self.interp)
+    
+    def _generic_stmt(self, stmt) -> Code:
+        self._compile_children(stmt)
+        return partial(stmt.accept, self.interp)
+    
+    def _compile_children(self, node) -> None:
+        for value in vars(node).values():
+            self._compile_nested(value)
+    
+    def _compile_nested(self, value) -> None:
+        if isinstance(value, expressions.Expr):
+            self.compile_expr(value)
+        elif isinstance(value, statements.Stmt):
+            self.compile_stmt(value)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                self._compile_nested(item)
+    
+    # Expressions
+    def _literal(self, expr) -> Code:
+        value = self.interp.visit_literal_expr(expr)
+        
+        def literal() -> Any:
+            return value
+        return literal
+    
+    def _variable(self, expr) -> Code:
+        interp = self.interp
+        name = expr.name.lexeme
+        distance = interp.locals.get(expr)
+        slot = interp.local_slots.get(expr)
+        # The visitor reports unbound slots with the interpreter's usual error
+        slow = partial(interp.visit_variable_expr, expr)
+        
+        if name == "self" or distance is None or slot is None:
+            return slow
+        
+        if distance == 0:
+            def load_local() -> Any:
+                value = interp.environment.slots[slot]
+                return slow() if value is UNSET else value
+            return load_local
+        
+        if distance == 1:
+            def load_enclosing() -> Any:
+                value = interp.environment.enclosing.slots[slot]
+                return slow() if value is UNSET else value
+            return load_enclosing
+        
+        def load_at() -> Any:
+            value = interp.environment.ancestor(distance).slots[slot]
+            return slow() if value is UNSET else value
+        return load_at
+    
+    def _assign(self, expr) -> Code:
+        interp = self.interp
+        name = expr.name.lexeme
+        value_code = self.compile_expr(expr.value)
+        distance = interp.locals.get(expr)
+        slot = interp.local_slots.get(expr)
+        
+        if distance is not None and slot is None:
+            return partial(expr.accept, interp)
+        
+        if distance == 0:
+            def store_local() -> Any:
+                value = value_code()
+                interp.environment.slots[slot] = value
+                return value
+            return store_local
+        
+        if distance is not None:
+            def store_at() -> Any:
+                value = value_code()
+                interp.environment.ancestor(distance).slots[slot] = value
+                return value
+            return store_at
+        
+        globals_env = interp.globals
+        
+        def store_global() -> Any:
+            value = value_code()
+            if name in globals_env.values:
+                globals_env.assign(name, value)
+            else:
+                globals_env.define(name, value)
+            return value
+        return store_global
+    
+    def _grouping(self, expr) -> Code:
+        return self.compile_expr(expr.expression)
+    
+    def _unary(self, expr) -> Code:
+        right = self.compile_expr(expr.right)
+        tok = expr.operator
+        slow = self.interp._unary_op
+        
+        if tok.lexeme == "-":
+            def negate() -> Any:
+                value = right()
+                if value.__class__ is PulseNumber:
+                    return PulseNumber(-value.value)
+                return slow(tok, value)
+            return negate
+        
+        if tok.lexeme in ("not", "!"):
+            def logical_not() -> Any:
+                return PulseBoolean(not right().is_truthy())
+            return logical_not
+        
+        return lambda: slow(tok, right())
+    
+    def _binary(self, expr) -> Code:
+        left = self.compile_expr(expr.left)
+        right = self.compile_expr(expr.right)
+        tok = expr.operator
+        op = tok.lexeme
+        slow = self.interp._binary_op
+        
+        if op in _ARITHMETIC:
+            fn = _ARITHMETIC[op]
+            
+            def arithmetic() -> Any:
+                lv = left()
+                rv = right()
+                if lv.__class__ is PulseNumber and rv.__class__ is PulseNumber:
+                    return PulseNumber(fn(lv.value, rv.value))
+                return slow(tok, lv, rv)
+            return arithmetic
+        
+        if op in _DIVISION:
+            fn = _DIVISION[op]
+            
+            def division() -> Any:
+                lv = left()
+                rv = right()
+                if lv.__class__ is PulseNumber and rv.__class__ is PulseNumber and rv.value != 0:
+                    return PulseNumber(fn(lv.value, rv.value))
+                return slow(tok, lv, rv)
+            return division
+        
+        if op in _COMPARISON:
+            fn = _COMPARISON[op]
+            
+            def comparison() -> Any:
+                lv = left()
+                rv = right()
+                if lv.__class__ is PulseNumber and rv.__class__ is PulseNumber:
+                    return PulseBoolean(fn(lv.value, rv.value))
+                return slow(tok, lv, rv)
+            return comparison
+        
+        return lambda: slow(tok, left(), right())
+    
+    def _logical(self, expr) -> Code:
+        left = self.compile_expr(expr.left)
+        right = self.compile_expr(expr.right)
+        
+        if expr.operator.lexeme == "or":
+            def logical_or() -> Any:
+                value = left()
+                return value if value.is_truthy() else right()
+            return logical_or
+        
+        if expr.operator.lexeme == "and":
+            def logical_and() -> Any:
+                value = left()
+                return right() if value.is_truthy() else value
+            return logical_and
+        
+        return self._generic_expr(expr)
+    
+    def _list(self, expr) -> Code:
+        elements = [self.compile_expr(e) for e in expr.elements]
+        return lambda: PulseList([element() for element in elements])
+    
+    def _dict(self, expr) -> Code:
+        pairs = [
+            (self.compile_expr(k), self.compile_expr(v))
+            for k, v in zip(expr.keys, expr.values)
+        ]
+        
+        def build_dict() -> PulseDict:
+            entries: dict[Any, Any] = {}
+            for key, value in pairs:
+                entries[key()] = value()
+            return PulseDict(entries)
+        return build_dict
+    
+    def _index(self, expr) -> Code:
+        obj_code = self.compile_expr(expr.object)
+        index_code = self.compile_expr(expr.index)
+        slow = self.interp._get_index
+        
+        def index() -> Any:
+            obj = obj_code()
+            idx = index_code()
+            if obj.__class__ is PulseList and idx.__class__ is PulseNumber:
+                elements = obj.elements
+                i = int(idx.value)
+                if -len(elements) <= i < len(elements):
+                    return elements[i]
+            return slow(obj, idx)
+        return index
+    
+    def _setindex(self, expr) -> Code:
+        obj_code = self.compile_expr(expr.object)
+        index_code = self.compile_expr(expr.index)
+        value_code = self.compile_expr(expr.value)
+        slow = self.interp._set_index
+        
+        def set_index() -> Any:
+            obj = obj_code()
+            idx = index_code()
+            value = value_code()
+            if obj.__class__ is PulseList and idx.__class__ is PulseNumber:
+                elements = obj.elements
+                i = int(idx.value)
+                if -len(elements) <= i < len(elements):
+                    elements[i] = value
+                    return value
+            return slow(obj, idx, value)
+        return set_index
+    
+    def _memberaccess(self, expr) -> Code:
+        obj_code = self.compile_expr(expr.object)
+        name_tok = expr.name
+        get_member = self.interp._get_member
+        return lambda: get_member(obj_code(), name_tok)
+    
+    def _setmember(self, expr) -> Code:
+        obj_code = self.compile_expr(expr.object)
+        value_code = self.compile_expr(expr.value)
+        name_tok = expr.name
+        set_member = self.interp._set_member
+        
+        def set_member_value() -> Any:
+            obj = obj_code()
+            return set_member(obj, name_tok, value_code())
+        return set_member_value
+    
+    def _call(self, expr) -> Code:
+        if expr.callee.__class__ is expressions.MemberAccess:
+            return self._method_call(expr)
+        
+        interp = self.interp
+        callee_code = self.compile_expr(expr.callee)
+        arg_codes = [self.compile_expr(a) for a in expr.arguments]
+        kwarg_codes = [(name.lexeme, self.compile_expr(v)) for name, v in expr.keyword_arguments]
+        call_value = interp._call_value
+        
+        def call() -> Any:
+            interp._call_depth += 1
+            if interp._call_depth > interp._max_call_depth:
+                interp._call_depth = 0
+                interp._raise("Maximum recursion depth exceeded", expr.paren)
+            
+            callee = callee_code()
+            arguments = [arg() for arg in arg_codes]
+            kwargs = {name: value() for name, value in kwarg_codes}
+            return call_value(callee, arguments, kwargs, expr)
+        return call
+    
+    def _method_call(self, expr) -> Code:
+        """`obj.name(args)`: class and built-in type methods run straight from their method tables."""
+        interp = self.interp
+        receiver_code = self.compile_expr(expr.callee.object)
+        name_tok = expr.callee.name
+        name = name_tok.lexeme
+        arg_codes = [self.compile_expr(a) for a in expr.arguments]
+        kwarg_codes = [(kw.lexeme, self.compile_expr(v)) for kw, v in expr.keyword_arguments]
+        get_member = interp._get_member
+        call_value = interp._call_value
+        call_method = interp._call_method
+        call_native = interp._call_native_method
+        
+        def method_call() -> Any:
+            interp._call_depth += 1
+            if interp._call_depth > interp._max_call_depth:
+                interp._call_depth = 0
+                interp._raise("Maximum recursion depth exceeded", expr.paren)
+            
+            receiver = receiver_code()
+            method = native = None
+            if receiver.__class__ is PulseInstance:
+                if name not in receiver.fields:
+                    method = receiver.klass.instance_methods.get(name)
+            else:
+                table = NATIVE_METHODS.get(receiver.__class__)
+                if table is not None:
+                    native = table.get(name)
+            if method is None and native is None:
+                callee = get_member(receiver, name_tok)
+            arguments = [arg() for arg in arg_codes]
+            kwargs = {kw: value() for kw, value in kwarg_codes}
+            if method is not None:
+                return call_method(method, receiver, arguments, kwargs, expr)
+            if native is not None:
+                return call_native(native, receiver, name_tok, arguments, kwargs, expr)
+            return call_value(callee, arguments, kwargs, expr)
+        return method_call
+    
+    def _ternary(self, expr) -> Code:
+        condition = self.compile_expr(expr.condition)
+        then_code = self.compile_expr(expr.then_expr)
+        else_code = self.compile_expr(expr.else_expr)
+        return lambda: then_code() if condition().is_truthy() else else_code()
+    
+    def _fstring(self, expr) -> Code:
+        parts = [self.compile_expr(p) for p in expr.parts]
+        stringify = self.interp._stringify
+        return lambda: PulseString("".join(stringify(part()) for part in parts))
+    
+    # Statements
+    def _expression_stmt(self, stmt) -> Code:
+        return self.compile_expr(stmt.expression)
+    
+    def _block_stmt(self, stmt) -> Code:
+        interp = self.interp
+        body = [self.compile_stmt(s) for s in stmt.statements]
+        layout = interp.scope_layouts.get(stmt)
+        
+        def block() -> Any:
+            previous = interp.environment
+            interp.environment = Environment(previous, layout)
+            try:
+                result = None
+                for s in body:
+                    result = s()
+                    if result.__class__ is Completion:
+                        break
+                return result
+            finally:
+                interp.environment = previous
+        return block
+    
+    def _if_stmt(self, stmt) -> Code:
+        branches = [(self.compile_expr(stmt.condition), self.compile_stmt(stmt.then_branch))]
+        for cond, branch in stmt.elif_branches:
+            branches.append((self.compile_expr(cond), self.compile_stmt(branch)))
+        else_code = self.compile_stmt(stmt.else_branch) if stmt.else_branch is not None else None
+        
+        def if_stmt() -> Any:
+            for condition, branch in branches:
+                if condition().is_truthy():
+                    return branch()
+            if else_code is not None:
+                return else_code()
+            return None
+        return if_stmt
+    
+    def _while_stmt(self, stmt) -> Code:
+        interp = self.interp
+        condition = self.compile_expr(stmt.condition)
+        layout = interp.scope_layouts.get(stmt.body)
+        
+        if not isinstance(stmt.body, statements.Block) or not interp._reusable_scope(stmt.body, layout):
+            body = self.compile_stmt(stmt.body)
+            
+            def while_stmt() -> Any:
+                while condition().is_truthy():
+                    outcome = body()
+                    if outcome.__class__ is Completion:
+                        if outcome is BREAK:
+                            break
+                        if outcome is not CONTINUE:
+                            return outcome
+                return None
+            return while_stmt
+        
+        body = [self.compile_stmt(s) for s in stmt.body.statements]
+        
+        def while_reusing_scope() -> Any:
+            previous = interp.environment
+            body_env = Environment(previous, layout)
+            while condition().is_truthy():
+                body_env.reset()
+                interp.environment = body_env
+                try:
+                    outcome = None
+                    for s in body:
+                        outcome = s()
+                        if outcome.__class__ is Completion:
+                            break
+                finally:
+                    interp.environment = previous
+                if outcome.__class__ is Completion:
+                    if outcome is BREAK:
+                        break
+                    if outcome is not CONTINUE:
+                        return outcome
+            return None
+        return while_reusing_scope
+    
+    def _for_stmt(self, stmt) -> Code:
+        interp = self.interp
+        iterable_code = self.compile_expr(stmt.iterable)
+        if isinstance(stmt.body, statements.Block):
+            body = [self.compile_stmt(s) for s in stmt.body.statements]
+        else:
+            body = [self.compile_stmt(stmt.body)]
+        names = stmt.vars
+        var_name = stmt.var.lexeme
+        layout = interp.scope_layouts.get(stmt)
+        reuse = interp._reusable_scope(stmt, layout)
+        var_slot = layout.get(var_name) if layout is not None and names is None else None
+        rebind_only = var_slot is not None and len(layout) == 1
+        
+        def for_stmt() -> Any:
+            items = interp._for_items(iterable_code())
+            previous = interp.environment
+            loop_env = Environment(previous, layout)
+            for value in items:
+                if not reuse:
+                    loop_env = Environment(previous, layout)
+                elif not rebind_only or loop_env.values:
+                    loop_env.reset()
+                interp.environment = loop_env
+                try:
+                    if var_slot is not None:
+                        loop_env.slots[var_slot] = value
+                    elif names is not None:
+                        interp._bind_loop_vars(loop_env, names, value)
+                    else:
+                        loop_env.define(var_name, value)
+                    outcome = None
+                    for s in body:
+                        outcome = s()
+                        if outcome.__class__ is Completion:
+                            break
+                finally:
+                    interp.environment = previous
+                if outcome.__class__ is Completion:
+                    if outcome is BREAK:
+                        break
+                    if outcome is not CONTINUE:
+                        return outcome
+            return None
+        return for_stmt
+    
+    def _return_stmt(self, stmt) -> Code:
+        if stmt.value is None:
+            return partial(stmt.accept, self.interp)
+        
+        declaration = self.interp.tail_calls.get(stmt)
+        if declaration is not None:
+            return self._tail_call(stmt.value, declaration)
+        value_code = self.compile_expr(stmt.value)
+        
+        def return_stmt() -> Completion:
+            return Completion("return", value_code())
+        return return_stmt
+    
+    def _tail_call(self, expr, declaration) -> Code:
+        callee_code = self.compile_expr(expr.callee)
+        arg_codes = [self.compile_expr(a) for a in expr.arguments]
+        kwarg_codes = [(name.lexeme, self.compile_expr(v)) for name, v in expr.keyword_arguments]
+        tail_call = self.interp._tail_call
+        
+        def return_tail_call() -> Completion:
+            callee = callee_code()
+            arguments = [arg() for arg in arg_codes]
+            kwargs = {name: value() for name, value in kwarg_codes}
+            return tail_call(declaration, callee, arguments, kwargs, expr)
+        return return_tail_call
+    
+    def _function_stmt(self, stmt) -> Code:
+        interp = self.interp
+        self._compile_function(stmt)
+        name = stmt.name.lexeme
+        
+        def function_stmt() -> None:
+            interp.environment.define(name, PulseFunction(stmt, interp.environment))
+        return function_stmt
+
+class ClosureInterpreter(Interpreter):
+    """Interpreter that runs programs through compiled closures instead of visitor dispatch."""
+    def __init__(self, global_environment: Environment) -> None:
+        super().__init__(global_environment)
+        self.compiler = ClosureCompiler(self)
+    
+    def interpret(self, statements: list, source: str) -> Any:
+        self.source = source
+        
+        result = None
+        for code in self.compiler.compile_program(statements):
+            result = code()
+        return result
+    
+    def execute(self, stmt) -> Any:
+        return self.compiler.compile_stmt(stmt)()
+    
+    def evaluate(self, expr) -> Any:
+        return self.compiler.compile_expr(expr)()
@@ -16,9 +16,17 @@ by searching through enclosing environments when necessary, and allows
 new scopes to be created and discarded as execution enters and exits
 blocks.
 
+Scopes that the resolver has analysed carry a layout (name -> slot index) and
+store their bindings in a flat list of slots, so resolved reads and writes are
+plain indexed list accesses. Names the resolver cannot see (the global scope,
+the REPL, imported module files, and dynamic definitions such as unpacking)
+fall back to a per-environment dict, which is only allocated on first use.
+
 This module primarily provides:
 - The Environment class, which stores variable bindings in a scoped manner.
 - Methods for defining, retrieving, and updating variables.
+- Slot-indexed access (`get_slot`/`assign_slot`) for resolved locals.
+- In-place reset, so loops can rebind one environment instead of allocating one per iteration.
 - Support for nested environments to model lexical scope.
 - Error handling for undefined variables and invalid assignments.
 
@@ -26,6 +34,7 @@ The environment system will be used by the interpreter to manage state
 during execution of a Pulse program.
 """
 
+from types import MappingProxyType
 from typing import Any, Union
 from src.tokens import Token
 from src.runtime import PulseRuntimeException
@@ -35,51 +44,99 @@ _NameArg = Union[str, Token]
 def _key(name) -> str:
     return name.lexeme if isinstance(name, Token) else name
 
+class _Unset:
+    """Marker stored in slots that are declared but not yet bound."""
+    __slots__ = ()
+    
+    def __repr__(self) -> str:
+        return "<unset>"
+
+UNSET = _Unset()
+
+# Shared, read-only stand-ins for environments that have not needed them yet
+_NO_VALUES = MappingProxyType({})
+_NO_LAYOUT = MappingProxyType({})
+_NO_SLOTS = ()
+
+# Cached rows of UNSET, used to clear a slot list in place
+_UNSET_ROWS: dict[int, tuple] = {}
+
+def _unset_row(size: int) -> tuple:
+    row = _UNSET_ROWS.get(size)
+    if row is None:
+        row = _UNSET_ROWS[size] = (UNSET,) * size
+    return row
+
 class Environment:
-    def __init__(self, enclosing=None):
-        self.values = {}
+    def __init__(self, enclosing=None, layout=None):
         self.enclosing = enclosing
+        if layout is not None:
+            self.layout = layout
+            self.slots = [UNSET] * len(layout) if layout else _NO_SLOTS
+            self.values = _NO_VALUES
+        else:
+            self.layout = _NO_LAYOUT
+            self.slots = []
+            self.values = {}
     
     def define(self, name, value):
         key = _key(name)
         
+        slot = self.layout.get(key)
+        if slot is not None:
+            if self.slots[slot] is not UNSET:
+                raise PulseRuntimeException(
+                    PulseRuntimeError(f"Variable '{key}' already defined.")
+                )
+            self.slots[slot] = value
+            return
+        
         if key in self.values:
             raise PulseRuntimeException(
                 PulseRuntimeError(f"Variable '{key}' already defined.")
             )
+        if self.values is _NO_VALUES:
+            self.values = {}
         self.values[key] = value
     
+    def reset(self):
+        """Unbind every name, so a loop can reuse this environment for its next iteration."""
+        if self.slots:
+            self.slots[:] = _unset_row(len(self.slots))
+        if self.values:
+            self.values = {} if self.layout is _NO_LAYOUT else _NO_VALUES
+    
     def define_many(self, funcs):
         for name, value in funcs:
             self.define(name, value)
     
-    def get(self, name):
-        key = _key(name)
-        
-        if key in self.values:
-            return self.values[key]
-        
-        if self.enclosing is not None:
-            return self.enclosing.get(name)
-        
+    def _owner(self, key: str):
+        """Return (environment, slot) of the nearest binding of `key`; slot is None for dict bindings."""
+        env = self
+        while env is not None:
+            slot = env.layout.get(key)
+            if slot is not None and env.slots[slot] is not UNSET:
+                return env, slot
+            if key in env.values:
+                return env, None
+            env = env.enclosing
         raise PulseRuntimeException(
             PulseRuntimeError(f"Undefined variable '{key}'")
         )
     
+    def get(self, name):
+        env, slot = self._owner(_key(name))
+        if slot is not None:
+            return env.slots[slot]
+        return env.values[_key(name)]
+    
     def assign(self, name, value):
         key = _key(name)
-        
-        if key in self.values:
-            self.values[key] = value
-            return
-        
-        if self.enclosing is not None:
-            self.enclosing.assign(name, value)
-            return
-        
-        raise PulseRuntimeException(
-            PulseRuntimeError(f"Undefined variable '{key}'")
-        )
+        env, slot = self._owner(key)
+        if slot is not None:
+            env.slots[slot] = value
+        else:
+            env.values[key] = value
     
     def ancestor(self, distance):
         env = self
@@ -90,27 +147,54 @@ class Environment:
         return env
     
     def get_at(self, distance, name):
-        key = name.lexeme if hasattr(name, "lexeme") else name
-        return self.ancestor(distance).values[_key(name)]
+        env = self.ancestor(distance)
+        key = _key(name)
+        slot = env.layout.get(key)
+        if slot is not None:
+            value = env.slots[slot]
+            if value is UNSET:
+                raise KeyError(key)
+            return value
+        return env.values[key]
     
     def assign_at(self, distance, name, value):
-        key = name.lexeme if hasattr(name, "lexeme") else name
-        self.ancestor(distance).values[_key(name)] = value
+        env = self.ancestor(distance)
+        key = _key(name)
+        slot = env.layout.get(key)
+        if slot is not None:
+            env.slots[slot] = value
+            return
+        if env.values is _NO_VALUES:
+            env.values = {}
+        env.values[key] = value
+    
+    def get_slot(self, distance, slot):
+        env = self
+        for _ in range(distance):
+            env = env.enclosing
+        value = env.slots[slot]
+        if value is UNSET:
+            raise PulseRuntimeException(
+                PulseRuntimeError("Undefined variable")
+            )
+        return value
+    
+    def assign_slot(self, distance, slot, value):
+        env = self
+        for _ in range(distance):
+            env = env.enclosing
+        env.slots[slot] = value
     
     def has(self, name: str) -> bool:
-        if name in self.values:
-            return True
-        if self.enclosing is not None:
-            return self.enclosing.has(name)
-        return False
+        try:
+            self._owner(name)
+        except PulseRuntimeException:
+            return False
+        return True
     
     def delete(self, name: str) -> None:
-        if name in self.values:
-            del self.values[name]
-            return
-        if self.enclosing is not None:
-            self.enclosing.delete(name)
-            return
-        raise PulseRuntimeException(
-            PulseRuntimeError(f"Undefined variable '{name}'")
-        )
\ No newline at end of file
+        env, slot = self._owner(name)
+        if slot is not None:
+            env.slots[slot] = UNSET
+        else:
+            del env.values[name]
@@ -9,9 +9,13 @@ code, managing parameter binding, closure environments, and return value handlin
 PulseNativeFunction wraps Python-level built-in functions exposed to the Pulse
 runtime, allowing the interpreter to call them uniformly alongside user-defined
 functions.
+
+NativeMethod and PulseBoundMethod represent the methods of built-in types such
+as lists and strings, unbound in their type's method table and bound to a
+receiver when read as a value.
 """
 
-from src.environment import Environment
+from src.environment import Environment, UNSET
 from src.error import PulseRuntimeError
 import src.runtime as runtime
 from src.values import PulseNull, PulseList
@@ -27,84 +31,92 @@ class PulseFunction:
         return len(self.declaration.params)
     
     def call(self, interpreter, arguments, keyword_arguments=None):
-        if keyword_arguments is None:
-            keyword_arguments = {}
+        return self.invoke(interpreter, self.bound_instance, arguments, keyword_arguments)
+    
+    def invoke(self, interpreter, instance, arguments, keyword_arguments=None):
+        """Run the function with `instance` as `self`, without creating a bound copy first."""
+        environment = self.make_environment(interpreter, arguments, keyword_arguments, instance)
         
-        params = self.declaration.params
-        defaults = getattr(self.declaration, "defaults", [None] * len(params))
-        vararg = getattr(self.declaration, "vararg", None)
-        callable_params = [p for p in params if p.lexeme != "self"]
-        callable_defaults = [
-            defaults[i] for i, p in enumerate(params) if p.lexeme != "self"
-        ]
-        
-        if vararg is not None:
-            n = len(callable_params)
-            regular_args = arguments[:n]
-            extra_args = arguments[n:]
-        else:
-            if len(arguments) > len(callable_params):
-                raise runtime.PulseRuntimeException(
-                    PulseRuntimeError(f"Expected at most {len(callable_params)} arguments but got {len(arguments)}")
-                )
-            regular_args = arguments
-            extra_args = []
+        previous = interpreter.environment
+        interpreter.environment = environment
         
-        bound = {}
-        for i, param in enumerate(callable_params):
-            if i < len(regular_args):
-                bound[param.lexeme] = regular_args[i]
+        try:
+            statements = self.declaration.body.statements
+            outcome = interpreter._execute_statements(statements)
+            # A self-recursive `return f(...)` reruns the body instead of nesting a call
+            while outcome.__class__ is runtime.Completion and outcome.kind == "tail":
+                interpreter.environment = outcome.value
+                outcome = interpreter._execute_statements(statements)
+        finally:
+            interpreter.environment = previous
         
-        params_names = {p.lexeme for p in callable_params}
-        for key, value in keyword_arguments.items():
-            if key not in params_names:
-                raise runtime.PulseRuntimeException(
-                    PulseRuntimeError(f"Unexpected keyword argument '{key}'")
-                )           
-            if key in bound:
-                raise runtime.PulseRuntimeException(
-                    PulseRuntimeError(f"Multiple values for argument '{key}'")
-                )
-            bound[key] = value
+        if self.declaration.is_method and self.declaration.name.lexeme == "__init__":
+            return instance
+        if outcome.__class__ is runtime.Completion:
+            return outcome.value
+        return PulseNull()
+    
+    def make_environment(self, interpreter, arguments, keyword_arguments=None, instance=None) -> Environment:
+        """Bind call arguments to parameters in a fresh environment enclosed by the closure."""
+        signature = interpreter.signatures.get(self.declaration)
+        if signature is None:
+            signature = CallSignature(self.declaration, interpreter.scope_layouts.get(self.declaration))
+            interpreter.signatures[self.declaration] = signature
+        if instance is None:
+            instance = self.bound_instance
+        
+        count = signature.count
+        given = len(arguments)
+        if given > count and signature.vararg is None:
+            raise runtime.PulseRuntimeException(
+                PulseRuntimeError(f"Expected at most {count} arguments but got {given}")
+            )
+        
+        # Positional-only calls that fill every parameter bind the arguments as they are
+        if keyword_arguments:
+            values = signature.bind_keywords(arguments, keyword_arguments)
+        elif given == count:
+            values = arguments
+        elif given > count:
+            values = arguments[:count]
+        else:
+            values = arguments + [UNSET] * (count - given)
         
-        for param, default in zip(callable_params, callable_defaults):
-            if param.lexeme not in bound:
-                if default is not None:
-                    bound[param.lexeme] = interpreter.evaluate(default)
-                else:
-                    raise runtime.PulseRuntimeException(
-                        PulseRuntimeError(f"Missing required argument '{param.lexeme}'")
-                    )
+        if given < count or keyword_arguments:
+            defaults = signature.defaults
+            for i in range(count):
+                if values[i] is UNSET:
+                    if defaults[i] is None:
+                        raise runtime.PulseRuntimeException(
+                            PulseRuntimeError(f"Missing required argument '{signature.names[i]}'")
+                        )
+                    values[i] = interpreter.evaluate(defaults[i])
         
         # Create a new environment for the function
-        environment = Environment(enclosing=self.closure)
+        environment = Environment(self.closure, signature.layout)
+        bind_self = instance is not None and not self.declaration.is_static
         
-        if self.bound_instance is not None and not self.declaration.is_static:
-            environment.define("self", self.bound_instance)
+        if signature.slots is not None:
+            slots = environment.slots
+            if bind_self:
+                slots[signature.self_slot] = instance
+            for slot, value in zip(signature.slots, values):
+                slots[slot] = value
+            if signature.vararg is not None:
+                slots[signature.vararg_slot] = PulseList(arguments[count:])
+            return environment
+        
+        if bind_self:
+            environment.define("self", instance)
         
         # Bind parameters
-        for name, value in bound.items():
+        for name, value in zip(signature.names, values):
             environment.define(name, value)
         
-        if vararg is not None:
-            environment.define(vararg.lexeme, PulseList(extra_args))
-        
-        previous = interpreter.environment
-        interpreter.environment = environment
-        
-        try:
-            for stmt in self.declaration.body.statements:
-                interpreter.execute(stmt)
-            if self.declaration.is_method and self.declaration.name.lexeme == "__init__":
-                return self.bound_instance
-        except runtime.ReturnException as e:
-            if self.declaration.is_method and self.declaration.name.lexeme == "__init__":
-                return self.bound_instance
-            return e.value
-        finally:
-            interpreter.environment = previous
+        if signature.vararg is not None:
+            environment.define(signature.vararg, PulseList(arguments[count:]))
         
-        return PulseNull()
+        return environment
     
     def bind(self, instance):
         if self.declaration.is_static:
@@ -117,6 +129,58 @@ class PulseFunction:
     def __repr__(self):
         return f"<function {self.declaration.name.lexeme}>"
 
+class CallSignature:
+    """
+    The parameter list of a function declaration, prepared once per declaration
+    so that a call binds its arguments without rescanning the parameters.
+    
+    `slots` holds the layout slot of each callable parameter (every parameter
+    except `self`), or None when the scope has no layout and parameters must be
+    bound by name.
+    """
+    __slots__ = ("names", "count", "defaults", "index", "vararg", "layout", "slots", "self_slot", "vararg_slot")
+    
+    def __init__(self, declaration, layout=None) -> None:
+        params = declaration.params
+        defaults = getattr(declaration, "defaults", [None] * len(params))
+        vararg = getattr(declaration, "vararg", None)
+        
+        self.names = [p.lexeme for p in params if p.lexeme != "self"]
+        self.count = len(self.names)
+        self.defaults = [defaults[i] for i, p in enumerate(params) if p.lexeme != "self"]
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.vararg = vararg.lexeme if vararg is not None else None
+        self.layout = layout
+        
+        self.slots = self.self_slot = self.vararg_slot = None
+        bound_names = self.names + ([self.vararg] if self.vararg is not None else [])
+        has_self = declaration.is_method and not declaration.is_static
+        if has_self:
+            bound_names.append("self")
+        # Duplicate names fall back to `define`, which reports them
+        if layout and len(set(bound_names)) == len(bound_names) and all(n in layout for n in bound_names):
+            self.slots = [layout[name] for name in self.names]
+            self.self_slot = layout["self"] if has_self else None
+            self.vararg_slot = layout[self.vararg] if self.vararg is not None else None
+    
+    def bind_keywords(self, arguments: list, keyword_arguments: dict) -> list:
+        """Place positional and keyword arguments by parameter index; unfilled entries are UNSET."""
+        count = self.count
+        values = arguments[:count]
+        values.extend([UNSET] * (count - len(values)))
+        for key, value in keyword_arguments.items():
+            i = self.index.get(key)
+            if i is None:
+                raise runtime.PulseRuntimeException(
+                    PulseRuntimeError(f"Unexpected keyword argument '{key}'")
+                )
+            if values[i] is not UNSET:
+                raise runtime.PulseRuntimeException(
+                    PulseRuntimeError(f"Multiple values for argument '{key}'")
+                )
+            values[i] = value
+        return values
+
 class PulseNativeFunction:
     def __init__(self, name, func):
         self.name = name
@@ -149,11 +213,44 @@ class PulseNativeMethod:
     def __repr__(self):
         return "<native method>"
 
+class NativeMethod:
+    """An unbound method of a built-in type: `func(interpreter, receiver, token, *args)`."""
+    __slots__ = ("name", "func", "label")
+    
+    def __init__(self, name: str, func, label: str = None) -> None:
+        self.name = name
+        self.func = func
+        self.label = label or f"<native fn {name}>"
+    
+    def __repr__(self) -> str:
+        return self.label
+
+class PulseBoundMethod:
+    """A NativeMethod bound to its receiver when a method is read as a value."""
+    __slots__ = ("method", "receiver", "token")
+    
+    def __init__(self, method: NativeMethod, receiver, token) -> None:
+        self.method = method
+        self.receiver = receiver
+        self.token = token
+    
+    def arity(self):
+        return 0
+    
+    def call(self, interpreter, arguments, keyword_arguments=None):
+        if keyword_arguments is None:
+            keyword_arguments = {}
+        return self.method.func(interpreter, self.receiver, self.token, *arguments, **keyword_arguments)
+    
+    def __repr__(self):
+        return self.method.label
+
 class PulseLambda:
-    def __init__(self, params, body_expr, closure) -> None:
+    def __init__(self, params, body_expr, closure, layout=None) -> None:
         self.params = params
         self.body_expr = body_expr
         self.closure = closure
+        self.layout = layout
     
     def call(self, interpreter, arguments: list, kwargs: dict):
         if len(arguments) != len(self.params):
@@ -164,7 +261,7 @@ class PulseLambda:
                 )
             )
         
-        env = Environment(enclosing=self.closure)
+        env = Environment(self.closure, self.layout)
         for param, arg in zip(self.params, arguments):
             env.define(param.lexeme, arg)
         
@@ -42,13 +42,13 @@ from __future__ import annotations
 import os
 from typing import Any, NoReturn, Optional
 from src.expressions import ExprVisitor
-from src.statements import StmtVisitor
+from src.statements import StmtVisitor, Block
 from src.environment import Environment
 from src.error import PulseRuntimeError
 import src.runtime as runtime
 from src.tokens import Token
-from src.function import PulseFunction, PulseNativeFunction, PulseNativeMethod, PulseLambda, BuiltinFunction
-from src.runtime import PulseClass, PulseInstance
+from src.function import PulseFunction, CallSignature, PulseNativeFunction, PulseLambda, BuiltinFunction, NativeMethod, PulseBoundMethod
+from src.runtime import PulseClass, PulseInstance, Completion, BREAK, CONTINUE
 from src.values import (
     PulseNumber, PulseString, PulseNull, PulseNamespace,
     PulseList, PulseBoolean, PulseDict, PulseRange,
@@ -59,12 +59,19 @@ import src.expressions as expressions
 from src.lexer import Lexer
 from src.parser import Parser
 from src.native import find_module, read_file
+from src.operators import BINARY_DISPATCH, find_binary
+from src.methods import NATIVE_METHODS, TENSOR_PROPERTIES
 
 class Interpreter(ExprVisitor, StmtVisitor):
     def __init__(self, global_environment: Environment) -> None:
         self.environment = global_environment
         self.globals = global_environment
         self.locals: dict[Any, int] = {}
+        self.local_slots: dict[Any, int] = {}
+        self.scope_layouts: dict[Any, dict[str, int]] = {}
+        self.signatures: dict[Any, CallSignature] = {}
+        self.captured_scopes: set = set()
+        self.tail_calls: dict[Any, Any] = {}
         self.source: str = ""
         self._call_depth = 0
         self._max_call_depth = 1000
@@ -125,6 +132,18 @@ class Interpreter(ExprVisitor, StmtVisitor):
     def resolve(self, expr, depth: int) -> None:
         self.locals[expr] = depth
     
+    def resolve_slot(self, expr, slot: int) -> None:
+        self.local_slots[expr] = slot
+    
+    def resolve_scope(self, node, layout: dict[str, int]) -> None:
+        self.scope_layouts[node] = layout
+    
+    def resolve_captured(self, node) -> None:
+        self.captured_scopes.add(node)
+    
+    def resolve_tail_call(self, stmt, declaration) -> None:
+        self.tail_calls[stmt] = declaration
+    
     # Error helpers
     def _raise(self, message: str, token: Token | None = None) -> NoReturn:
         raise runtime.PulseRuntimeException(
@@ -276,7 +295,7 @@ class Interpreter(ExprVisitor, StmtVisitor):
             for magic in ("__str__", "__repr__"):
                 method = val.klass.find_method(magic)
                 if method is not None:
-                    result = method.bind(val).call(self, [], {})
+                    result = method.invoke(self, val, [], {})
                     return repr(result) if result is not None else "null"
         if isinstance(val, str):
             return val
@@ -393,7 +412,7 @@ class Interpreter(ExprVisitor, StmtVisitor):
     
     def _bi_len(self, x: Any) -> PulseNumber:
         if isinstance(x, PulseList):
-            return PulseNumber(len(x.elements))        
+            return PulseNumber(len(x.elements))
         if isinstance(x, PulseString):
             return PulseNumber(len(x.value))
         if isinstance(x, PulseDict):
@@ -509,16 +528,22 @@ class Interpreter(ExprVisitor, StmtVisitor):
     
     def visit_block_stmt(self, stmt) -> Any:
         previous = self.environment
-        self.environment = Environment(enclosing=previous)
+        self.environment = Environment(previous, self.scope_layouts.get(stmt))
         
         try:
-            result = None
-            for s in stmt.statements:
-                result = self.execute(s)
-            return result
+            return self._execute_statements(stmt.statements)
         finally:
             self.environment = previous
     
+    def _execute_statements(self, statements: list) -> Any:
+        """Run statements in order; returns the last result, or the Completion that stopped them."""
+        result = None
+        for s in statements:
+            result = self.execute(s)
+            if result.__class__ is Completion:
+                break
+        return result
+    
     def visit_if_stmt(self, stmt) -> Any:
         if self._is_truthy(self.evaluate(stmt.condition)):
             return self.execute(stmt.then_branch)
@@ -532,65 +557,131 @@ class Interpreter(ExprVisitor, StmtVisitor):
         
         return None
     
-    def visit_while_stmt(self, stmt) -> None:
+    def visit_while_stmt(self, stmt) -> Any:
+        body = stmt.body
+        layout = self.scope_layouts.get(body)
+        if not isinstance(body, Block) or not self._reusable_scope(body, layout):
+            while self._is_truthy(self.evaluate(stmt.condition)):
+                outcome = self.execute(body)
+                if outcome.__class__ is Completion:
+                    if outcome is BREAK:
+                        break
+                    if outcome is not CONTINUE:
+                        return outcome
+            return None
+        
+        # One body environment, cleared between iterations
+        previous = self.environment
+        body_env = Environment(previous, layout)
         while self._is_truthy(self.evaluate(stmt.condition)):
+            body_env.reset()
+            self.environment = body_env
             try:
-                self.execute(stmt.body)
-            except runtime.BreakException:
-                break
-            except runtime.ContinueException:
-                continue
+                outcome = self._execute_statements(body.statements)
+            finally:
+                self.environment = previous
+            if outcome.__class__ is Completion:
+                if outcome is BREAK:
+                    break
+                if outcome is not CONTINUE:
+                    return outcome
+        return None
     
-    def visit_for_stmt(self, stmt) -> None:
-        iterable = self.evaluate(stmt.iterable)
-        
-        if isinstance(iterable, PulseList):
-            items = iterable.elements
-        elif isinstance(iterable, PulseDict):
-            items = list(iterable.entries.keys())
-        elif isinstance(iterable, PulseRange):
-            items = iterable.to_list()
-        elif isinstance(iterable, PulseString):
-            items = [PulseString(c) for c in iterable.value]
-        else:
-            self._raise_type(f"Object of type '{iterable.type_name()}' is not iterable")
+    def visit_for_stmt(self, stmt) -> Any:
+        items = self._for_items(self.evaluate(stmt.iterable))
         
         previous = self.environment
+        layout = self.scope_layouts.get(stmt)
+        body = stmt.body.statements if isinstance(stmt.body, Block) else [stmt.body]
+        reuse = self._reusable_scope(stmt, layout)
+        var_slot = layout.get(stmt.var.lexeme) if layout is not None and stmt.vars is None else None
+        # Only the loop variable lives here, so rebinding its slot is all a new iteration needs
+        rebind_only = var_slot is not None and len(layout) == 1
+        
+        loop_env = Environment(previous, layout)
         for value in items:
-            loop_env = Environment(enclosing=previous)
+            if not reuse:
+                loop_env = Environment(previous, layout)
+            elif not rebind_only or loop_env.values:
+                loop_env.reset()
             self.environment = loop_env
             
             try:
-                if stmt.vars is not None:
-                    if not isinstance(value, PulseList):
-                        self._raise(f"Cannot unpack non-list value in for loop")
-                    if len(value.elements) != len(stmt.vars):
-                        self._raise_value(
-                            f"Cannot unpack {len(value.elements)} values "
-                            f"into {len(stmt.vars)} variables"
-                        )
-                    for var, el in zip(stmt.vars, value.elements):
-                        loop_env.define(var.lexeme, el)
-                else:                
+                if var_slot is not None:
+                    loop_env.slots[var_slot] = value
+                elif stmt.vars is not None:
+                    self._bind_loop_vars(loop_env, stmt.vars, value)
+                else:
                     loop_env.define(stmt.var.lexeme, value)
                 
-                self.execute(stmt.body)
-            except runtime.BreakException:
-                break
-            except runtime.ContinueException:
-                continue
+                outcome = self._execute_statements(body)
             finally:
                 self.environment = previous
+            if outcome.__class__ is Completion:
+                if outcome is BREAK:
+                    break
+                if outcome is not CONTINUE:
+                    return outcome
+        return None
+    
+    def _reusable_scope(self, node, layout) -> bool:
+        """Whether a loop may recycle the environment of `node` instead of allocating one per iteration."""
+        return layout is not None and node not in self.captured_scopes
+    
+    def _for_items(self, iterable: Any) -> list:
+        if isinstance(iterable, PulseList):
+            return iterable.elements
+        if isinstance(iterable, PulseDict):
+            return list(iterable.entries.keys())
+        if isinstance(iterable, PulseRange):
+            return iterable.to_list()
+        if isinstance(iterable, PulseString):
+            return [PulseString(c) for c in iterable.value]
+        self._raise_type(f"Object of type '{iterable.type_name()}' is not iterable")
+    
+    def _bind_loop_vars(self, loop_env: Environment, names: list, value: Any) -> None:
+        if not isinstance(value, PulseList):
+            self._raise(f"Cannot unpack non-list value in for loop")
+        if len(value.elements) != len(names):
+            self._raise_value(
+                f"Cannot unpack {len(value.elements)} values "
+                f"into {len(names)} variables"
+            )
+        for var, el in zip(names, value.elements):
+            loop_env.define(var.lexeme, el)
     
-    def visit_break_stmt(self, stmt) -> NoReturn:
-        raise runtime.BreakException()
+    def visit_break_stmt(self, stmt) -> Completion:
+        return BREAK
     
-    def visit_continue_stmt(self, stmt) -> NoReturn:
-        raise runtime.ContinueException()
+    def visit_continue_stmt(self, stmt) -> Completion:
+        return CONTINUE
     
-    def visit_return_stmt(self, stmt) -> NoReturn:
+    def visit_return_stmt(self, stmt) -> Completion:
+        declaration = self.tail_calls.get(stmt)
+        if declaration is not None:
+            call = stmt.value
+            callee = self.evaluate(call.callee)
+            arguments = [self.evaluate(arg) for arg in call.arguments]
+            kwargs = {name.lexeme: self.evaluate(value) for name, value in call.keyword_arguments}
+            return self._tail_call(declaration, callee, arguments, kwargs, call)
+        
         value = self.evaluate(stmt.value) if stmt.value is not None else PulseNull()
-        raise runtime.ReturnException(value)
+        return Completion("return", value)
+    
+    def _tail_call(self, declaration, callee: Any, arguments: list, kwargs: dict, expr) -> Completion:
+        """
+        Finish `return f(args)` inside `f`. When `f` is still the running function,
+        the new call's environment is returned for `PulseFunction.invoke` to rerun
+        the body in, so the call adds neither a Python frame nor call depth.
+        """
+        if callee.__class__ is PulseFunction and callee.declaration is declaration:
+            return Completion("tail", callee.make_environment(self, arguments, kwargs))
+        
+        self._call_depth += 1
+        if self._call_depth > self._max_call_depth:
+            self._call_depth = 0
+            self._raise("Maximum recursion depth exceeded", expr.paren)
+        return Completion("return", self._call_value(callee, arguments, kwargs, expr))
     
     def visit_function_stmt(self, stmt) -> None:
         func = PulseFunction(stmt, self.environment)
@@ -613,44 +704,54 @@ class Interpreter(ExprVisitor, StmtVisitor):
         self.environment.assign(stmt.name.lexeme, klass)
     
     def visit_try_stmt(self, stmt) -> Any:
-        result = None
+        if stmt.finally_block is None:
+            return self._try_body(stmt)
+        
         try:
-            self.execute(stmt.try_block)
-        except (runtime.BreakException,
-                runtime.ContinueException,
-                runtime.ReturnException):
+            result = self._try_body(stmt)
+        except BaseException:
+            # A break/continue/return in `finally` discards the pending exception
+            outcome = self.execute(stmt.finally_block)
+            if outcome.__class__ is Completion:
+                return outcome
             raise
         
-        except runtime.PulseException as exc:
-            handled = False
-            for exc_type_expr, var_token, block in stmt.except_blocks:
-                if exc_type_expr is None:
-                    match = True
-                else:
-                    exc_type = self.evaluate(exc_type_expr)
-                    if not isinstance(exc_type, type):
-                        self._raise("Exception type in 'except' must be a class")
-                    match = isinstance(exc, exc_type)
-                
-                if match:
-                    handled = True
-                    if var_token is not None:
-                        self.environment.define(var_token.lexeme, exc.message)
-                    result = self.execute(block)
-                    break
-            
-            if not handled:
-                raise
-        
-        else:
-            if stmt.else_block is not None:
-                result = self.execute(stmt.else_block)
+        outcome = self.execute(stmt.finally_block)
+        if outcome.__class__ is Completion:
+            return outcome
+        return result
+    
+    def _try_body(self, stmt) -> Any:
+        """Run the try block, then the matching except block or the else block."""
+        try:
+            outcome = self.execute(stmt.try_block)
         
-        finally:
-            if stmt.finally_block is not None:
-                self.execute(stmt.finally_block)
+        except runtime.PulseException as exc:
+            previous = self.environment
+            for index, (exc_type_expr, var_token, block) in enumerate(stmt.except_blocks):
+                self.environment = Environment(previous, self.scope_layouts.get((stmt, index)))
+                try:
+                    if exc_type_expr is None:
+                        match = True
+                    else:
+                        exc_type = self.evaluate(exc_type_expr)
+                        if not isinstance(exc_type, type):
+                            self._raise("Exception type in 'except' must be a class")
+                        match = isinstance(exc, exc_type)
+                    
+                    if match:
+                        if var_token is not None:
+                            self.environment.define(var_token.lexeme, exc.message)
+                        return self.execute(block)
+                finally:
+                    self.environment = previous
+            raise
         
-        return result
+        if outcome.__class__ is Completion:
+            return outcome
+        if stmt.else_block is not None:
+            return self.execute(stmt.else_block)
+        return None
     
     def visit_import_stmt(self, stmt) -> None:
         module_name = ".".join(t.lexeme for t in stmt.module_path)
@@ -719,12 +820,13 @@ class Interpreter(ExprVisitor, StmtVisitor):
     def visit_match_stmt(self, stmt) -> Any:
         subject = self.evaluate(stmt.subject)
         
-        for pattern, guard, body in stmt.cases:
+        for index, (pattern, guard, body) in enumerate(stmt.cases):
             bindings = {}
             if self._match_pattern(pattern, subject, bindings):
+                layout = self.scope_layouts.get((stmt, index))
                 if guard is not None:
                     prev = self.environment
-                    guard_env = Environment(enclosing=prev)
+                    guard_env = Environment(prev, layout)
                     for k, v in bindings.items():
                         guard_env.define(k, v)
                     self.environment = guard_env
@@ -736,7 +838,7 @@ class Interpreter(ExprVisitor, StmtVisitor):
                         continue
                 
                 prev = self.environment
-                case_env = Environment(enclosing=prev)
+                case_env = Environment(prev, layout)
                 for k, v in bindings.items():
                     case_env.define(k, v)
                 self.environment = case_env
@@ -792,6 +894,9 @@ class Interpreter(ExprVisitor, StmtVisitor):
     def visit_literal_expr(self, expr) -> Any:
         value = expr.value
         
+        # Already boxed by the optimizer
+        if isinstance(value, PulseValue):
+            return value
         if isinstance(value, bool):
             return PulseBoolean(value)
         if isinstance(value, (int, float)):
@@ -804,6 +909,9 @@ class Interpreter(ExprVisitor, StmtVisitor):
         return value
     
     def visit_tensor_expr(self, expr) -> PulseTensor:
+        # Materialized once by the optimizer as a shared read-only array
+        if isinstance(expr.value, np.ndarray):
+            return PulseTensor(expr.value)
         try:
             array = np.array(expr.value, dtype=float)
         except (ValueError, TypeError) as e:
@@ -818,6 +926,9 @@ class Interpreter(ExprVisitor, StmtVisitor):
         distance = self.locals.get(expr)
         try:
             if distance is not None:
+                slot = self.local_slots.get(expr)
+                if slot is not None:
+                    return self.environment.get_slot(distance, slot)
                 return self.environment.get_at(distance, name)
             return self.environment.get(name)
         except runtime.PulseRuntimeException:
@@ -829,7 +940,11 @@ class Interpreter(ExprVisitor, StmtVisitor):
         
         distance = self.locals.get(expr)
         if distance is not None:
-            self.environment.assign_at(distance, name, value)
+            slot = self.local_slots.get(expr)
+            if slot is not None:
+                self.environment.assign_slot(distance, slot, value)
+            else:
+                self.environment.assign_at(distance, name, value)
         else:
             if name in self.globals.values:
                 self.globals.assign(name, value)
@@ -842,144 +957,36 @@ class Interpreter(ExprVisitor, StmtVisitor):
         return self.evaluate(expr.expression)
     
     def visit_unary_expr(self, expr) -> Any:
-        right = self.evaluate(expr.right)
-        operator = expr.operator.lexeme
+        return self._unary_op(expr.operator, self.evaluate(expr.right))
+    
+    def _unary_op(self, tok: Token, right: Any) -> Any:
+        operator = tok.lexeme
         
         if operator == "-":
-            self._check_number(right, expr.operator, "Unary '-' operand")
+            self._check_number(right, tok, "Unary '-' operand")
             return PulseNumber(-right.value)
         
         if operator in ("not", "!"):
             return PulseBoolean(not self._is_truthy(right))
         
-        self._raise(f"Unknown unary operator '{operator}'", expr.operator)
+        self._raise(f"Unknown unary operator '{operator}'", tok)
     
     def visit_binary_expr(self, expr) -> Any:
         left = self.evaluate(expr.left)
         right = self.evaluate(expr.right)
-        operator = expr.operator.lexeme
         tok = expr.operator
-        
-        if isinstance(left, PulseTensor) or isinstance(right, PulseTensor):
-            if isinstance(left, PulseNumber) and isinstance(right, PulseTensor):
-                left, right = right, left
-            
-            if isinstance(left, PulseTensor) and isinstance(right, PulseNumber):
-                scalar = right.value
-                try:
-                    if operator == "+":
-                        return PulseTensor(left.array + scalar)
-                    if operator == "-":
-                        return PulseTensor(left.array - scalar)
-                    if operator == "*":
-                        return PulseTensor(left.array * scalar)
-                    if operator == "/":
-                        if scalar == 0:
-                            self._raise_zerodiv("Division by zero", tok)
-                        return PulseTensor(left.array / scalar)
-                    self._raise_type(f"Tensor does not support operator '{operator}' with scalar", tok)
-                except ValueError as e:
-                    self._raise_value(f"Tensor operation failed: {e}", tok)
-            
-            if not isinstance(left, PulseTensor) or not isinstance(right, PulseTensor):
-                self._raise_type(
-                    f"Both operands must be tensors, "
-                    f"got '{left.type_name()}' and '{right.type_name()}'",
-                    tok,
-                )
-            try:
-                if operator == "+":
-                    return PulseTensor(left.array + right.array)
-                if operator == "-":
-                    return PulseTensor(left.array - right.array)
-                if operator == "*":
-                    return PulseTensor(left.array * right.array)
-                if operator == "/":
-                    return PulseTensor(left.array / right.array)
-                if operator == "@":
-                    return PulseTensor(left.array @ right.array)
-                if operator == "==":
-                    return PulseBoolean(np.array_equal(left.array, right.array))
-                if operator == "!=":
-                    return PulseBoolean(not np.array_equal(left.array, right.array))
-                self._raise_type(f"Tensor does not support operator '{operator}'", tok)
-            except ValueError as e:
-                self._raise_value(f"Tensor operation failed: {e}", tok)
-        
-        if operator == "==":
-            return PulseBoolean(self._is_equal(left, right))
-        if operator == "!=":
-            return PulseBoolean(not self._is_equal(left, right))
-        
-        if operator == "in":
-            return PulseBoolean(self._contains(right, left, tok))
-        if operator == "not in":
-            return PulseBoolean(not self._contains(right, left, tok))
-        
-        if operator == "is":
-            return PulseBoolean(self._is_same(left, right))
-        if operator == "is not":
-            return PulseBoolean(not self._is_same(left, right))
-        
-        if operator == "+" and isinstance(left, PulseString) and isinstance(right, PulseString):
-            return PulseString(left.value + right.value)
-        
-        if operator == "+" and isinstance(left, PulseList) and isinstance(right, PulseList):
-            return PulseList(left.elements + right.elements)
-        
-        if operator in ("+", "-", "*", "/", "%", "//", "**", "<", "<=", ">", ">="):
-            if not isinstance(left, PulseNumber) or not isinstance(right, PulseNumber):
-                if operator == "+":
-                    self._raise_type(
-                        "'+' requires two numbers or two strings, "
-                        f"got '{left.type_name()}' and '{right.type_name()}'",
-                        tok,
-                    )
-                self._raise_type(
-                    f"'{operator}' requires two numbers, "
-                    f"got '{left.type_name()}' and '{right.type_name()}'",
-                    tok,
-                )
-            
-            lv, rv = left.value, right.value
-            
-            if operator == "+":
-                return PulseNumber(lv + rv)
-            if operator == "-":
-                return PulseNumber(lv - rv)
-            if operator == "*":
-                return PulseNumber(lv * rv)
-            
-            if operator == "/":
-                if rv == 0:
-                    self._raise_zerodiv("Division by zero", tok)
-                return PulseNumber(lv / rv)
-            
-            if operator == "%":
-                if rv == 0:
-                    self._raise_zerodiv("Modulo by zero", tok)
-                return PulseNumber(lv % rv)
-            
-            if operator == "//":
-                if rv == 0:
-                    self._raise_zerodiv("Integer division by zero", tok)
-                return PulseNumber(int(lv // rv))
-            
-            if operator == "**":
-                if not isinstance(left, PulseNumber) or not isinstance(right, PulseNumber):
-                    self._raise_type(f"'**' requires two numbers, got '{left.type_name()}' and '{right.type_name()}'", tok)
-                return PulseNumber(left.value ** right.value)
-            
-            if operator == "<":
-                return PulseBoolean(lv < rv)
-            if operator == "<=":
-                return PulseBoolean(lv <= rv)
-            if operator == ">":
-                return PulseBoolean(lv > rv)
-            if operator == ">=":
-                return PulseBoolean(lv >= rv)
-        
-        self._raise(f"Unknown binary operator '{operator}'", tok)
+        handler = BINARY_DISPATCH.get((tok.lexeme, left.__class__, right.__class__))
+        if handler is not None:
+            return handler(self, tok, left, right)
+        return self._binary_op(tok, left, right)
+    
+    def _binary_op(self, tok: Token, left: Any, right: Any) -> Any:
+        handler = BINARY_DISPATCH.get((tok.lexeme, left.__class__, right.__class__))
+        if handler is None:
+            handler = find_binary(tok.lexeme, left.__class__, right.__class__)
+            if handler is None:
+                self._raise(f"Unknown binary operator '{tok.lexeme}'", tok)
+        return handler(self, tok, left, right)
     
     def visit_logical_expr(self, expr) -> Any:
         left = self.evaluate(expr.left)
@@ -1002,9 +1009,9 @@ class Interpreter(ExprVisitor, StmtVisitor):
         return PulseDict(entries)
     
     def visit_index_expr(self, expr) -> Any:
-        obj = self.evaluate(expr.object)
-        index = self.evaluate(expr.index)
-        
+        return self._get_index(self.evaluate(expr.object), self.evaluate(expr.index))
+    
+    def _get_index(self, obj: Any, index: Any) -> Any:
         if isinstance(obj, PulseList):
             self._check_number(index, None, "List index")
             idx = int(index.value)
@@ -1041,7 +1048,9 @@ class Interpreter(ExprVisitor, StmtVisitor):
         obj = self.evaluate(expr.object)
         index = self.evaluate(expr.index)
         value = self.evaluate(expr.value)
-        
+        return self._set_index(obj, index, value)
+    
+    def _set_index(self, obj: Any, index: Any, value: Any) -> Any:
         if isinstance(obj, PulseList):
             self._check_number(index, None, "List index")
             idx = int(index.value)
@@ -1103,19 +1112,21 @@ class Interpreter(ExprVisitor, StmtVisitor):
     def visit_setmember_expr(self, expr) -> Any:
         obj = self.evaluate(expr.object)
         value = self.evaluate(expr.value)
-        
+        return self._set_member(obj, expr.name, value)
+    
+    def _set_member(self, obj: Any, name_tok: Token, value: Any) -> Any:
         if isinstance(obj, PulseInstance):
-            obj.set(expr.name.lexeme, value)
+            obj.set(name_tok.lexeme, value)
             return value
         
         if isinstance(obj, PulseClass):
-            obj.class_vars[expr.name.lexeme] = value
+            obj.set_class_var(name_tok.lexeme, value)
             return value
         
         self._raise_attr(
-            f"Cannot assign member '{expr.name.lexeme}' on "
+            f"Cannot assign member '{name_tok.lexeme}' on "
             f"object of type '{obj.type_name()}'",
-            expr.name,
+            name_tok,
         )
     
     def visit_call_expr(self, expr) -> Any:
@@ -1124,13 +1135,65 @@ class Interpreter(ExprVisitor, StmtVisitor):
             self._call_depth = 0
             self._raise("Maximum recursion depth exceeded", expr.paren)
         
-        callee = self.evaluate(expr.callee)
+        # `obj.method(args)` calls the method found in the class or built-in type
+        # method table directly, without creating a bound method first
+        method = native = None
+        callee_expr = expr.callee
+        if callee_expr.__class__ is expressions.MemberAccess:
+            receiver = self.evaluate(callee_expr.object)
+            name = callee_expr.name.lexeme
+            if receiver.__class__ is PulseInstance:
+                if name not in receiver.fields:
+                    method = receiver.klass.instance_methods.get(name)
+            else:
+                table = NATIVE_METHODS.get(receiver.__class__)
+                if table is not None:
+                    native = table.get(name)
+            if method is None and native is None:
+                callee = self._get_member(receiver, callee_expr.name)
+        else:
+            callee = self.evaluate(callee_expr)
+        
         arguments = [self.evaluate(arg) for arg in expr.arguments]
         
         kwargs = {
             name.lexeme: self.evaluate(value)
             for name, value in expr.keyword_arguments
         }
+        if method is not None:
+            return self._call_method(method, receiver, arguments, kwargs, expr)
+        if native is not None:
+            return self._call_native_method(native, receiver, callee_expr.name, arguments, kwargs, expr)
+        return self._call_value(callee, arguments, kwargs, expr)
+    
+    def _call_method(self, method: PulseFunction, instance: PulseInstance, arguments: list, kwargs: dict, expr) -> Any:
+        """Run a user-defined method on `instance`. Balances the `_call_depth` increment made by the caller."""
+        PulseRuntimeError.push_stack(method.declaration.name.lexeme, expr.paren.line)
+        try:
+            return method.invoke(self, instance, arguments, kwargs)
+        except RecursionError:
+            self._call_depth = 0
+            self._raise("Maximum recursion depth exceeded", expr.paren)
+        finally:
+            PulseRuntimeError.pop_stack()
+            self._call_depth -= 1
+    
+    def _call_native_method(self, method: NativeMethod, receiver: Any, token: Token, arguments: list, kwargs: dict, expr) -> Any:
+        """Run a built-in type's method on `receiver`. Balances the `_call_depth` increment made by the caller."""
+        PulseRuntimeError.push_stack(method.label, expr.paren.line)
+        try:
+            return method.func(self, receiver, token, *arguments, **kwargs)
+        except RecursionError:
+            self._call_depth = 0
+            self._raise("Maximum recursion depth exceeded", expr.paren)
+        finally:
+            PulseRuntimeError.pop_stack()
+            self._call_depth -= 1
+    
+    def _call_value(self, callee: Any, arguments: list, kwargs: dict, expr) -> Any:
+        """Invoke an already-evaluated callee. Balances the `_call_depth` increment made by the caller."""
+        if callee.__class__ is PulseBoundMethod:
+            return self._call_native_method(callee.method, callee.receiver, callee.token, arguments, kwargs, expr)
         
         if isinstance(callee, BuiltinFunction):
             try:
@@ -1170,32 +1233,43 @@ class Interpreter(ExprVisitor, StmtVisitor):
             self._call_depth -= 1
     
     def visit_memberaccess_expr(self, expr) -> Any:
-        obj = self.evaluate(expr.object)
-        name = expr.name.lexeme
+        return self._get_member(self.evaluate(expr.object), expr.name)
+    
+    def _get_member(self, obj: Any, name_tok: Token) -> Any:
+        name = name_tok.lexeme
+        
+        table = NATIVE_METHODS.get(obj.__class__)
+        if table is not None:
+            method = table.get(name)
+            if method is not None:
+                return PulseBoundMethod(method, obj, name_tok)
         
         if isinstance(obj, PulseNull):
-            self._raise_attr("Cannot access member of null", expr.name)
+            self._raise_attr("Cannot access member of null", name_tok)
         
         if isinstance(obj, PulseList):
-            return self._list_method(obj, name, expr.name)
+            self._raise_attr(f"List has no method '{name}'", name_tok)
         
         if isinstance(obj, PulseString):
-            return self._string_method(obj, name, expr.name)
+            self._raise_attr(f"String has no method '{name}'", name_tok)
         
         if isinstance(obj, PulseDict):
-            return self._dict_method(obj, name, expr.name)
+            self._raise_attr(f"Dict has no method '{name}'", name_tok)
         
         if isinstance(obj, PulseTensor):
-            return self._tensor_property(obj, name, expr.name)
+            prop = TENSOR_PROPERTIES.get(name)
+            if prop is None:
+                self._raise_attr(f"Tensor has no property '{name}'", name_tok)
+            return prop(obj)
         
         if isinstance(obj, PulseModel):
             if not hasattr(obj, 'methods') or name not in obj.methods:
-                self._raise_attr(f"Model '{obj.model_name}' has no method '{name}'", expr.name)
+                self._raise_attr(f"Model '{obj.model_name}' has no method '{name}'", name_tok)
             return obj.methods[name]
         
         if isinstance(obj, PulseDataset):
             if name not in obj.methods:
-                self._raise_attr(f"Dataset has no method '{name}'", expr.name)
+                self._raise_attr(f"Dataset has no method '{name}'", name_tok)
             return obj.methods[name]
         
         if isinstance(obj, PulseInstance):
@@ -1207,17 +1281,17 @@ class Interpreter(ExprVisitor, StmtVisitor):
         if isinstance(obj, PulseModule):
             val = obj.get(name)
             if val is None:
-                self._raise_attr(f"Module '{obj.name}' has no member '{name}'", expr.name)
+                self._raise_attr(f"Module '{obj.name}' has no member '{name}'", name_tok)
             return val
         
         if isinstance(obj, PulseNamespace):
             if name not in obj.members:
-                self._raise_attr(f"'{obj.name}' has no member '{name}'", expr.name)
+                self._raise_attr(f"'{obj.name}' has no member '{name}'", name_tok)
             return obj.members[name]
         
         self._raise_attr(
             f"Object of type '{obj.type_name()}' does not support member access",
-            expr.name,
+            name_tok,
         )
     
     def visit_fstring_expr(self, expr) -> PulseString:
@@ -1241,7 +1315,7 @@ class Interpreter(ExprVisitor, StmtVisitor):
             PulseRuntimeError.pop_stack()
     
     def visit_lambda_expr(self, expression) -> Any:
-        return PulseLambda(expression.params, expression.body, self.environment)
+        return PulseLambda(expression.params, expression.body, self.environment, self.scope_layouts.get(expression))
     
     def visit_unpack_expr(self, expr) -> Any:
         value = self.evaluate(expr.value)
@@ -1268,22 +1342,19 @@ class Interpreter(ExprVisitor, StmtVisitor):
         return value
     
     def visit_listcomp_expr(self, expr) -> PulseList:
-        iterable = self.evaluate(expr.iterable)
-        
-        if isinstance(iterable, PulseList):
-            items = iterable.elements
-        elif isinstance(iterable, PulseRange):
-            items = iterable.to_list()
-        elif isinstance(iterable, PulseString):
-            items = [PulseString(c) for c in iterable.value]
-        else:
-            self._raise_type(f"List comprehension iterable must be iterable, got '{iterable.type_name()}'")
+        items = self._comprehension_items(self.evaluate(expr.iterable))
         
         results = []
         previous = self.environment
+        layout = self.scope_layouts.get(expr)
+        var_slot = layout.get(expr.var.lexeme) if self._reusable_scope(expr, layout) else None
+        loop_env = Environment(previous, layout)
         for item in items:
-            loop_env = Environment(enclosing=previous)
-            loop_env.define(expr.var.lexeme, item)
+            if var_slot is not None:
+                loop_env.slots[var_slot] = item
+            else:
+                loop_env = Environment(previous, layout)
+                loop_env.define(expr.var.lexeme, item)
             self.environment = loop_env
             try:
                 if expr.condition is not None:
@@ -1295,328 +1366,16 @@ class Interpreter(ExprVisitor, StmtVisitor):
         
         return PulseList(results)
     
+    def _comprehension_items(self, iterable: Any) -> list:
+        if isinstance(iterable, PulseList):
+            return iterable.elements
+        if isinstance(iterable, PulseRange):
+            return iterable.to_list()
+        if isinstance(iterable, PulseString):
+            return [PulseString(c) for c in iterable.value]
+        self._raise_type(f"List comprehension iterable must be iterable, got '{iterable.type_name()}'")
+    
     def visit_ternary_expr(self, expr) -> Any:
         if self._is_truthy(self.evaluate(expr.condition)):
             return self.evaluate(expr.then_expr)
-        return self.evaluate(expr.else_expr)
-    
-    # Built-in method dispatch
-    def _list_method(self, obj: PulseList, name: str, token: Token) -> PulseNativeFunction:
-        if name == "append":
-            def _append(val: Any) -> PulseNull:
-                obj.elements.append(val)
-                return PulseNull()
-            return PulseNativeFunction("append", _append)
-        
-        if name == "pop":
-            def _pop(index: Any = None) -> Any:
-                if not obj.elements:
-                    self._raise_index("pop() called on empty list")
-                if index is None:
-                    return obj.elements.pop()
-                self._check_number(index, token, "pop() index")
-                idx = int(index.value)
-                if idx < -len(obj.elements) or idx >= len(obj.elements):
-                    self._raise_index(f"pop() index {idx} out of range")
-                return obj.elements.pop(idx)
-            return PulseNativeFunction("pop", _pop)
-        
-        if name == "slice":
-            def _slice(start: Any, end: Any) -> PulseList:
-                self._check_number(start, token, "slice() start")
-                self._check_number(end, token, "slice() end")
-                return PulseList(obj.elements[int(start.value):int(end.value)])
-            return PulseNativeFunction("slice", _slice)
-        
-        if name == "contains":
-            def _contains(val: Any) -> PulseBoolean:
-                return PulseBoolean(any(self._is_equal(el, val) for el in obj.elements))
-            return PulseNativeFunction("contains", _contains)
-        
-        if name == "length":
-            return PulseNativeFunction("length", lambda: PulseNumber(len(obj.elements)))
-        
-        if name == "reverse":
-            def _reverse() -> PulseNull:
-                obj.elements.reverse()
-                return PulseNull()
-            return PulseNativeFunction("reverse", _reverse)
-        
-        if name == "clear":
-            def _clear() -> PulseNull:
-                obj.elements.clear()
-                return PulseNull()
-            return PulseNativeFunction("clear", _clear)
-        
-        if name == "sort":
-            def _sort(key=None, reverse=None) -> PulseNull:
-                rev = False
-                if reverse is not None:
-                    if not isinstance(reverse, PulseBoolean):
-                        self._raise_type("sort() 'reverse' must be a boolean", token)
-                    rev = reverse.value
-                
-                try:
-                    if key is None:
-                        def default_key(el):
-                            if isinstance(el, PulseNumber):
-                                return el.value
-                            if isinstance(el, PulseString):
-                                return el.value
-                            self._raise_type(f"sort() cannot compare values of type '{el.type_name()}'", token)
-                        obj.elements.sort(key=default_key, reverse=rev)
-                    else:
-                        if not callable(getattr(key, "call", None)):
-                            self._raise_type("sort() key must be a callable", token)
-                        def pulse_key(el):
-                            result = key.call(self, [el], {})
-                            if isinstance(result, PulseNumber):
-                                return result.value
-                            if isinstance(result, PulseString):
-                                return result.value
-                            self._raise_type(f"sort() key function must return a number or string", token)
-                        obj.elements.sort(key=pulse_key, reverse=rev)
-                except PulseRuntimeError:
-                    raise
-                
-                return PulseNull()
-            return PulseNativeFunction("sort", _sort)
-        
-        if name == "map":
-            def _map(fn: Any) -> PulseList:
-                if not callable(getattr(fn, "call", None)):
-                    self._raise_type("map() argument must be a callable", token)
-                return PulseList([fn.call(self, [el], {}) for el in obj.elements])
-            return PulseNativeFunction("map", _map)
-        
-        if name == "filter":
-            def _filter(fn: Any) -> PulseList:
-                if not callable(getattr(fn, "call", None)):
-                    self._raise_type("filter() argument must be a callable", token)
-                return PulseList([
-                    el for el in obj.elements
-                    if self._is_truthy(fn.call(self, [el], {}))
-                ])
-            return PulseNativeFunction("filter", _filter)
-        
-        if name == "index":
-            def _index(val: Any, start: Any = None) -> PulseNumber:
-                s = int(start.value) if start is not None else 0
-                for i, el in enumerate(obj.elements[s:], s):
-                    if self._is_equal(el, val):
-                        return PulseNumber(i)
-                self._raise_value(f"Value not found in list", token)
-            return PulseNativeFunction("index", _index)
-        
-        if name == "find":
-            def _find(val: Any, start: Any = None) -> PulseNumber:
-                s = int(start.value) if start is not None else 0
-                for i, el in enumerate(obj.elements[s:], s):
-                    if self._is_equal(el, val):
-                        return PulseNumber(i)
-                return PulseNumber(-1)
-            return PulseNativeFunction("find", _find)
-        
-        if name == "insert":
-            def _insert(index: Any, val: Any) -> PulseNull:
-                self._check_number(index, token, "insert() index")
-                idx = int(index.value)
-                obj.elements.insert(idx, val)
-                return PulseNull()
-            return PulseNativeFunction("insert", _insert)
-        
-        if name == "extend":
-            def _extend(other: Any) -> PulseNull:
-                if isinstance(other, PulseList):
-                    obj.elements.extend(other.elements)
-                elif isinstance(other, PulseRange):
-                    obj.elements.extend(other.to_list())
-                else:
-                    self._raise_type(f"extend() argument must be a list or range, got '{other.type_name()}'", token)
-                return PulseNull()
-            return PulseNativeFunction("extend", _extend)
-        
-        if name == "count":
-            def _count(val: Any) -> PulseNumber:
-                return PulseNumber(sum(1 for el in obj.elements if self._is_equal(el, val)))
-            return PulseNativeFunction("count", _count)
-        
-        self._raise_attr(f"List has no method '{name}'", token)
-    
-    def _string_method(self, obj: PulseString, name: str, token: Token) -> PulseNativeFunction:
-        if name == "upper":
-            return PulseNativeFunction("upper", lambda: PulseString(obj.value.upper()))
-        
-        if name == "lower":
-            return PulseNativeFunction("lower", lambda: PulseString(obj.value.lower()))
-        
-        if name == "trim":
-            return PulseNativeFunction("trim", lambda: PulseString(obj.value.strip()))
-        
-        if name == "split":
-            def _split(sep: Any = None) -> PulseList:
-                if sep is None:
-                    return PulseList([PulseString(s) for s in obj.value.split()])
-                if not isinstance(sep, PulseString):
-                    self._raise_type("split() separator must be a string", token)
-                return PulseList([PulseString(s) for s in obj.value.split(sep.value)])
-            return PulseNativeFunction("split", _split)
-        
-        if name == "join":
-            def _join(lst: Any) -> PulseString:
-                if not isinstance(lst, PulseList):
-                    self._raise_type("join() expects a list", token)
-                parts: list[str] = []
-                for el in lst.elements:
-                    if not isinstance(el, PulseString):
-                        self._raise_type("join() list elements must all be strings", token)
-                    parts.append(el.value)
-                return PulseString(obj.value.join(parts))
-            return PulseNativeFunction("join", _join)
-        
-        if name == "replace":
-            def _replace(old: Any, new: Any) -> PulseString:
-                if not isinstance(old, PulseString) or not isinstance(new, PulseString):
-                    self._raise_type("replace() expects two string arguments", token)
-                return PulseString(obj.value.replace(old.value, new.value))
-            return PulseNativeFunction("replace", _replace)
-        
-        if name == "starts_with":
-            def _starts_with(s: Any) -> PulseBoolean:
-                if not isinstance(s, PulseString):
-                    self._raise_type("starts_with() expects a string", token)
-                return PulseBoolean(obj.value.startswith(s.value))
-            return PulseNativeFunction("starts_with", _starts_with)
-        
-        if name == "ends_with":
-            def _ends_with(s: Any) -> PulseBoolean:
-                if not isinstance(s, PulseString):
-                    self._raise_type("ends_with() expects a string", token)
-                return PulseBoolean(obj.value.endswith(s.value))
-            return PulseNativeFunction("ends_with", _ends_with)
-        
-        if name == "contains":
-            def _contains(s: Any) -> PulseBoolean:
-                if not isinstance(s, PulseString):
-                    self._raise_type("contains() expects a string", token)
-                return PulseBoolean(s.value in obj.value)
-            return PulseNativeFunction("contains", _contains)
-        
-        if name == "length":
-            return PulseNativeFunction("length", lambda: PulseNumber(len(obj.value)))
-        
-        if name == "find":
-            def _find(sub: Any, start: Any = None) -> PulseNumber:
-                if not isinstance(sub, PulseString):
-                    self._raise_type("find() argument must be a string", token)
-                s = int(start.value) if start is not None else 0
-                return PulseNumber(obj.value.find(sub.value, s))
-            return PulseNativeFunction("find", _find)
-        
-        if name == "index":
-            def _index(sub: Any, start: Any = None) -> PulseNumber:
-                if not isinstance(sub, PulseString):
-                    self._raise_type("index() argument must be a string", token)
-                s = int(start.value) if start is not None else 0
-                try:
-                    return PulseNumber(obj.value.index(sub.value, s))
-                except ValueError:
-                    self._raise_value(f"'{sub.value}' not found in string", token)
-            return PulseNativeFunction("index", _index)
-        
-        if name == "count":
-            def _count(sub: Any) -> PulseNumber:
-                if not isinstance(sub, PulseString):
-                    self._raise_type("count() argument must be a string", token)
-                return PulseNumber(obj.value.count(sub.value))
-            return PulseNativeFunction("count", _count)
-        
-        if name == "format":
-            def _format(*args: Any) -> PulseString:
-                result = obj.value
-                for arg in args:
-                    if "{}" not in result:
-                        self._raise_value("Too many arguments for format()", token)
-                    result = result.replace("{}", self._stringify(arg), 1)
-                if "{}" in result:
-                    self._raise_value("Not enough arguments for format()", token)
-                return PulseString(result)
-            return PulseNativeFunction("format", _format)
-        
-        self._raise_attr(f"String has no method '{name}'", token)
-    
-    def _dict_method(self, obj: PulseDict, name: str, token: Token) -> PulseNativeFunction:
-        if name == "keys":
-            return PulseNativeFunction("keys", lambda: PulseList(list(obj.entries.keys())))
-        
-        if name == "values":
-            return PulseNativeFunction("values", lambda: PulseList(list(obj.entries.values())))
-        
-        if name == "items":
-            return PulseNativeFunction("items", lambda: PulseList([
-                PulseList([k, v]) for k, v in obj.entries.items()
-            ]))
-        
-        if name == "has":
-            return PulseNativeFunction("has", lambda key: PulseBoolean(obj.has(key)))
-        
-        if name == "remove":
-            def _remove(key: Any) -> PulseNull:
-                if not obj.has(key):
-                    self._raise_key(f"Key '{self._stringify(key)}' not found in dict", token)
-                obj.remove(key)
-                return PulseNull()
-            return PulseNativeFunction("remove", _remove)
-        
-        if name == "length":
-            return PulseNativeFunction("length", lambda: PulseNumber(len(obj.entries)))
-        
-        self._raise_attr(f"Dict has no method '{name}'", token)
-    
-    def _tensor_property(self, tensor: PulseTensor, name: str, token) -> Any:
-        if name == "shape":
-            return PulseList([PulseNumber(d) for d in tensor.shape])
-        if name == "ndim":
-            return PulseNumber(tensor.ndim)
-        if name == "T":
-            return tensor.T
-        if name == "size":
-            return PulseNumber(tensor.array.size)
-        if name == "dtype":
-            return PulseString(str(tensor.array.dtype))
-        
-        if name == "flatten":
-            def flatten():
-                return PulseTensor(tensor.array.flatten())
-            return PulseNativeMethod(flatten, arity=0)
-        
-        if name == "reshape":
-            def reshape(*args):
-                dims = [int(a.value) for a in args]
-                try:
-                    return PulseTensor(tensor.array.reshape(dims))
-                except ValueError as e:
-                    self._raise_value(f"reshape failed: {e}", token)
-            return PulseNativeMethod(reshape, arity=-1)
-        
-        if name == "sum":
-            def sum_():
-                return PulseNumber(float(tensor.array.sum()))
-            return PulseNativeMethod(sum_, arity=0)
-        
-        if name == "mean":
-            def mean():
-                return PulseNumber(float(tensor.array.mean()))
-            return PulseNativeMethod(mean, arity=0)
-        
-        if name == "max":
-            def max_():
-                return PulseNumber(float(tensor.array.max()))
-            return PulseNativeMethod(max_, arity=0)
-        
-        if name == "min":
-            def min_():
-                return PulseNumber(float(tensor.array.min()))
-            return PulseNativeMethod(min_, arity=0)
-        
-        self._raise_attr(f"Tensor has no property '{name}'", token)
\ No newline at end of file
+        return self.evaluate(expr.else_expr)
\ No newline at end of file
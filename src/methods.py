@@ -0,0 +1,334 @@
+"""
+methods.py
+
+Native methods of the built-in Pulse value types.
+
+Each built-in type has a static table mapping a member name to an unbound
+`NativeMethod`. The implementations take `(interpreter, receiver, token,
+*arguments)`, where `token` is the member name used for error reporting, so
+a table is built once at import time instead of creating new closures on
+every member access. Reading a method as a value binds it into a single
+`PulseBoundMethod`; a call written as `obj.method(args)` is dispatched
+straight from the table by the interpreter without binding at all.
+
+Tensor attributes that are plain values rather than methods (`shape`,
+`ndim`, ...) live in a separate property table and are computed on access.
+
+This module primarily provides:
+- LIST_METHODS, STRING_METHODS, DICT_METHODS, TENSOR_METHODS: method tables
+- TENSOR_PROPERTIES: computed tensor attributes
+- NATIVE_METHODS: the method table of each built-in class
+"""
+
+from __future__ import annotations
+from typing import Any, Callable
+from src.function import NativeMethod
+from src.tokens import Token
+from src.values import (
+    PulseNumber, PulseString, PulseBoolean, PulseNull, PulseList, PulseDict, PulseRange, PulseTensor,
+)
+
+def _method_table(functions: dict[str, Callable], label: str = None) -> dict[str, NativeMethod]:
+    return {name: NativeMethod(name, func, label) for name, func in functions.items()}
+
+# Lists
+def _list_append(interp, obj: PulseList, token: Token, val: Any) -> PulseNull:
+    obj.elements.append(val)
+    return PulseNull()
+
+def _list_pop(interp, obj: PulseList, token: Token, index: Any = None) -> Any:
+    if not obj.elements:
+        interp._raise_index("pop() called on empty list")
+    if index is None:
+        return obj.elements.pop()
+    interp._check_number(index, token, "pop() index")
+    idx = int(index.value)
+    if idx < -len(obj.elements) or idx >= len(obj.elements):
+        interp._raise_index(f"pop() index {idx} out of range")
+    return obj.elements.pop(idx)
+
+def _list_slice(interp, obj: PulseList, token: Token, start: Any, end: Any) -> PulseList:
+    interp._check_number(start, token, "slice() start")
+    interp._check_number(end, token, "slice() end")
+    return PulseList(obj.elements[int(start.value):int(end.value)])
+
+def _list_contains(interp, obj: PulseList, token: Token, val: Any) -> PulseBoolean:
+    return PulseBoolean(any(interp._is_equal(el, val) for el in obj.elements))
+
+def _list_length(interp, obj: PulseList, token: Token) -> PulseNumber:
+    return PulseNumber(len(obj.elements))
+
+def _list_reverse(interp, obj: PulseList, token: Token) -> PulseNull:
+    obj.elements.reverse()
+    return PulseNull()
+
+def _list_clear(interp, obj: PulseList, token: Token) -> PulseNull:
+    obj.elements.clear()
+    return PulseNull()
+
+def _list_sort(interp, obj: PulseList, token: Token, key=None, reverse=None) -> PulseNull:
+    rev = False
+    if reverse is not None:
+        if not isinstance(reverse, PulseBoolean):
+            interp._raise_type("sort() 'reverse' must be a boolean", token)
+        rev = reverse.value
+    
+    if key is None:
+        def default_key(el):
+            if isinstance(el, PulseNumber):
+                return el.value
+            if isinstance(el, PulseString):
+                return el.value
+            interp._raise_type(f"sort() cannot compare values of type '{el.type_name()}'", token)
+        obj.elements.sort(key=default_key, reverse=rev)
+    else:
+        if not callable(getattr(key, "call", None)):
+            interp._raise_type("sort() key must be a callable", token)
+        def pulse_key(el):
+            result = key.call(interp, [el], {})
+            if isinstance(result, PulseNumber):
+                return result.value
+            if isinstance(result, PulseString):
+                return result.value
+            interp._raise_type(f"sort() key function must return a number or string", token)
+        obj.elements.sort(key=pulse_key, reverse=rev)
+    
+    return PulseNull()
+
+def _list_map(interp, obj: PulseList, token: Token, fn: Any) -> PulseList:
+    if not callable(getattr(fn, "call", None)):
+        interp._raise_type("map() argument must be a callable", token)
+    return PulseList([fn.call(interp, [el], {}) for el in obj.elements])
+
+def _list_filter(interp, obj: PulseList, token: Token, fn: Any) -> PulseList:
+    if not callable(getattr(fn, "call", None)):
+        interp._raise_type("filter() argument must be a callable", token)
+    return PulseList([
+        el for el in obj.elements
+        if interp._is_truthy(fn.call(interp, [el], {}))
+    ])
+
+def _list_index(interp, obj: PulseList, token: Token, val: Any, start: Any = None) -> PulseNumber:
+    s = int(start.value) if start is not None else 0
+    for i, el in enumerate(obj.elements[s:], s):
+        if interp._is_equal(el, val):
+            return PulseNumber(i)
+    interp._raise_value(f"Value not found in list", token)
+
+def _list_find(interp, obj: PulseList, token: Token, val: Any, start: Any = None) -> PulseNumber:
+    s = int(start.value) if start is not None else 0
+    for i, el in enumerate(obj.elements[s:], s):
+        if interp._is_equal(el, val):
+            return PulseNumber(i)
+    return PulseNumber(-1)
+
+def _list_insert(interp, obj: PulseList, token: Token, index: Any, val: Any) -> PulseNull:
+    interp._check_number(index, token, "insert() index")
+    idx = int(index.value)
+    obj.elements.insert(idx, val)
+    return PulseNull()
+
+def _list_extend(interp, obj: PulseList, token: Token, other: Any) -> PulseNull:
+    if isinstance(other, PulseList):
+        obj.elements.extend(other.elements)
+    elif isinstance(other, PulseRange):
+        obj.elements.extend(other.to_list())
+    else:
+        interp._raise_type(f"extend() argument must be a list or range, got '{other.type_name()}'", token)
+    return PulseNull()
+
+def _list_count(interp, obj: PulseList, token: Token, val: Any) -> PulseNumber:
+    return PulseNumber(sum(1 for el in obj.elements if interp._is_equal(el, val)))
+
+LIST_METHODS = _method_table({
+    "append": _list_append,
+    "pop": _list_pop,
+    "slice": _list_slice,
+    "contains": _list_contains,
+    "length": _list_length,
+    "reverse": _list_reverse,
+    "clear": _list_clear,
+    "sort": _list_sort,
+    "map": _list_map,
+    "filter": _list_filter,
+    "index": _list_index,
+    "find": _list_find,
+    "insert": _list_insert,
+    "extend": _list_extend,
+    "count": _list_count,
+})
+
+# Strings
+def _string_upper(interp, obj: PulseString, token: Token) -> PulseString:
+    return PulseString(obj.value.upper())
+
+def _string_lower(interp, obj: PulseString, token: Token) -> PulseString:
+    return PulseString(obj.value.lower())
+
+def _string_trim(interp, obj: PulseString, token: Token) -> PulseString:
+    return PulseString(obj.value.strip())
+
+def _string_split(interp, obj: PulseString, token: Token, sep: Any = None) -> PulseList:
+    if sep is None:
+        return PulseList([PulseString(s) for s in obj.value.split()])
+    if not isinstance(sep, PulseString):
+        interp._raise_type("split() separator must be a string", token)
+    return PulseList([PulseString(s) for s in obj.value.split(sep.value)])
+
+def _string_join(interp, obj: PulseString, token: Token, lst: Any) -> PulseString:
+    if not isinstance(lst, PulseList):
+        interp._raise_type("join() expects a list", token)
+    parts: list[str] = []
+    for el in lst.elements:
+        if not isinstance(el, PulseString):
+            interp._raise_type("join() list elements must all be strings", token)
+        parts.append(el.value)
+    return PulseString(obj.value.join(parts))
+
+def _string_replace(interp, obj: PulseString, token: Token, old: Any, new: Any) -> PulseString:
+    if not isinstance(old, PulseString) or not isinstance(new, PulseString):
+        interp._raise_type("replace() expects two string arguments", token)
+    return PulseString(obj.value.replace(old.value, new.value))
+
+def _string_starts_with(interp, obj: PulseString, token: Token, s: Any) -> PulseBoolean:
+    if not isinstance(s, PulseString):
+        interp._raise_type("starts_with() expects a string", token)
+    return PulseBoolean(obj.value.startswith(s.value))
+
+def _string_ends_with(interp, obj: PulseString, token: Token, s: Any) -> PulseBoolean:
+    if not isinstance(s, PulseString):
+        interp._raise_type("ends_with() expects a string", token)
+    return PulseBoolean(obj.value.endswith(s.value))
+
+def _string_contains(interp, obj: PulseString, token: Token, s: Any) -> PulseBoolean:
+    if not isinstance(s, PulseString):
+        interp._raise_type("contains() expects a string", token)
+    return PulseBoolean(s.value in obj.value)
+
+def _string_length(interp, obj: PulseString, token: Token) -> PulseNumber:
+    return PulseNumber(len(obj.value))
+
+def _string_find(interp, obj: PulseString, token: Token, sub: Any, start: Any = None) -> PulseNumber:
+    if not isinstance(sub, PulseString):
+        interp._raise_type("find() argument must be a string", token)
+    s = int(start.value) if start is not None else 0
+    return PulseNumber(obj.value.find(sub.value, s))
+
+def _string_index(interp, obj: PulseString, token: Token, sub: Any, start: Any = None) -> PulseNumber:
+    if not isinstance(sub, PulseString):
+        interp._raise_type("index() argument must be a string", token)
+    s = int(start.value) if start is not None else 0
+    try:
+        return PulseNumber(obj.value.index(sub.value, s))
+    except ValueError:
+        interp._raise_value(f"'{sub.value}' not found in string", token)
+
+def _string_count(interp, obj: PulseString, token: Token, sub: Any) -> PulseNumber:
+    if not isinstance(sub, PulseString):
+        interp._raise_type("count() argument must be a string", token)
+    return PulseNumber(obj.value.count(sub.value))
+
+def _string_format(interp, obj: PulseString, token: Token, *args: Any) -> PulseString:
+    result = obj.value
+    for arg in args:
+        if "{}" not in result:
+            interp._raise_value("Too many arguments for format()", token)
+        result = result.replace("{}", interp._stringify(arg), 1)
+    if "{}" in result:
+        interp._raise_value("Not enough arguments for format()", token)
+    return PulseString(result)
+
+STRING_METHODS = _method_table({
+    "upper": _string_upper,
+    "lower": _string_lower,
+    "trim": _string_trim,
+    "split": _string_split,
+    "join": _string_join,
+    "replace": _string_replace,
+    "starts_with": _string_starts_with,
+    "ends_with": _string_ends_with,
+    "contains": _string_contains,
+    "length": _string_length,
+    "find": _string_find,
+    "index": _string_index,
+    "count": _string_count,
+    "format": _string_format,
+})
+
+# Dicts
+def _dict_keys(interp, obj: PulseDict, token: Token) -> PulseList:
+    return PulseList(list(obj.entries.keys()))
+
+def _dict_values(interp, obj: PulseDict, token: Token) -> PulseList:
+    return PulseList(list(obj.entries.values()))
+
+def _dict_items(interp, obj: PulseDict, token: Token) -> PulseList:
+    return PulseList([PulseList([k, v]) for k, v in obj.entries.items()])
+
+def _dict_has(interp, obj: PulseDict, token: Token, key: Any) -> PulseBoolean:
+    return PulseBoolean(obj.has(key))
+
+def _dict_remove(interp, obj: PulseDict, token: Token, key: Any) -> PulseNull:
+    if not obj.has(key):
+        interp._raise_key(f"Key '{interp._stringify(key)}' not found in dict", token)
+    obj.remove(key)
+    return PulseNull()
+
+def _dict_length(interp, obj: PulseDict, token: Token) -> PulseNumber:
+    return PulseNumber(len(obj.entries))
+
+DICT_METHODS = _method_table({
+    "keys": _dict_keys,
+    "values": _dict_values,
+    "items": _dict_items,
+    "has": _dict_has,
+    "remove": _dict_remove,
+    "length": _dict_length,
+})
+
+# Tensors
+def _tensor_flatten(interp, tensor: PulseTensor, token: Token) -> PulseTensor:
+    return PulseTensor(tensor.array.flatten())
+
+def _tensor_reshape(interp, tensor: PulseTensor, token: Token, *args) -> PulseTensor:
+    dims = [int(a.value) for a in args]
+    try:
+        return PulseTensor(tensor.array.reshape(dims))
+    except ValueError as e:
+        interp._raise_value(f"reshape failed: {e}", token)
+
+def _tensor_sum(interp, tensor: PulseTensor, token: Token) -> PulseNumber:
+    return PulseNumber(float(tensor.array.sum()))
+
+def _tensor_mean(interp, tensor: PulseTensor, token: Token) -> PulseNumber:
+    return PulseNumber(float(tensor.array.mean()))
+
+def _tensor_max(interp, tensor: PulseTensor, token: Token) -> PulseNumber:
+    return PulseNumber(float(tensor.array.max()))
+
+def _tensor_min(interp, tensor: PulseTensor, token: Token) -> PulseNumber:
+    return PulseNumber(float(tensor.array.min()))
+
+TENSOR_METHODS = _method_table({
+    "flatten": _tensor_flatten,
+    "reshape": _tensor_reshape,
+    "sum": _tensor_sum,
+    "mean": _tensor_mean,
+    "max": _tensor_max,
+    "min": _tensor_min,
+}, label="<native method>")
+
+TENSOR_PROPERTIES: dict[str, Callable[[PulseTensor], Any]] = {
+    "shape": lambda tensor: PulseList([PulseNumber(d) for d in tensor.shape]),
+    "ndim": lambda tensor: PulseNumber(tensor.ndim),
+    "T": lambda tensor: tensor.T,
+    "size": lambda tensor: PulseNumber(tensor.array.size),
+    "dtype": lambda tensor: PulseString(str(tensor.array.dtype)),
+}
+
+NATIVE_METHODS: dict[type, dict[str, NativeMethod]] = {
+    PulseList: LIST_METHODS,
+    PulseString: STRING_METHODS,
+    PulseDict: DICT_METHODS,
+    PulseTensor: TENSOR_METHODS,
+}
@@ -0,0 +1,226 @@
+"""
+operators.py
+
+Binary operator dispatch for the Pulse programming language.
+
+Every binary operator is resolved through a table keyed by the operator
+lexeme and the runtime classes of both operands, instead of a chain of
+type and operator tests. Handlers are registered against classes and found
+through each operand's MRO, so a handler registered for `PulseValue` or
+`object` also covers their subclasses; the first match, walking the left
+operand's MRO before the right one's, wins. Resolved lookups are cached
+per concrete class pair, so after the first evaluation an operator costs a
+single dictionary lookup.
+
+Handlers take `(interpreter, token, left, right)` and return the result
+value, raising through the interpreter's `_raise*` helpers on error. The
+core language registers its handlers below; other modules (such as the
+standard library) can add their own with `register_binary` without
+touching the interpreter.
+
+This module primarily provides:
+- register_binary: installs a handler for an operator and an operand type pair
+- find_binary: resolves and caches the handler for concrete operand classes
+- BINARY_DISPATCH: the cache of resolved handlers, read directly on hot paths
+"""
+
+from __future__ import annotations
+import operator as py_operator
+from typing import Any, Callable, Iterable, Optional, Union
+import numpy as np
+from src.tokens import Token
+from src.values import PulseNumber, PulseString, PulseBoolean, PulseList, PulseTensor
+
+BinaryHandler = Callable[[Any, Token, Any, Any], Any]
+
+# Registered handlers, keyed by (operator, left class, right class)
+BINARY_HANDLERS: dict[tuple[str, type, type], BinaryHandler] = {}
+# Resolved handlers for concrete operand classes
+BINARY_DISPATCH: dict[tuple[str, type, type], BinaryHandler] = {}
+
+ALL_OPERATORS = (
+    "+", "-", "*", "/", "%", "//", "**", "@",
+    "<", "<=", ">", ">=", "==", "!=", "in", "not in", "is", "is not",
+)
+
+def register_binary(operators: Union[str, Iterable[str]], left_type: type, right_type: type,
+                    handler: BinaryHandler) -> None:
+    """Install `handler` for each operator applied to `left_type` and `right_type` operands."""
+    if isinstance(operators, str):
+        operators = (operators,)
+    for operator in operators:
+        BINARY_HANDLERS[(operator, left_type, right_type)] = handler
+    # Earlier resolutions may now pick a less specific handler
+    BINARY_DISPATCH.clear()
+
+def find_binary(operator: str, left_type: type, right_type: type) -> Optional[BinaryHandler]:
+    """Return the handler for `operator` on operands of these classes, or None if there is none."""
+    key = (operator, left_type, right_type)
+    handler = BINARY_DISPATCH.get(key)
+    if handler is not None:
+        return handler
+    
+    for left_base in left_type.__mro__:
+        for right_base in right_type.__mro__:
+            handler = BINARY_HANDLERS.get((operator, left_base, right_base))
+            if handler is not None:
+                BINARY_DISPATCH[key] = handler
+                return handler
+    return None
+
+# Numbers
+def _add(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    return PulseNumber(left.value + right.value)
+
+def _sub(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    return PulseNumber(left.value - right.value)
+
+def _mul(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    return PulseNumber(left.value * right.value)
+
+def _pow(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    return PulseNumber(left.value ** right.value)
+
+def _div(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    if right.value == 0:
+        interp._raise_zerodiv("Division by zero", tok)
+    return PulseNumber(left.value / right.value)
+
+def _mod(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    if right.value == 0:
+        interp._raise_zerodiv("Modulo by zero", tok)
+    return PulseNumber(left.value % right.value)
+
+def _floordiv(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseNumber:
+    if right.value == 0:
+        interp._raise_zerodiv("Integer division by zero", tok)
+    return PulseNumber(int(left.value // right.value))
+
+def _lt(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseBoolean:
+    return PulseBoolean(left.value < right.value)
+
+def _le(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseBoolean:
+    return PulseBoolean(left.value <= right.value)
+
+def _gt(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseBoolean:
+    return PulseBoolean(left.value > right.value)
+
+def _ge(interp, tok: Token, left: PulseNumber, right: PulseNumber) -> PulseBoolean:
+    return PulseBoolean(left.value >= right.value)
+
+def _numbers_required(interp, tok: Token, left: Any, right: Any) -> Any:
+    if tok.lexeme == "+":
+        interp._raise_type(
+            "'+' requires two numbers or two strings, "
+            f"got '{left.type_name()}' and '{right.type_name()}'",
+            tok,
+        )
+    interp._raise_type(
+        f"'{tok.lexeme}' requires two numbers, "
+        f"got '{left.type_name()}' and '{right.type_name()}'",
+        tok,
+    )
+
+register_binary("+", PulseNumber, PulseNumber, _add)
+register_binary("-", PulseNumber, PulseNumber, _sub)
+register_binary("*", PulseNumber, PulseNumber, _mul)
+register_binary("**", PulseNumber, PulseNumber, _pow)
+register_binary("/", PulseNumber, PulseNumber, _div)
+register_binary("%", PulseNumber, PulseNumber, _mod)
+register_binary("//", PulseNumber, PulseNumber, _floordiv)
+register_binary("<", PulseNumber, PulseNumber, _lt)
+register_binary("<=", PulseNumber, PulseNumber, _le)
+register_binary(">", PulseNumber, PulseNumber, _gt)
+register_binary(">=", PulseNumber, PulseNumber, _ge)
+
+register_binary(("+", "-", "*", "/", "%", "//", "**", "<", "<=", ">", ">="), object, object, _numbers_required)
+
+# Sequences
+def _concat_strings(interp, tok: Token, left: PulseString, right: PulseString) -> PulseString:
+    return PulseString(left.value + right.value)
+
+def _concat_lists(interp, tok: Token, left: PulseList, right: PulseList) -> PulseList:
+    return PulseList(left.elements + right.elements)
+
+register_binary("+", PulseString, PulseString, _concat_strings)
+register_binary("+", PulseList, PulseList, _concat_lists)
+
+# Equality, membership and identity, defined for every pair of values
+def _equal(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(interp._is_equal(left, right))
+
+def _not_equal(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(not interp._is_equal(left, right))
+
+def _in(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(interp._contains(right, left, tok))
+
+def _not_in(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(not interp._contains(right, left, tok))
+
+def _is(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(interp._is_same(left, right))
+
+def _is_not(interp, tok: Token, left: Any, right: Any) -> PulseBoolean:
+    return PulseBoolean(not interp._is_same(left, right))
+
+register_binary("==", object, object, _equal)
+register_binary("!=", object, object, _not_equal)
+register_binary("in", object, object, _in)
+register_binary("not in", object, object, _not_in)
+register_binary("is", object, object, _is)
+register_binary("is not", object, object, _is_not)
+
+# Tensors
+_TENSOR_SCALAR = {
+    "+": py_operator.add,
+    "-": py_operator.sub,
+    "*": py_operator.mul,
+    "/": py_operator.truediv,
+}
+
+_TENSOR_TENSOR = dict(_TENSOR_SCALAR, **{"@": py_operator.matmul})
+
+def _tensor_scalar(interp, tok: Token, left: PulseTensor, right: PulseNumber) -> PulseTensor:
+    operator = tok.lexeme
+    fn = _TENSOR_SCALAR.get(operator)
+    if fn is None:
+        interp._raise_type(f"Tensor does not support operator '{operator}' with scalar", tok)
+    if operator == "/" and right.value == 0:
+        interp._raise_zerodiv("Division by zero", tok)
+    try:
+        return PulseTensor(fn(left.array, right.value))
+    except ValueError as e:
+        interp._raise_value(f"Tensor operation failed: {e}", tok)
+
+def _scalar_tensor(interp, tok: Token, left: PulseNumber, right: PulseTensor) -> PulseTensor:
+    # The scalar is always applied as the right operand
+    return _tensor_scalar(interp, tok, right, left)
+
+def _tensor_tensor(interp, tok: Token, left: PulseTensor, right: PulseTensor) -> Any:
+    operator = tok.lexeme
+    if operator == "==":
+        return PulseBoolean(np.array_equal(left.array, right.array))
+    if operator == "!=":
+        return PulseBoolean(not np.array_equal(left.array, right.array))
+    
+    fn = _TENSOR_TENSOR.get(operator)
+    if fn is None:
+        interp._raise_type(f"Tensor does not support operator '{operator}'", tok)
+    try:
+        return PulseTensor(fn(left.array, right.array))
+    except ValueError as e:
+        interp._raise_value(f"Tensor operation failed: {e}", tok)
+
+def _tensors_required(interp, tok: Token, left: Any, right: Any) -> Any:
+    interp._raise_type(
+        f"Both operands must be tensors, "
+        f"got '{left.type_name()}' and '{right.type_name()}'",
+        tok,
+    )
+
+register_binary(ALL_OPERATORS, PulseTensor, PulseNumber, _tensor_scalar)
+register_binary(ALL_OPERATORS, PulseNumber, PulseTensor, _scalar_tensor)
+register_binary(ALL_OPERATORS, PulseTensor, PulseTensor, _tensor_tensor)
+register_binary(ALL_OPERATORS, PulseTensor, object, _tensors_required)
+register_binary(ALL_OPERATORS, object, PulseTensor, _tensors_required)
@@ -0,0 +1,375 @@
+"""
+optimizer.py
+
+Simplifies the Pulse AST between parsing and scope resolution.
+
+The optimizer walks every statement and expression once and rewrites the
+tree in place wherever work can be done ahead of time:
+- Literals are boxed into Pulse values once, so evaluating them no longer
+  allocates
+- Constant arithmetic, string concatenation and comparisons are folded
+  into a single literal
+- Constant `if`/`elif` conditions, ternaries and `and`/`or` operands select
+  their branch statically
+- Tensor literals are converted to a numpy array once and marked read-only;
+  every evaluation shares that array, and code that needs to modify a tensor
+  in place copies it first (see `PulseTensor.writable_array`)
+
+Folding goes through the interpreter's own operators, so a folded result is
+exactly the value the expression would produce at runtime. Expressions that
+would raise (division by zero, mismatched operand types) are left alone so
+the error is still reported when, and if, they execute. Dead branches that
+bind a name are also kept, since the resolver decides from assignments alone
+whether a name is local to a function.
+
+This module primarily provides:
+- Optimizer: rewrites a list of statements and returns the optimized list
+"""
+
+from __future__ import annotations
+from typing import Any
+import numpy as np
+import src.expressions as expressions
+import src.statements as statements
+from src.expressions import ExprVisitor
+from src.statements import StmtVisitor
+from src.values import PulseNumber, PulseString, PulseBoolean, PulseNull, PulseValue
+
+# Values a literal may fold to
+_CONSTANT_TYPES = (PulseNumber, PulseString, PulseBoolean, PulseNull)
+_NUMBER_OPERATORS = {"+", "-", "*", "/", "%", "//", "**", "<", "<=", ">", ">="}
+_ZERO_DIVISORS = {"/", "%", "//"}
+# Larger exponents could make folding itself arbitrarily slow
+_MAX_FOLDED_EXPONENT = 64
+
+def _binds_names(node: Any) -> bool:
+    """True if a statement or expression contains anything that creates a binding."""
+    if isinstance(node, (expressions.Assign, expressions.Unpack, statements.Function,
+                         statements.Class, statements.Import)):
+        return True
+    if isinstance(node, expressions.Lambda):
+        return False
+    if isinstance(node, (list, tuple)):
+        return any(_binds_names(item) for item in node)
+    if isinstance(node, (expressions.Expr, statements.Stmt)):
+        return any(_binds_names(value) for value in vars(node).values())
+    return False
+
+class Optimizer(ExprVisitor, StmtVisitor):
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+    
+    # Entry Point
+    def optimize(self, program: list) -> list:
+        return [self.optimize_stmt(s) for s in program]
+    
+    def optimize_stmt(self, stmt):
+        return stmt.accept(self)
+    
+    def optimize_expr(self, expr):
+        return expr.accept(self)
+    
+    def _optional(self, expr):
+        return self.optimize_expr(expr) if expr is not None else None
+    
+    # Constants
+    @staticmethod
+    def _constant(expr) -> Any:
+        """The boxed value of a folded literal, or None if `expr` is not constant."""
+        if isinstance(expr, expressions.Literal) and isinstance(expr.value, _CONSTANT_TYPES):
+            return expr.value
+        return None
+    
+    def _fold_binary(self, expr, left, right) -> Any:
+        operator = expr.operator.lexeme
+        
+        if operator in ("==", "!="):
+            return self.interpreter._binary_op(expr.operator, left, right)
+        
+        if left.__class__ is PulseString and right.__class__ is PulseString:
+            if operator == "+":
+                return self.interpreter._binary_op(expr.operator, left, right)
+            return None
+        
+        if left.__class__ is not PulseNumber or right.__class__ is not PulseNumber:
+            return None
+        if operator not in _NUMBER_OPERATORS:
+            return None
+        if operator in _ZERO_DIVISORS and right.value == 0:
+            return None
+        if operator == "**" and abs(right.value) > _MAX_FOLDED_EXPONENT:
+            return None
+        
+        try:
+            return self.interpreter._binary_op(expr.operator, left, right)
+        except (ArithmeticError, ValueError):
+            return None
+    
+    def _fold_unary(self, expr, right) -> Any:
+        operator = expr.operator.lexeme
+        
+        if operator == "-" and right.__class__ is PulseNumber:
+            return self.interpreter._unary_op(expr.operator, right)
+        if operator in ("not", "!"):
+            return self.interpreter._unary_op(expr.operator, right)
+        return None
+    
+    # Statements
+    def visit_block_stmt(self, stmt):
+        stmt.statements = self.optimize(stmt.statements)
+        return stmt
+    
+    def visit_expression_stmt(self, stmt):
+        stmt.expression = self.optimize_expr(stmt.expression)
+        return stmt
+    
+    def visit_if_stmt(self, stmt):
+        branches = [(self.optimize_expr(stmt.condition), self.optimize_stmt(stmt.then_branch))]
+        for cond, branch in stmt.elif_branches:
+            branches.append((self.optimize_expr(cond), self.optimize_stmt(branch)))
+        written_else = else_branch = self._optional_stmt(stmt.else_branch)
+        
+        live = []
+        dropped = []
+        for index, (cond, branch) in enumerate(branches):
+            value = self._constant(cond)
+            if value is None:
+                live.append((cond, branch))
+            elif value.is_truthy():
+                # Everything after an always-taken branch is unreachable
+                dropped.extend(branch for _, branch in branches[index + 1:])
+                if else_branch is not None:
+                    dropped.append(else_branch)
+                else_branch = branch
+                break
+            else:
+                dropped.append(branch)
+        
+        if dropped and _binds_names(dropped):
+            return self._rebuild_if(stmt, branches, written_else)
+        
+        if not live:
+            return else_branch if else_branch is not None else statements.Pass()
+        
+        return self._rebuild_if(stmt, live, else_branch)
+    
+    def _optional_stmt(self, stmt):
+        return self.optimize_stmt(stmt) if stmt is not None else None
+    
+    @staticmethod
+    def _rebuild_if(stmt, branches: list, else_branch):
+        (stmt.condition, stmt.then_branch), *rest = branches
+        stmt.elif_branches = rest
+        stmt.else_branch = else_branch
+        return stmt
+    
+    def visit_while_stmt(self, stmt):
+        stmt.condition = self.optimize_expr(stmt.condition)
+        stmt.body = self.optimize_stmt(stmt.body)
+        return stmt
+    
+    def visit_for_stmt(self, stmt):
+        stmt.iterable = self.optimize_expr(stmt.iterable)
+        stmt.body = self.optimize_stmt(stmt.body)
+        return stmt
+    
+    def visit_break_stmt(self, stmt):
+        return stmt
+    
+    def visit_continue_stmt(self, stmt):
+        return stmt
+    
+    def visit_return_stmt(self, stmt):
+        stmt.value = self._optional(stmt.value)
+        return stmt
+    
+    def visit_pass_stmt(self, stmt):
+        return stmt
+    
+    def visit_function_stmt(self, stmt):
+        stmt.defaults = [self._optional(default) for default in stmt.defaults]
+        stmt.body = self.optimize_stmt(stmt.body)
+        return stmt
+    
+    def visit_class_stmt(self, stmt):
+        stmt.class_vars = [(name, self.optimize_expr(value)) for name, value in stmt.class_vars]
+        stmt.methods = [self.optimize_stmt(method) for method in stmt.methods]
+        return stmt
+    
+    def visit_try_stmt(self, stmt):
+        stmt.try_block = self.optimize_stmt(stmt.try_block)
+        stmt.except_blocks = [
+            (self._optional(exc_type), var, self.optimize_stmt(block))
+            for exc_type, var, block in stmt.except_blocks
+        ]
+        stmt.else_block = self._optional_stmt(stmt.else_block)
+        stmt.finally_block = self._optional_stmt(stmt.finally_block)
+        return stmt
+    
+    def visit_import_stmt(self, stmt):
+        return stmt
+    
+    def visit_raise_stmt(self, stmt):
+        stmt.exception = self._optional(stmt.exception)
+        return stmt
+    
+    def visit_del_stmt(self, stmt):
+        return stmt
+    
+    def visit_match_stmt(self, stmt):
+        # Patterns are matched structurally, so only guards and bodies are rewritten
+        stmt.subject = self.optimize_expr(stmt.subject)
+        stmt.cases = [
+            (pattern, self._optional(guard), self.optimize_stmt(body))
+            for pattern, guard, body in stmt.cases
+        ]
+        return stmt
+    
+    # Expressions
+    def visit_literal_expr(self, expr):
+        if not isinstance(expr.value, PulseValue):
+            expr.value = self.interpreter.visit_literal_expr(expr)
+        return expr
+    
+    def visit_tensor_expr(self, expr):
+        if isinstance(expr.value, np.ndarray):
+            return expr
+        try:
+            array = np.array(expr.value, dtype=float)
+        except (ValueError, TypeError):
+            # Left as written so the error surfaces when the literal runs
+            return expr
+        array.flags.writeable = False
+        expr.value = array
+        return expr
+    
+    def visit_grouping_expr(self, expr):
+        expr.expression = self.optimize_expr(expr.expression)
+        if self._constant(expr.expression) is not None:
+            return expr.expression
+        return expr
+    
+    def visit_unary_expr(self, expr):
+        expr.right = self.optimize_expr(expr.right)
+        right = self._constant(expr.right)
+        if right is not None:
+            value = self._fold_unary(expr, right)
+            if value is not None:
+                return expressions.Literal(value)
+        return expr
+    
+    def visit_binary_expr(self, expr):
+        expr.left = self.optimize_expr(expr.left)
+        expr.right = self.optimize_expr(expr.right)
+        left = self._constant(expr.left)
+        right = self._constant(expr.right)
+        if left is not None and right is not None:
+            value = self._fold_binary(expr, left, right)
+            if value is not None:
+                return expressions.Literal(value)
+        return expr
+    
+    def visit_logical_expr(self, expr):
+        expr.left = self.optimize_expr(expr.left)
+        expr.right = self.optimize_expr(expr.right)
+        left = self._constant(expr.left)
+        if left is None:
+            return expr
+        
+        operator = expr.operator.lexeme
+        if operator == "or":
+            return self._select(expr, expr.left, expr.right, left.is_truthy())
+        if operator == "and":
+            return self._select(expr, expr.right, expr.left, left.is_truthy())
+        return expr
+    
+    def visit_ternary_expr(self, expr):
+        expr.then_expr = self.optimize_expr(expr.then_expr)
+        expr.condition = self.optimize_expr(expr.condition)
+        expr.else_expr = self.optimize_expr(expr.else_expr)
+        condition = self._constant(expr.condition)
+        if condition is None:
+            return expr
+        return self._select(expr, expr.then_expr, expr.else_expr, condition.is_truthy())
+    
+    @staticmethod
+    def _select(expr, when_true, when_false, truthy: bool):
+        """Replace `expr` with the operand a constant test picks, unless the other one binds a name."""
+        if _binds_names(when_false if truthy else when_true):
+            return expr
+        return when_true if truthy else when_false
+    
+    def visit_variable_expr(self, expr):
+        return expr
+    
+    def visit_assign_expr(self, expr):
+        expr.value = self.optimize_expr(expr.value)
+        return expr
+    
+    def visit_call_expr(self, expr):
+        expr.callee = self.optimize_expr(expr.callee)
+        expr.arguments = [self.optimize_expr(arg) for arg in expr.arguments]
+        expr.keyword_arguments = [(name, self.optimize_expr(value)) for name, value in expr.keyword_arguments]
+        return expr
+    
+    def visit_list_expr(self, expr):
+        expr.elements = [self.optimize_expr(element) for element in expr.elements]
+        return expr
+    
+    def visit_dict_expr(self, expr):
+        expr.keys = [self.optimize_expr(key) for key in expr.keys]
+        expr.values = [self.optimize_expr(value) for value in expr.values]
+        return expr
+    
+    def visit_index_expr(self, expr):
+        expr.object = self.optimize_expr(expr.object)
+        expr.index = self.optimize_expr(expr.index)
+        return expr
+    
+    def visit_setindex_expr(self, expr):
+        expr.object = self.optimize_expr(expr.object)
+        expr.index = self.optimize_expr(expr.index)
+        expr.value = self.optimize_expr(expr.value)
+        return expr
+    
+    def visit_slice_expr(self, expr):
+        expr.lower = self._optional(expr.lower)
+        expr.upper = self._optional(expr.upper)
+        return expr
+    
+    def visit_multiindex_expr(self, expr):
+        expr.object = self.optimize_expr(expr.object)
+        expr.indices = [self.optimize_expr(index) for index in expr.indices]
+        return expr
+    
+    def visit_setmember_expr(self, expr):
+        expr.object = self.optimize_expr(expr.object)
+        expr.value = self.optimize_expr(expr.value)
+        return expr
+    
+    def visit_memberaccess_expr(self, expr):
+        expr.object = self.optimize_expr(expr.object)
+        return expr
+    
+    def visit_fstring_expr(self, expr):
+        expr.parts = [self.optimize_expr(part) for part in expr.parts]
+        return expr
+    
+    def visit_pipe_expr(self, expr):
+        expr.left = self.optimize_expr(expr.left)
+        expr.right = self.optimize_expr(expr.right)
+        return expr
+    
+    def visit_unpack_expr(self, expr):
+        expr.value = self.optimize_expr(expr.value)
+        return expr
+    
+    def visit_lambda_expr(self, expr):
+        expr.body = self.optimize_expr(expr.body)
+        return expr
+    
+    def visit_listcomp_expr(self, expr):
+        expr.iterable = self.optimize_expr(expr.iterable)
+        expr.element = self.optimize_expr(expr.element)
+        expr.condition = self._optional(expr.condition)
+        return expr
@@ -4,9 +4,15 @@ resolver.py
 Performs static scope resolution for the Pulse language.
 
 The resolver walks the AST before interpretation and determines
-how many scopes away each variable is defined. This allows the
-interpreter to perform fast and correct variable lookup using
-lexical scoping instead of dynamic lookup.
+how many scopes away each variable is defined, and at which slot of
+that scope it lives. Every scope it closes is reported to the
+interpreter as a layout (name -> slot), so runtime environments can
+store locals in an indexed list instead of a dict. Scopes whose
+variables are referenced from a nested function or lambda are reported
+as captured, since loops may only recycle environments that no closure
+can observe. A `return f(...)` inside `f` itself (outside any try
+statement) is reported as a tail call, so the interpreter can rerun the
+function body in place instead of nesting another call.
 
 It also detects errors such as:
 - Using a variable before it is defined in the same scope
@@ -15,8 +21,8 @@ It also detects errors such as:
 from __future__ import annotations
 from enum import Enum, auto
 from typing import Any, Optional
-from src.expressions import ExprVisitor
-from src.statements import StmtVisitor
+from src.expressions import ExprVisitor, Call, Variable
+from src.statements import StmtVisitor, Block
 from src.tokens import Token
 from src.error import PulseSemanticError
 
@@ -36,6 +42,9 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.current_class = ClassType.NONE
         self.current_function = FunctionType.NONE
         self.loop_depth = 0
+        self.try_depth = 0
+        self.current_declaration = None
+        self.captured: set[int] = set()
     
     # Entry Point
     def resolve(self, statements):
@@ -52,8 +61,15 @@ class Resolver(ExprVisitor, StmtVisitor):
     def begin_scope(self):
         self.scopes.append({})
     
-    def end_scope(self):
-        self.scopes.pop()
+    def end_scope(self, node=None):
+        scope = self.scopes.pop()
+        captured = id(scope) in self.captured
+        self.captured.discard(id(scope))
+        if node is not None:
+            names = [name for name in scope if name != "__is_function__"]
+            self.interpreter.resolve_scope(node, {name: i for i, name in enumerate(names)})
+            if captured:
+                self.interpreter.resolve_captured(node)
     
     def declare(self, name):
         if not self.scopes:
@@ -83,38 +99,57 @@ class Resolver(ExprVisitor, StmtVisitor):
                     for j in range(len(self.scopes) - 1, -1, -1):
                         if self.scopes[j].get("__is_function__"):
                             self.scopes[j][name.lexeme] = True
-                            distance = len(self.scopes) - 1 - j
-                            self.interpreter.resolve(expr, distance)
+                            self._resolve_at(expr, name, j)
                             return
                     self.scopes[-1][name.lexeme] = True
-                    self.interpreter.resolve(expr, 0)
+                    self._resolve_at(expr, name, len(self.scopes) - 1)
                     return
                 if i == 0:
                     self.interpreter.resolve(expr, None)
                     return
-                distance = len(self.scopes) - 1 - i
-                self.interpreter.resolve(expr, distance)
+                self._resolve_at(expr, name, i)
                 return
         
         if is_assignment:
             for i in range(len(self.scopes) - 1, -1, -1):
                 if self.scopes[i].get("__is_function__"):
                     self.scopes[i][name.lexeme] = True
-                    distance = len(self.scopes) - 1 - i
-                    self.interpreter.resolve(expr, distance)
+                    self._resolve_at(expr, name, i)
                     return
             self.scopes[-1][name.lexeme] = True
             if len(self.scopes) == 1:
                 self.interpreter.resolve(expr, None)
             else:
-                self.interpreter.resolve(expr, 0)
+                self._resolve_at(expr, name, len(self.scopes) - 1)
             return
         
         self.interpreter.resolve(expr, None)
     
+    def _resolve_at(self, expr, name, index):
+        """Report the distance to scope `index` and the slot `name` occupies in it."""
+        self.interpreter.resolve(expr, len(self.scopes) - 1 - index)
+        
+        slot = 0
+        for key in self.scopes[index]:
+            if key == name.lexeme:
+                break
+            if key != "__is_function__":
+                slot += 1
+        self.interpreter.resolve_slot(expr, slot)
+        
+        # A function nested inside the scope keeps it alive beyond the current iteration
+        if any(scope.get("__is_function__") for scope in self.scopes[index + 1:]):
+            self.captured.add(id(self.scopes[index]))
+    
     def resolve_function(self, func, func_type):
         enclosing_function = self.current_function
+        enclosing_loop_depth = self.loop_depth
+        enclosing_try_depth = self.try_depth
+        enclosing_declaration = self.current_declaration
         self.current_function = func_type
+        self.loop_depth = 0
+        self.try_depth = 0
+        self.current_declaration = func
         self.begin_scope(is_function=True)
         
         if func_type == FunctionType.METHOD and not func.is_static:
@@ -131,8 +166,11 @@ class Resolver(ExprVisitor, StmtVisitor):
                 self.resolve_expr(default)
         
         self.resolve(func.body.statements)
-        self.end_scope()
+        self.end_scope(func)
         self.current_function = enclosing_function
+        self.loop_depth = enclosing_loop_depth
+        self.try_depth = enclosing_try_depth
+        self.current_declaration = enclosing_declaration
     
     def _resolve_pattern(self, pattern):
         if isinstance(pattern, Token) and pattern.lexeme == "_":
@@ -162,7 +200,7 @@ class Resolver(ExprVisitor, StmtVisitor):
     def visit_block_stmt(self, stmt):
         self.begin_scope()
         self.resolve(stmt.statements)
-        self.end_scope()
+        self.end_scope(stmt)
     
     def visit_expression_stmt(self, stmt):
         self.resolve_expr(stmt.expression)
@@ -192,6 +230,14 @@ class Resolver(ExprVisitor, StmtVisitor):
         
         if stmt.value is not None:
             self.resolve_expr(stmt.value)
+        
+        # A handler or `finally` around the call must stay on the call stack
+        func = self.current_declaration
+        value = stmt.value
+        if (func is not None and not func.is_method and self.try_depth == 0
+                and isinstance(value, Call) and isinstance(value.callee, Variable)
+                and value.callee.name.lexeme == func.name.lexeme):
+            self.interpreter.resolve_tail_call(stmt, func)
     
     def visit_pass_stmt(self, stmt):
         pass
@@ -231,16 +277,21 @@ class Resolver(ExprVisitor, StmtVisitor):
         else:
             self.scopes[-1][stmt.var.lexeme] = True
         
+        # The body shares the loop scope, so one environment serves each iteration
         self.loop_depth += 1
-        self.resolve_stmt(stmt.body)
+        if isinstance(stmt.body, Block):
+            self.resolve(stmt.body.statements)
+        else:
+            self.resolve_stmt(stmt.body)
         self.loop_depth -= 1
         
-        self.end_scope()
+        self.end_scope(stmt)
     
     def visit_try_stmt(self, stmt):
+        self.try_depth += 1
         self.resolve_stmt(stmt.try_block)
         
-        for exc_type_expr, exception_var, block in stmt.except_blocks:
+        for index, (exc_type_expr, exception_var, block) in enumerate(stmt.except_blocks):
             self.begin_scope()
             
             if exception_var is not None:
@@ -250,10 +301,11 @@ class Resolver(ExprVisitor, StmtVisitor):
                 self.resolve_expr(exc_type_expr)
             
             self.resolve_stmt(block)
-            self.end_scope()
+            self.end_scope((stmt, index))
         
         if stmt.finally_block is not None:
             self.resolve_stmt(stmt.finally_block)
+        self.try_depth -= 1
     
     def visit_continue_stmt(self, stmt):
         if self.loop_depth == 0:
@@ -291,7 +343,7 @@ class Resolver(ExprVisitor, StmtVisitor):
     def visit_match_stmt(self, stmt):
         self.resolve_expr(stmt.subject)
         
-        for pattern, guard, body in stmt.cases:
+        for index, (pattern, guard, body) in enumerate(stmt.cases):
             self.begin_scope()
             self._resolve_pattern(pattern)
             
@@ -299,7 +351,7 @@ class Resolver(ExprVisitor, StmtVisitor):
                 self.resolve_expr(guard)
             
             self.resolve_stmt(body)
-            self.end_scope()
+            self.end_scope((stmt, index))
     
     # Expressions
     def visit_literal_expr(self, expr):
@@ -341,7 +393,7 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.resolve_local(expr, expr.name)
     
     def visit_assign_expr(self, expr):
-        self.resolve_expr(expr.value)        
+        self.resolve_expr(expr.value)
         self.resolve_local(expr, expr.name, is_assignment=True)
     
     def visit_call_expr(self, expr):
@@ -410,7 +462,7 @@ class Resolver(ExprVisitor, StmtVisitor):
         
         self.resolve_expr(expr.body)
         
-        self.end_scope()
+        self.end_scope(expr)
         self.current_function = enclosing_function
     
     def visit_listcomp_expr(self, expr):
@@ -421,7 +473,7 @@ class Resolver(ExprVisitor, StmtVisitor):
         self.resolve_expr(expr.element)
         if expr.condition is not None:
             self.resolve_expr(expr.condition)
-        self.end_scope()
+        self.end_scope(expr)
     
     def visit_ternary_expr(self, expr):
         self.resolve_expr(expr.then_expr)
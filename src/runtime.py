@@ -8,14 +8,15 @@ non-linear execution flow during program runtime. Unlike syntax or semantic
 errors, these constructs are not failures but signals that alter the normal
 sequential execution of statements.
 
-The runtime uses specialized exception-based control signals to handle
-language features such as loop interruption and function returns. These
-signals allow the interpreter to unwind execution contexts safely and
-efficiently without relying on complex state flags or manual checks.
-
-These runtime signals are intended strictly for internal interpreter use
-and must be handled appropriately within control-flow constructs such as
-loops and function execution blocks.
+Loop interruption and function returns are reported as completion records:
+a statement that transfers control returns a Completion instead of its usual
+result, and every construct that executes statements checks for one and
+either handles it (loops for `break`/`continue`, function calls for `return`
+and for the "tail" record of a self-recursive tail call) or passes it on. Raising and unwinding a Python exception costs far more than
+this check, and `return` is the common way out of every hot helper function.
+
+Completion records are intended strictly for internal interpreter use and
+never become Pulse-visible values.
 """
 
 from __future__ import annotations
@@ -25,18 +26,19 @@ if TYPE_CHECKING:
     from src.interpreter import Interpreter
 
 # Control-flow signals
-class BreakException(Exception):
-    def __init__(self) -> None:
-        super().__init__("break")
-
-class ContinueException(Exception):
-    def __init__(self) -> None:
-        super().__init__("continue")
-
-class ReturnException(Exception):
-    def __init__(self, value: Any = None) -> None:
-        super().__init__("return")
+class Completion:
+    """Outcome of a statement that transfers control instead of completing normally."""
+    __slots__ = ("kind", "value")
+    
+    def __init__(self, kind: str, value: Any = None) -> None:
+        self.kind = kind
         self.value = value
+    
+    def __repr__(self) -> str:
+        return f"<completion {self.kind}>"
+
+BREAK = Completion("break")
+CONTINUE = Completion("continue")
 
 # User-visible exception hierarchy
 class PulseException(Exception):
@@ -109,41 +111,71 @@ class PulseNotImplementedError(PulseRuntimeException):
 
 # Class system
 class PulseClass:
+    """
+    A user-defined class. The method resolution order and the flattened member
+    maps are computed once when the class is created, so a member lookup is a
+    single dictionary probe instead of a walk over the base classes.
+    """
     def __init__(self, name: str, methods: dict, class_vars: dict, bases: Optional[list["PulseClass"]] = None):
         self.name = name
         self.methods = methods
         self.class_vars = class_vars
         self.bases = bases or []
+        self.subclasses: list[PulseClass] = []
+        for base in self.bases:
+            base.subclasses.append(self)
+        self.mro = self._linearize()
+        self._build_members()
+    
+    def _linearize(self) -> list["PulseClass"]:
+        # Depth-first, left to right, each class at its first position
+        mro = [self]
+        for base in self.bases:
+            for klass in base.mro:
+                if klass not in mro:
+                    mro.append(klass)
+        return mro
+    
+    def _build_members(self) -> None:
+        # Methods found earlier in the MRO override later ones
+        resolved: dict[str, Any] = {}
+        for klass in reversed(self.mro):
+            resolved.update(klass.methods)
+        self.resolved_methods = resolved
+        # Every member readable through the class; class variables shadow methods
+        self.members = dict(resolved, **self.class_vars)
+        # Methods an instance binds to itself when they are read
+        self.instance_methods = {
+            name: method for name, method in resolved.items()
+            if name not in self.class_vars and not method.declaration.is_static
+        }
+    
+    def invalidate(self) -> None:
+        """Rebuild the member maps of this class and every class derived from it."""
+        self._build_members()
+        for subclass in self.subclasses:
+            subclass.invalidate()
+    
+    def set_class_var(self, name: str, value: Any) -> None:
+        self.class_vars[name] = value
+        self.invalidate()
     
     def call(self, interpreter: "Interpreter", arguments: list, kwargs: dict) -> PulseInstance:
         instance = PulseInstance(self)
         
-        init = self.find_method("__init__")
+        init = self.resolved_methods.get("__init__")
         if init is not None:
-            init.bind(instance).call(interpreter, arguments, kwargs)
+            init.invoke(interpreter, instance, arguments, kwargs)
         
         return instance
     
     def find_method(self, name: str) -> Optional[Any]:
-        if name in self.methods:
-            return self.methods[name]
-        
-        for base in self.bases:
-            method = base.find_method(name)
-            if method is not None:
-                return method
-        
-        return None
+        return self.resolved_methods.get(name)
     
     def get(self, name: str) -> Any:
-        if name in self.class_vars:
-            return self.class_vars[name]
-        
-        method = self.find_method(name)
-        if method is not None:
-            if method.declaration.is_static:
-                return method
-            return method
+        members = self.members
+        if name in members:
+            return members[name]
         
         raise PulseAttributeError(f"Undefined class member '{name}'")
     
@@ -162,15 +194,15 @@ class PulseInstance:
         if name in self.fields:
             return self.fields[name]
         
-        if name in self.klass.class_vars:
-            return self.klass.class_vars[name]
-        
-        method = self.klass.find_method(name)
+        klass = self.klass
+        method = klass.instance_methods.get(name)
         if method is not None:
-            if method.declaration.is_static:
-                return method
             return method.bind(self)
         
+        members = klass.members
+        if name in members:
+            return members[name]
+        
         raise PulseAttributeError(f"Undefined property '{name}'")
     
     def set(self, name: str, value: Any) -> None:
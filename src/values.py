@@ -194,6 +194,12 @@ class PulseTensor(PulseValue):
     def T(self) -> "PulseTensor":
         return PulseTensor(self.array.T)
     
+    def writable_array(self) -> np.ndarray:
+        """Return the array for in-place updates, copying it first if it is shared read-only."""
+        if not self.array.flags.writeable:
+            self.array = self.array.copy()
+        return self.array
+    
     def __repr__(self) -> str:
         def to_str(val):
             if isinstance(val, float) and np.isnan(val):
@@ -254,7 +260,7 @@ class PulseDataset(PulseValue):
         self.X = np.array(X, dtype=float)
         self.y = np.array(y, dtype=float) if y is not None else None
         self.feature_names: list[str] = (
-            feature_names 
+            feature_names
             if feature_names and len(feature_names) == (self.X.shape[1] if self.X.ndim > 1 else 1)
             else [f"feature_{i}" for i in range(self.X.shape[1] if self.X.ndim > 1 else 1)])
         self.target_names: list[str] = target_names or []
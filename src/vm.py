@@ -0,0 +1,525 @@
+"""
+vm.py
+
+Implements the stack-based virtual machine for the Pulse programming language.
+
+The virtual machine executes the bytecode produced by `bytecode.py`. Instead of
+recursing through `accept`/`visit_*` for every node, it runs a single dispatch
+loop over a flat instruction array, keeping intermediate values on an explicit
+value stack.
+
+Calls to user-defined functions do not recurse on the Python stack: the VM
+pushes a new Frame (code, program counter, value stack, environment) onto its
+own frame list and continues in the same loop, popping the frame again on
+RETURN_VALUE. Deep Pulse recursion therefore costs heap-allocated frames rather
+than nested Python calls. Runtime errors unwind the frame list one frame at a
+time, keeping the interpreter's call-depth counter and error call stack in
+step with the tree-walker.
+
+Nodes the compiler delegates (EXEC_NODE/EVAL_NODE) are executed by the
+inherited tree-walking visitors. Because `execute` and `evaluate` are routed
+back through the compiler, any statement or expression those visitors run
+is itself executed as bytecode. A `break`, `continue` or `return` inside a
+delegated node comes back as a completion record and is routed to the
+enclosing loop's jump targets or to the frame's return path.
+
+This module primarily provides:
+- The Frame class, the activation record of one running code unit
+- The VirtualMachine class, an Interpreter that executes compiled bytecode
+"""
+
+from __future__ import annotations
+from typing import Any, Optional
+from src.interpreter import Interpreter
+from src.environment import Environment, UNSET
+from src.error import PulseRuntimeError
+from src.function import PulseFunction
+from src.methods import NATIVE_METHODS
+from src.runtime import PulseInstance, Completion, BREAK
+from src.values import PulseNumber, PulseString, PulseBoolean, PulseList, PulseDict
+from src.bytecode import (
+    Compiler, CodeObject,
+    LOAD_CONST, LOAD_LOCAL, LOAD_OUTER, LOAD_NAME, STORE_LOCAL, STORE_OUTER, STORE_GLOBAL,
+    POP_TOP, STORE_RESULT, CLEAR_RESULT, BINARY_ARITH, BINARY_DIV, COMPARE, BINARY_OP,
+    UNARY_NEGATIVE, UNARY_NOT, UNARY_OP, JUMP, POP_JUMP_IF_FALSE, JUMP_IF_TRUE_OR_POP,
+    JUMP_IF_FALSE_OR_POP, BUILD_LIST, BUILD_DICT, BUILD_STRING, LIST_APPEND, GET_INDEX,
+    SET_INDEX, GET_MEMBER, SET_MEMBER, CALL, RETURN_VALUE, PUSH_SCOPE, POP_SCOPE, NEW_SCOPE,
+    ENTER_SCOPE, RESET_SCOPE, GET_ITER, GET_COMP_ITER, FOR_ITER, DEFINE_LOOP, DEFINE_NAME,
+    UNPACK_LOOP, MAKE_FUNCTION, EXEC_NODE, EVAL_NODE, HALT, LOAD_METHOD, CALL_METHOD,
+)
+import src.runtime as runtime
+
+_EXHAUSTED = object()
+# Receiver slot of a LOAD_METHOD whose callee was resolved as an ordinary value
+_NO_RECEIVER = object()
+
+class Frame:
+    __slots__ = ("code", "pc", "stack", "env", "function", "instance")
+    
+    def __init__(self, code: CodeObject, env: Environment, function: Optional[PulseFunction] = None,
+                 instance: Optional[PulseInstance] = None) -> None:
+        self.code = code
+        self.pc = 0
+        self.stack: list[Any] = []
+        self.env = env
+        self.function = function
+        self.instance = instance
+    
+    def __repr__(self) -> str:
+        return f"<frame {self.code.name} at {self.pc}>"
+
+class VirtualMachine(Interpreter):
+    """Interpreter that compiles programs to bytecode and runs them on a stack machine."""
+    def __init__(self, global_environment: Environment) -> None:
+        super().__init__(global_environment)
+        self.compiler = Compiler(self)
+    
+    # Entry points
+    def interpret(self, statements: list, source: str) -> Any:
+        self.source = source
+        return self.run(self.compiler.compile_program(statements))
+    
+    def execute(self, stmt) -> Any:
+        return self.run(self.compiler.compile_statement(stmt))
+    
+    def evaluate(self, expr) -> Any:
+        return self.run(self.compiler.compile_expression(expr))
+    
+    def run(self, code: CodeObject) -> Any:
+        """Run a code unit in the current environment and return its result."""
+        previous = self.environment
+        try:
+            return self._run_frames(Frame(code, previous))
+        finally:
+            self.environment = previous
+    
+    # Call helpers
+    def _enter_function(self, callee: PulseFunction, arguments: list, kwargs: dict, expr,
+                        instance: Optional[PulseInstance] = None) -> Frame:
+        """Bind a user-defined function call and return the frame that will run its body."""
+        declaration = callee.declaration
+        if instance is None:
+            instance = callee.bound_instance
+            if declaration.is_method and not callee.is_bound and not declaration.is_static:
+                if arguments and isinstance(arguments[0], PulseInstance):
+                    instance = arguments[0]
+                    arguments = arguments[1:]
+                else:
+                    self._raise_type(f"{declaration.name.lexeme}() missing required argument: 'self'. Calling non-static")
+        
+        PulseRuntimeError.push_stack(declaration.name.lexeme, expr.paren.line)
+        try:
+            env = callee.make_environment(self, arguments, kwargs, instance)
+        except BaseException:
+            PulseRuntimeError.pop_stack()
+            self._call_depth -= 1
+            raise
+        return Frame(self.compiler.compile_function(declaration), env, callee, instance)
+    
+    def _leave_function(self, frame: Frame, value: Any) -> Any:
+        PulseRuntimeError.pop_stack()
+        self._call_depth -= 1
+        declaration = frame.function.declaration
+        if declaration.is_method and declaration.name.lexeme == "__init__":
+            return frame.instance
+        return value
+    
+    def _recursion_error(self, caller: Frame) -> runtime.PulseRuntimeException:
+        self._call_depth = 0
+        expr = caller.code.args[caller.pc - 1][2]
+        return runtime.PulseRuntimeException(
+            PulseRuntimeError(
+                message="Maximum recursion depth exceeded",
+                token=expr.paren,
+                context_source=self.source,
+            )
+        )
+    
+    # Dispatch loop
+    def _run_frames(self, frame: Frame) -> Any:
+        frames: list[Frame] = []
+        result = None
+        globals_values = self.globals.values
+        
+        while True:
+            code = frame.code
+            ops = code.ops
+            args = code.args
+            consts = code.constants
+            pc = frame.pc
+            stack = frame.stack
+            push = stack.append
+            pop = stack.pop
+            env = frame.env
+            self.environment = env
+            
+            try:
+                while True:
+                    op = ops[pc]
+                    arg = args[pc]
+                    pc += 1
+                    
+                    if op == LOAD_LOCAL:
+                        value = env.slots[arg]
+                        if value is UNSET:
+                            value = self.visit_variable_expr(code.notes[pc - 1])
+                        push(value)
+                    
+                    elif op == LOAD_CONST:
+                        push(consts[arg])
+                    
+                    elif op == LOAD_NAME:
+                        name = arg[0]
+                        scope = env
+                        while scope is not None:
+                            slot = scope.layout.get(name)
+                            if slot is not None and scope.slots[slot] is not UNSET:
+                                push(scope.slots[slot])
+                                break
+                            values = scope.values
+                            if name in values:
+                                push(values[name])
+                                break
+                            scope = scope.enclosing
+                        else:
+                            if name == "self":
+                                env.get(name)
+                            self._raise_name(f"Undefined variable '{name}'", arg[1])
+                    
+                    elif op == LOAD_OUTER:
+                        value = env.ancestor(arg[0]).slots[arg[1]]
+                        if value is UNSET:
+                            value = self.visit_variable_expr(code.notes[pc - 1])
+                        push(value)
+                    
+                    elif op == BINARY_ARITH:
+                        right = pop()
+                        left = stack[-1]
+                        if left.__class__ is PulseNumber and right.__class__ is PulseNumber:
+                            stack[-1] = PulseNumber(arg[0](left.value, right.value))
+                        else:
+                            stack[-1] = self._binary_op(arg[1], left, right)
+                    
+                    elif op == COMPARE:
+                        right = pop()
+                        left = stack[-1]
+                        if left.__class__ is PulseNumber and right.__class__ is PulseNumber:
+                            stack[-1] = PulseBoolean(arg[0](left.value, right.value))
+                        else:
+                            stack[-1] = self._binary_op(arg[1], left, right)
+                    
+                    elif op == POP_JUMP_IF_FALSE:
+                        if not pop().is_truthy():
+                            pc = arg
+                    
+                    elif op == JUMP:
+                        pc = arg
+                    
+                    elif op == STORE_LOCAL:
+                        env.slots[arg] = stack[-1]
+                    
+                    elif op == POP_TOP:
+                        pop()
+                    
+                    elif op == CALL:
+                        argc, kwnames, expr = arg
+                        self._call_depth += 1
+                        if self._call_depth > self._max_call_depth:
+                            self._call_depth = 0
+                            self._raise("Maximum recursion depth exceeded", expr.paren)
+                        
+                        count = argc + len(kwnames)
+                        if count:
+                            values = stack[-count:]
+                            del stack[-count:]
+                        else:
+                            values = []
+                        callee = pop()
+                        kwargs = dict(zip(kwnames, values[argc:])) if kwnames else {}
+                        arguments = values[:argc] if kwnames else values
+                        
+                        if callee.__class__ is PulseFunction:
+                            callee_frame = self._enter_function(callee, arguments, kwargs, expr)
+                            frame.pc = pc
+                            frame.env = env
+                            frames.append(frame)
+                            frame = callee_frame
+                            break
+                        push(self._call_value(callee, arguments, kwargs, expr))
+                    
+                    elif op == LOAD_METHOD:
+                        receiver = stack[-1]
+                        name = arg.lexeme
+                        method = None
+                        if receiver.__class__ is PulseInstance:
+                            if name not in receiver.fields:
+                                method = receiver.klass.instance_methods.get(name)
+                        else:
+                            table = NATIVE_METHODS.get(receiver.__class__)
+                            if table is not None:
+                                method = table.get(name)
+                        if method is None:
+                            stack[-1] = self._get_member(receiver, arg)
+                            push(_NO_RECEIVER)
+                        else:
+                            stack[-1] = method
+                            push(receiver)
+                    
+                    elif op == CALL_METHOD:
+                        argc, kwnames, expr = arg
+                        self._call_depth += 1
+                        if self._call_depth > self._max_call_depth:
+                            self._call_depth = 0
+                            self._raise("Maximum recursion depth exceeded", expr.paren)
+                        
+                        count = argc + len(kwnames)
+                        if count:
+                            values = stack[-count:]
+                            del stack[-count:]
+                        else:
+                            values = []
+                        receiver = pop()
+                        callee = pop()
+                        kwargs = dict(zip(kwnames, values[argc:])) if kwnames else {}
+                        arguments = values[:argc] if kwnames else values
+                        
+                        if receiver is _NO_RECEIVER:
+                            if callee.__class__ is not PulseFunction:
+                                push(self._call_value(callee, arguments, kwargs, expr))
+                                continue
+                            receiver = None
+                        elif callee.__class__ is not PulseFunction:
+                            push(self._call_native_method(callee, receiver, expr.callee.name, arguments, kwargs, expr))
+                            continue
+                        callee_frame = self._enter_function(callee, arguments, kwargs, expr, receiver)
+                        frame.pc = pc
+                        frame.env = env
+                        frames.append(frame)
+                        frame = callee_frame
+                        break
+                    
+                    elif op == RETURN_VALUE:
+                        value = pop()
+                        if frame.function is None:
+                            return Completion("return", value)
+                        value = self._leave_function(frame, value)
+                        frame = frames.pop()
+                        frame.stack.append(value)
+                        break
+                    
+                    elif op == FOR_ITER:
+                        value = next(stack[-1], _EXHAUSTED)
+                        if value is _EXHAUSTED:
+                            pop()
+                            pc = arg
+                        else:
+                            push(value)
+                    
+                    elif op == PUSH_SCOPE:
+                        env = Environment(env, arg)
+                        self.environment = env
+                    
+                    elif op == POP_SCOPE:
+                        env = env.enclosing if arg == 1 else env.ancestor(arg)
+                        self.environment = env
+                    
+                    elif op == RESET_SCOPE:
+                        if not arg or env.values:
+                            env.reset()
+                    
+                    elif op == NEW_SCOPE:
+                        push(Environment(env, arg))
+                    
+                    elif op == ENTER_SCOPE:
+                        env = stack[-1]
+                        env.reset()
+                        self.environment = env
+                    
+                    elif op == DEFINE_LOOP:
+                        env.slots[arg] = pop()
+                    
+                    elif op == DEFINE_NAME:
+                        env.define(arg, pop())
+                    
+                    elif op == BINARY_DIV:
+                        right = pop()
+                        left = stack[-1]
+                        if left.__class__ is PulseNumber and right.__class__ is PulseNumber and right.value != 0:
+                            stack[-1] = PulseNumber(arg[0](left.value, right.value))
+                        else:
+                            stack[-1] = self._binary_op(arg[1], left, right)
+                    
+                    elif op == GET_INDEX:
+                        index = pop()
+                        obj = stack[-1]
+                        if obj.__class__ is PulseList and index.__class__ is PulseNumber:
+                            elements = obj.elements
+                            i = int(index.value)
+                            if -len(elements) <= i < len(elements):
+                                stack[-1] = elements[i]
+                                continue
+                        stack[-1] = self._get_index(obj, index)
+                    
+                    elif op == SET_INDEX:
+                        value = pop()
+                        index = pop()
+                        obj = stack[-1]
+                        if obj.__class__ is PulseList and index.__class__ is PulseNumber:
+                            elements = obj.elements
+                            i = int(index.value)
+                            if -len(elements) <= i < len(elements):
+                                elements[i] = value
+                                stack[-1] = value
+                                continue
+                        stack[-1] = self._set_index(obj, index, value)
+                    
+                    elif op == GET_MEMBER:
+                        stack[-1] = self._get_member(stack[-1], arg)
+                    
+                    elif op == SET_MEMBER:
+                        value = pop()
+                        stack[-1] = self._set_member(stack[-1], arg, value)
+                    
+                    elif op == STORE_OUTER:
+                        env.ancestor(arg[0]).slots[arg[1]] = stack[-1]
+                    
+                    elif op == STORE_GLOBAL:
+                        globals_values[arg] = stack[-1]
+                    
+                    elif op == STORE_RESULT:
+                        result = pop()
+                    
+                    elif op == CLEAR_RESULT:
+                        result = None
+                    
+                    elif op == JUMP_IF_FALSE_OR_POP:
+                        if stack[-1].is_truthy():
+                            pop()
+                        else:
+                            pc = arg
+                    
+                    elif op == JUMP_IF_TRUE_OR_POP:
+                        if stack[-1].is_truthy():
+                            pc = arg
+                        else:
+                            pop()
+                    
+                    elif op == UNARY_NEGATIVE:
+                        value = stack[-1]
+                        if value.__class__ is PulseNumber:
+                            stack[-1] = PulseNumber(-value.value)
+                        else:
+                            stack[-1] = self._unary_op(arg, value)
+                    
+                    elif op == UNARY_NOT:
+                        stack[-1] = PulseBoolean(not stack[-1].is_truthy())
+                    
+                    elif op == UNARY_OP:
+                        stack[-1] = self._unary_op(arg, stack[-1])
+                    
+                    elif op == BINARY_OP:
+                        right = pop()
+                        stack[-1] = self._binary_op(arg, stack[-1], right)
+                    
+                    elif op == BUILD_LIST:
+                        if arg:
+                            values = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            values = []
+                        push(PulseList(values))
+                    
+                    elif op == BUILD_DICT:
+                        entries: dict[Any, Any] = {}
+                        if arg:
+                            values = stack[-2 * arg:]
+                            del stack[-2 * arg:]
+                            for i in range(0, 2 * arg, 2):
+                                entries[values[i]] = values[i + 1]
+                        push(PulseDict(entries))
+                    
+                    elif op == BUILD_STRING:
+                        if arg:
+                            values = stack[-arg:]
+                            del stack[-arg:]
+                        else:
+                            values = []
+                        push(PulseString("".join(self._stringify(v) for v in values)))
+                    
+                    elif op == LIST_APPEND:
+                        value = pop()
+                        stack[-2].elements.append(value)
+                    
+                    elif op == GET_ITER:
+                        stack[-1] = iter(self._for_items(stack[-1]))
+                    
+                    elif op == GET_COMP_ITER:
+                        stack[-1] = iter(self._comprehension_items(stack[-1]))
+                    
+                    elif op == UNPACK_LOOP:
+                        self._bind_loop_vars(env, arg, pop())
+                    
+                    elif op == MAKE_FUNCTION:
+                        env.define(arg.name.lexeme, PulseFunction(arg, env))
+                    
+                    elif op == EXEC_NODE:
+                        value = arg[0].accept(self)
+                        if value.__class__ is Completion:
+                            frame.pc = pc
+                            frame.env = env
+                            frame = self._complete(frame, frames, value)
+                            if frame is None:
+                                return value
+                            break
+                        if arg[1]:
+                            result = value
+                    
+                    elif op == EVAL_NODE:
+                        push(arg.accept(self))
+                    
+                    elif op == HALT:
+                        return result
+                    
+                    else:
+                        raise RuntimeError(f"Unknown opcode {op}")
+            
+            except Exception as exc:
+                frame.pc = pc
+                frame.env = env
+                frame = self._unwind(frame, frames, exc)
+    
+    def _complete(self, frame: Frame, frames: list[Frame], completion: Completion) -> Optional[Frame]:
+        """Route a completion from a delegated node; None means it leaves this unit of code."""
+        if completion.kind == "return":
+            if frame.function is None:
+                return None
+            value = self._leave_function(frame, completion.value)
+            frame = frames.pop()
+            frame.stack.append(value)
+            return frame
+        
+        code = frame.code
+        at = frame.pc - 1
+        handler = code.find_handler(at)
+        if handler is None:
+            return None
+        is_break = completion is BREAK
+        frame.env = frame.env.ancestor(code.depths[at] - handler.depth)
+        keep = handler.stack_depth + (0 if is_break else int(handler.has_iterator))
+        del frame.stack[keep:]
+        frame.pc = handler.break_target if is_break else handler.continue_target
+        return frame
+    
+    def _unwind(self, frame: Frame, frames: list[Frame], exc: Exception) -> Frame:
+        """Find the frame that handles `exc`, popping frames that do not; re-raise if none does."""
+        while True:
+            if isinstance(exc, RecursionError) and frame.function is not None:
+                exc = self._recursion_error(frames[-1])
+            
+            if frame.function is not None:
+                PulseRuntimeError.pop_stack()
+                self._call_depth -= 1
+            
+            if not frames:
+                raise exc
+            frame = frames.pop()
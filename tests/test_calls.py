@@ -0,0 +1,126 @@
+import pytest
+import io
+import sys
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.closure_compiler import ClosureInterpreter
+from src.vm import VirtualMachine
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+from src.function import CallSignature
+
+ENGINES = [Interpreter, ClosureInterpreter, VirtualMachine]
+
+def run(source: str, engine=Interpreter, resolve: bool = True):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = engine(Environment())
+    if resolve:
+        Resolver(interp).resolve(ast)
+    PulseRuntimeError.clear_stack()
+    interp.interpret(ast, source)
+    return interp
+
+def run_output(source: str, engine=Interpreter, resolve: bool = True) -> str:
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        run(source, engine, resolve)
+    finally:
+        sys.stdout = sys.__stdout__
+    return output.getvalue().strip()
+
+def error_message(source: str, engine=Interpreter) -> str:
+    with pytest.raises(PulseRuntimeException) as exc:
+        run(source, engine)
+    return exc.value.error.message
+
+SCALE = "def scale(x, factor=2, offset=0):\n    return x * factor + offset\n"
+
+# ----------------------------------------
+# 1. Signatures
+# ----------------------------------------
+class TestSignature:
+    def test_built_once_per_declaration(self):
+        interp = run(SCALE + "scale(1)\nscale(2, 3)\nscale(3, offset=1)")
+        [signature] = interp.signatures.values()
+        assert isinstance(signature, CallSignature)
+        assert signature.names == ["x", "factor", "offset"]
+        assert signature.index == {"x": 0, "factor": 1, "offset": 2}
+        assert signature.defaults[0] is None
+        assert signature.slots is not None
+    
+    def test_method_signature_skips_self(self):
+        interp = run("class P:\n    def move(self, dx, *rest):\n        return dx\nP().move(1)")
+        [signature] = interp.signatures.values()
+        assert signature.names == ["dx"]
+        assert signature.self_slot is not None
+        assert signature.vararg == "rest"
+    
+    def test_unresolved_function_binds_by_name(self):
+        interp = run(SCALE + "print(scale(4, offset=1))", resolve=False)
+        [signature] = interp.signatures.values()
+        assert signature.slots is None
+
+# ----------------------------------------
+# 2. Binding
+# ----------------------------------------
+class TestBinding:
+    @pytest.mark.parametrize("engine", ENGINES)
+    @pytest.mark.parametrize("call, expected", [
+        ("scale(5)", "10"),
+        ("scale(5, 3)", "15"),
+        ("scale(5, 3, 1)", "16"),
+        ("scale(5, offset=1)", "11"),
+        ("scale(x=5, factor=1)", "5"),
+        ("scale(offset=2, x=1)", "4"),
+    ])
+    def test_arguments(self, engine, call, expected):
+        assert run_output(SCALE + f"print({call})", engine) == expected
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_varargs(self, engine):
+        source = "def f(a, *rest):\n    print(a, rest)\nf(1)\nf(1, 2, 3)"
+        assert run_output(source, engine) == "1 []\n1 [2, 3]"
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_defaults_are_evaluated_per_call(self, engine):
+        source = (
+            "calls = []\n"
+            "def tick():\n"
+            "    calls.append(1)\n"
+            "    return calls.length()\n"
+            "def f(a, b=tick()):\n"
+            "    return b\n"
+            "print(f(0), f(0), f(0, 9), f(0))"
+        )
+        assert run_output(source, engine) == "1 2 9 3"
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_argument_list_is_not_shared(self, engine):
+        source = "def f(a, b):\n    a = 10\n    return a + b\nprint(f(1, 2), f(3, 4))"
+        assert run_output(source, engine) == "12 14"
+    
+    def test_unresolved_calls(self):
+        assert run_output(SCALE + "print(scale(4, offset=1))", resolve=False) == "9"
+
+# ----------------------------------------
+# 3. Errors
+# ----------------------------------------
+class TestBindingErrors:
+    @pytest.mark.parametrize("engine", ENGINES)
+    @pytest.mark.parametrize("call, message", [
+        ("scale(1, 2, 3, 4)", "Expected at most 3 arguments but got 4"),
+        ("scale()", "Missing required argument 'x'"),
+        ("scale(factor=1)", "Missing required argument 'x'"),
+        ("scale(1, y=2)", "Unexpected keyword argument 'y'"),
+        ("scale(1, x=2)", "Multiple values for argument 'x'"),
+    ])
+    def test_messages(self, engine, call, message):
+        assert error_message(SCALE + call, engine) == message
+    
+    def test_duplicate_parameter_is_reported(self):
+        assert error_message("def f(a, a):\n    return a\nf(1, 2)") == "Variable 'a' already defined."
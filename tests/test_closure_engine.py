@@ -0,0 +1,213 @@
+import pytest
+import io
+import sys
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.closure_compiler import ClosureInterpreter
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+
+def run(source: str, engine=ClosureInterpreter):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = engine(Environment())
+    resolver = Resolver(interp)
+    resolver.resolve(ast)
+    PulseRuntimeError.clear_stack()
+    return interp.interpret(ast, source)
+
+def run_output(source: str, engine=ClosureInterpreter):
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        run(source, engine)
+    finally:
+        sys.stdout = sys.__stdout__
+    return output.getvalue().strip()
+
+def same_as_tree(source: str):
+    assert run_output(source) == run_output(source, Interpreter)
+
+# ----------------------------------------
+# 1. Expressions
+# ----------------------------------------
+class TestExpressions:
+    def test_arithmetic(self):
+        assert run("1 + 2 * 3 - 4 / 2").value == 5.0
+    
+    def test_integer_division_and_modulo(self):
+        assert run("7 // 2 + 7 % 3").value == 4
+    
+    def test_power(self):
+        assert run("2 ** 10").value == 1024
+    
+    def test_string_concatenation(self):
+        assert run('"ab" + "cd"').value == "abcd"
+    
+    def test_comparison_chain(self):
+        assert run("1 < 2 and 3 >= 3 and not (2 == 3)").value is True
+    
+    def test_ternary(self):
+        assert run('"yes" if 2 > 1 else "no"').value == "yes"
+    
+    def test_fstring(self):
+        assert run('x = 3\nf"x={x}, y={x * 2}"').value == "x=3, y=6"
+    
+    def test_list_index_and_assignment(self):
+        result = run("xs = [1, 2, 3]\nxs[1] = 20\nxs[-1] + xs[1]")
+        assert result.value == 23
+    
+    def test_dict_literal(self):
+        assert run('d = {"a": 1, "b": 2}\nd["b"]').value == 2
+    
+    def test_division_by_zero(self):
+        with pytest.raises(PulseRuntimeException):
+            run("1 / 0")
+    
+    def test_modulo_by_zero(self):
+        with pytest.raises(PulseRuntimeException):
+            run("1 % 0")
+    
+    def test_type_error_falls_back_to_interpreter_message(self):
+        with pytest.raises(PulseRuntimeException):
+            run('1 + "a"')
+
+# ----------------------------------------
+# 2. Statements & control flow
+# ----------------------------------------
+class TestControlFlow:
+    def test_while_with_break_and_continue(self):
+        result = run("""
+i = 0
+total = 0
+while True:
+    i += 1
+    if i % 2 == 0:
+        continue
+    if i > 9:
+        break
+    total += i
+total
+""")
+        assert result.value == 25
+    
+    def test_for_over_range(self):
+        assert run("total = 0\nfor i in range(5):\n    total += i\ntotal").value == 10
+    
+    def test_for_unpacking(self):
+        result = run("""
+total = 0
+for a, b in [[1, 2], [3, 4]]:
+    total += a * b
+total
+""")
+        assert result.value == 14
+    
+    def test_block_scoping_matches_tree(self):
+        same_as_tree("""
+x = 1
+def f():
+    x = 2
+    if True:
+        x = 3
+    return x
+print(f(), x)
+""")
+    
+    def test_break_inside_try_runs_finally(self):
+        same_as_tree("""
+log = []
+for i in range(3):
+    try:
+        if i == 1:
+            break
+        log.append(i)
+    finally:
+        log.append("f")
+print(log)
+""")
+
+# ----------------------------------------
+# 3. Functions, closures & classes
+# ----------------------------------------
+class TestFunctions:
+    def test_recursion(self):
+        result = run("""
+def fib(n):
+    if n < 2:
+        return n
+    return fib(n - 1) + fib(n - 2)
+fib(15)
+""")
+        assert result.value == 610
+    
+    def test_closure_counter(self):
+        result = run("""
+def make():
+    count = 0
+    def inc():
+        count = count + 1
+        return count
+    return inc
+c = make()
+c()
+c()
+c()
+""")
+        assert result.value == 3
+    
+    def test_default_arguments(self):
+        assert run("def f(a, b=10):\n    return a + b\nf(1)").value == 11
+    
+    def test_return_inside_try_runs_finally(self):
+        result = run("""
+log = []
+def f():
+    try:
+        return 1
+    finally:
+        log.append("finally")
+f() + log.length()
+""")
+        assert result.value == 2
+    
+    def test_class_methods_and_inheritance(self):
+        result = run("""
+class Animal:
+    def __init__(self, name):
+        self.name = name
+    def speak(self):
+        return self.name + " makes a sound"
+
+class Dog(Animal):
+    def speak(self):
+        return self.name + " barks"
+
+Dog("Rex").speak()
+""")
+        assert result.value == "Rex barks"
+    
+    def test_runaway_recursion_is_reported(self):
+        with pytest.raises(PulseRuntimeException):
+            run("def f(n):\n    return f(n + 1)\nf(0)")
+
+# ----------------------------------------
+# 4. Parity with the tree-walker
+# ----------------------------------------
+class TestParity:
+    def test_examples_programs_match(self):
+        same_as_tree("""
+squares = [x * x for x in range(6) if x % 2 == 0]
+words = {"one": 1, "two": 2}
+for k in words:
+    print(k, words[k])
+print(squares, "-".join(["a", "b"]))
+match 3:
+    case 1:
+        print("one")
+    case _:
+        print("other")
+""")
@@ -994,6 +994,73 @@ for i in range(3):
 log.length()
 """)
         assert result.value == 2
+    
+    def test_return_in_finally_overrides_return(self):
+        result = run("""
+def f():
+    try:
+        return 1
+    finally:
+        return 2
+f()
+""")
+        assert result.value == 2
+    
+    def test_break_in_finally_discards_exception(self):
+        result = run("""
+n = 0
+for i in range(3):
+    n += 1
+    try:
+        x = 1 / 0
+    finally:
+        break
+n
+""")
+        assert result.value == 1
+    
+    def test_continue_inside_try_runs_finally(self):
+        result = run("""
+log = []
+for i in range(3):
+    try:
+        if i == 1:
+            continue
+        log.append(i)
+    finally:
+        log.append("f")
+log.length()
+""")
+        assert result.value == 5
+    
+    def test_return_from_except_runs_finally(self):
+        result = run("""
+log = []
+def f():
+    try:
+        x = 1 / 0
+    except Exception:
+        return "caught"
+    finally:
+        log.append("finally")
+f() + str(log.length())
+""")
+        assert result.value == "caught1"
+    
+    def test_return_from_match_inside_loop(self):
+        result = run("""
+def f():
+    i = 0
+    while True:
+        i += 1
+        match i:
+            case 3:
+                return i
+            case _:
+                continue
+f()
+""")
+        assert result.value == 3
 
 # ----------------------------------------
 # 11. Error diagnostics
@@ -1841,3 +1908,111 @@ a, b = [@[[1, 0], [0, 1]], @[[2, 3], [4, 5]]]
 (a @ b).sum()
 """)
         assert result.value == pytest.approx(14.0)
+
+# ----------------------------------------
+# Slot-indexed scopes
+# ----------------------------------------
+class TestSlotScopes:
+    def test_function_locals_read_inside_except(self):
+        result = run("""
+def f():
+    x = 1
+    try:
+        y = 1 / 0
+    except Exception as e:
+        return x + 1
+f()
+""")
+        assert result.value == 2
+    
+    def test_except_variable_does_not_leak(self):
+        raises_runtime("""
+try:
+    raise "boom"
+except Exception as e:
+    pass
+e
+""", "undefined variable")
+    
+    def test_nested_closures_write_through_slots(self):
+        result = run("""
+def outer():
+    a = 1
+    b = 2
+    def inner():
+        b = b + 10
+        return a + b
+    first = inner()
+    return first + b
+outer()
+""")
+        assert result.value == 25
+    
+    def test_each_loop_iteration_gets_fresh_slots(self):
+        result = run("""
+fs = []
+for i in range(3):
+    j = i * 2
+    fs.append(lambda: j)
+fs[0]() + fs[1]() + fs[2]()
+""")
+        assert result.value == 6
+    
+    def test_layouts_registered_for_scopes(self):
+        source = "def f(a, b):\n    c = a + b\n    return c\nf(1, 2)"
+        tokens = Lexer(source).scan_tokens()
+        ast = Parser(tokens, source).parse()
+        interp = Interpreter(Environment())
+        Resolver(interp).resolve(ast)
+        assert {"a": 0, "b": 1, "c": 2} in interp.scope_layouts.values()
+    
+    def test_loop_reuse_keeps_iterations_independent(self):
+        raises_runtime("""
+for i in range(3):
+    if i == 1:
+        print(z)
+    z = i
+""", "undefined variable")
+    
+    def test_function_defined_in_loop_body(self):
+        result = run("""
+total = 0
+for i in range(3):
+    def g():
+        return 2
+    total += g()
+total
+""")
+        assert result.value == 6
+    
+    def test_closures_in_while_body_capture_each_iteration(self):
+        result = run("""
+n = 0
+fs = []
+while n < 3:
+    m = n * 10
+    fs.append(lambda: m)
+    n += 1
+fs[0]() + fs[1]() + fs[2]()
+""")
+        assert result.value == 30
+    
+    def test_comprehension_closures_capture_each_item(self):
+        assert run("[(lambda: x) for x in range(3)][2]()").value == 2
+    
+    def test_uncaptured_loop_scopes_are_not_reallocated(self, monkeypatch):
+        source = "total = 0\nfor i in range(100):\n    x = i\n    total += x\ntotal"
+        tokens = Lexer(source).scan_tokens()
+        ast = Parser(tokens, source).parse()
+        interp = Interpreter(Environment())
+        Resolver(interp).resolve(ast)
+        
+        created = []
+        original = Environment.__init__
+        def counting_init(env, *args, **kwargs):
+            created.append(env)
+            original(env, *args, **kwargs)
+        monkeypatch.setattr(Environment, "__init__", counting_init)
+        
+        assert interp.interpret(ast, source).value == 4950
+        assert len(created) < 5
@@ -0,0 +1,197 @@
+import pytest
+import io
+import sys
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.closure_compiler import ClosureInterpreter
+from src.vm import VirtualMachine
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+from src.function import PulseBoundMethod
+from src.methods import NATIVE_METHODS, LIST_METHODS, STRING_METHODS, DICT_METHODS, TENSOR_METHODS
+from src.values import PulseList, PulseString, PulseDict, PulseTensor
+
+ENGINES = [Interpreter, ClosureInterpreter, VirtualMachine]
+
+def run(source: str, engine=Interpreter):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = engine(Environment())
+    Resolver(interp).resolve(ast)
+    PulseRuntimeError.clear_stack()
+    return interp.interpret(ast, source)
+
+def run_output(source: str, engine=Interpreter) -> str:
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        run(source, engine)
+    finally:
+        sys.stdout = sys.__stdout__
+    return output.getvalue().strip()
+
+def error_message(source: str, engine=Interpreter) -> str:
+    with pytest.raises(PulseRuntimeException) as exc:
+        run(source, engine)
+    return exc.value.error.message
+
+@pytest.fixture
+def bindings(monkeypatch):
+    """Count the bound-method objects created while a program runs."""
+    created = []
+    original = PulseBoundMethod.__init__
+    
+    def counting_init(self, *args):
+        created.append(args[0].name)
+        original(self, *args)
+    monkeypatch.setattr(PulseBoundMethod, "__init__", counting_init)
+    return created
+
+# ----------------------------------------
+# 1. Method tables
+# ----------------------------------------
+class TestTables:
+    def test_table_per_builtin_type(self):
+        assert NATIVE_METHODS[PulseList] is LIST_METHODS
+        assert NATIVE_METHODS[PulseString] is STRING_METHODS
+        assert NATIVE_METHODS[PulseDict] is DICT_METHODS
+        assert NATIVE_METHODS[PulseTensor] is TENSOR_METHODS
+    
+    def test_tables_hold_unbound_methods(self):
+        assert {"append", "pop", "sort", "map", "extend"} <= set(LIST_METHODS)
+        assert {"upper", "split", "join", "format"} <= set(STRING_METHODS)
+        assert {"keys", "values", "items", "has", "remove"} <= set(DICT_METHODS)
+        assert {"flatten", "reshape", "sum"} <= set(TENSOR_METHODS)
+
+# ----------------------------------------
+# 2. Calls and bound methods
+# ----------------------------------------
+class TestMethodCalls:
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_direct_call_does_not_bind(self, engine, bindings):
+        source = "xs = []\nfor i in range(10):\n    xs.append(i)\nprint(xs.length())"
+        assert run_output(source, engine) == "10"
+        assert bindings == []
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_method_read_as_value(self, engine, bindings):
+        source = "xs = [3, 1, 2]\nadd = xs.append\nadd(0)\nadd(5)\nprint(xs)"
+        assert run_output(source, engine) == "[3, 1, 2, 0, 5]"
+        assert bindings == ["append"]
+    
+    def test_bound_method_repr(self):
+        assert repr(run("[].append")) == "<native fn append>"
+        assert repr(run('"a".upper')) == "<native fn upper>"
+        assert repr(run("@[1, 2].sum")) == "<native method>"
+    
+    def test_bound_method_passed_around(self):
+        assert run_output('join = ",".join\nprint(join(["x", "y"]))') == "x,y"
+        assert run_output('print(["x", "y"] |> "-".join)') == "x-y"
+    
+    def test_tensor_properties(self):
+        assert run("@[[1, 2], [3, 4]].shape").elements[0].value == 2
+        assert run("@[1, 2, 3].size").value == 3
+    
+    def test_keyword_arguments(self):
+        assert run_output("xs = [1, 3, 2]\nxs.sort(reverse=True)\nprint(xs)") == "[3, 2, 1]"
+
+# ----------------------------------------
+# 3. Errors
+# ----------------------------------------
+class TestMethodErrors:
+    @pytest.mark.parametrize("engine", ENGINES)
+    @pytest.mark.parametrize("source, message", [
+        ("[].nope()", "List has no method 'nope'"),
+        ('"a".nope()', "String has no method 'nope'"),
+        ("{}.nope()", "Dict has no method 'nope'"),
+        ("@[1].nope", "Tensor has no property 'nope'"),
+        ("null.x", "Cannot access member of null"),
+        ("[].pop()", "pop() called on empty list"),
+    ])
+    def test_messages(self, engine, source, message):
+        assert error_message(source, engine) == message
+    
+    def test_native_frame_on_the_stack(self):
+        source = "def key(x):\n    return x.nope\n[1, 2].sort(key=key)"
+        with pytest.raises(PulseRuntimeException) as exc:
+            run(source)
+        assert "<native fn sort>" in [name for name, _ in exc.value.error.stack]
+
+# ----------------------------------------
+# 4. Class method resolution
+# ----------------------------------------
+CLASSES = """
+class A:
+    def who(self):
+        return "A"
+    def hello(self):
+        return "hello from " + self.who()
+
+class B(A):
+    def who(self):
+        return "B"
+
+class C(A):
+    def who(self):
+        return "C"
+    def only_c(self):
+        return "c"
+
+class D(B, C):
+    pass
+"""
+
+class TestClassMethods:
+    def test_mro_and_flattened_methods(self):
+        d = run(CLASSES + "D")
+        assert [klass.name for klass in d.mro] == ["D", "B", "A", "C"]
+        assert d.resolved_methods["who"] is d.bases[0].methods["who"]
+        assert set(d.instance_methods) == {"who", "hello", "only_c"}
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_lookup_order_unchanged(self, engine):
+        source = CLASSES + "d = D()\nprint(d.who())\nprint(d.hello())\nprint(d.only_c())"
+        assert run_output(source, engine) == "B\nhello from B\nc"
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_method_call_does_not_bind(self, engine, monkeypatch):
+        from src.function import PulseFunction
+        calls = []
+        original = PulseFunction.bind
+        monkeypatch.setattr(PulseFunction, "bind", lambda self, instance: calls.append(1) or original(self, instance))
+        source = CLASSES + "d = D()\nfor i in range(5):\n    d.hello()\nm = d.who\nprint(m())"
+        assert run_output(source, engine) == "B"
+        assert len(calls) == 1
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_class_variable_assignment_invalidates(self, engine):
+        source = (
+            CLASSES
+            + "d = D()\n"
+            + "B.who = 5\n"
+            + "print(d.who)\n"
+            + "print(D().who())\n"
+        )
+        assert run_output(source, engine) == "<function who>\nB"
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_fields_shadow_methods(self, engine):
+        source = CLASSES + "a = A()\na.who = lambda: \"field\"\nprint(a.who())\nprint(a.hello())"
+        assert run_output(source, engine) == "field\nhello from field"
+    
+    @pytest.mark.parametrize("engine", ENGINES)
+    def test_init_and_static_methods(self, engine):
+        source = (
+            "class P:\n"
+            "    def __init__(self, x):\n"
+            "        self.x = x\n"
+            "    static def make(x):\n"
+            "        return P(x * 2)\n"
+            "    def get(self):\n"
+            "        return self.x\n"
+            "print(P.make(4).get())"
+        )
+        assert run_output(source, engine) == "8"
@@ -0,0 +1,129 @@
+import pytest
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+from src.operators import BINARY_HANDLERS, BINARY_DISPATCH, register_binary, find_binary
+from src.values import PulseValue, PulseNumber, PulseString, PulseTensor
+
+def run(source: str, **bindings):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = Interpreter(Environment())
+    for name, value in bindings.items():
+        interp.globals.define(name, value)
+    Resolver(interp).resolve(ast)
+    PulseRuntimeError.clear_stack()
+    return interp.interpret(ast, source)
+
+def error_message(source: str) -> str:
+    with pytest.raises(PulseRuntimeException) as exc:
+        run(source)
+    return exc.value.error.message
+
+class Money(PulseValue):
+    def __init__(self, cents):
+        self.cents = cents
+    
+    def type_name(self) -> str:
+        return "money"
+
+class Euro(Money):
+    pass
+
+@pytest.fixture
+def registry():
+    """Restore the handler table after a test registers its own operators."""
+    saved = dict(BINARY_HANDLERS)
+    yield
+    BINARY_HANDLERS.clear()
+    BINARY_HANDLERS.update(saved)
+    BINARY_DISPATCH.clear()
+
+# ----------------------------------------
+# 1. Core operators
+# ----------------------------------------
+class TestCoreOperators:
+    @pytest.mark.parametrize("source, expected", [
+        ("7 + 3", 10),
+        ("7 - 3", 4),
+        ("7 * 3", 21),
+        ("7 / 2", 3.5),
+        ("7 // 2", 3),
+        ("-7 // 2", -4),
+        ("7 % 3", 1),
+        ("2 ** 5", 32),
+        ("1 < 2", True),
+        ("2 <= 1", False),
+        ("3 > 2", True),
+        ("3 >= 4", False),
+        ('"ab" + "cd"', "ab" + "cd"),
+        ("1 in [1, 2]", True),
+        ("3 not in [1, 2]", True),
+        ("null is null", True),
+    ])
+    def test_results(self, source, expected):
+        assert run(source).value == expected
+    
+    def test_list_concatenation(self):
+        assert [e.value for e in run("[1] + [2, 3]").elements] == [1, 2, 3]
+    
+    @pytest.mark.parametrize("source, message", [
+        ('1 + "a"', "'+' requires two numbers or two strings, got 'number' and 'string'"),
+        ('"a" - 1', "'-' requires two numbers, got 'string' and 'number'"),
+        ("1 / 0", "Division by zero"),
+        ("1 % 0", "Modulo by zero"),
+        ("1 // 0", "Integer division by zero"),
+        ("1 @ 2", "Unknown binary operator '@'"),
+        ("@[1] < 2", "Tensor does not support operator '<' with scalar"),
+        ("@[1] < @[2]", "Tensor does not support operator '<'"),
+        ('"a" + @[1]', "Both operands must be tensors, got 'string' and 'tensor'"),
+    ])
+    def test_errors(self, source, message):
+        assert error_message(source) == message
+    
+    def test_tensor_operators(self):
+        assert run("@[1, 2] + @[3, 4]").array.tolist() == [4, 6]
+        assert run("@[1, 2] * 2").array.tolist() == [2, 4]
+        assert run("@[1, 2] == @[1, 2]").value is True
+
+# ----------------------------------------
+# 2. Dispatch table
+# ----------------------------------------
+class TestDispatch:
+    def test_resolution_is_cached_per_class_pair(self):
+        handler = find_binary("+", PulseNumber, PulseNumber)
+        assert BINARY_DISPATCH[("+", PulseNumber, PulseNumber)] is handler
+    
+    def test_falls_back_to_base_class_handlers(self):
+        assert find_binary("==", PulseString, PulseTensor) is BINARY_HANDLERS[("==", object, PulseTensor)]
+        assert find_binary("==", PulseString, PulseNumber) is BINARY_HANDLERS[("==", object, object)]
+    
+    def test_unknown_operator(self):
+        assert find_binary("<>", PulseNumber, PulseNumber) is None
+    
+    def test_register_new_type(self, registry):
+        def add_money(interp, tok, left, right):
+            return Money(left.cents + right.cents)
+        register_binary("+", Money, Money, add_money)
+        
+        result = run("a + b", a=Money(150), b=Money(250))
+        assert isinstance(result, Money)
+        assert result.cents == 400
+    
+    def test_subclasses_use_base_handler(self, registry):
+        register_binary("*", Money, PulseNumber, lambda interp, tok, left, right: Money(left.cents * right.value))
+        assert run("a * 3", a=Euro(5)).cents == 15
+    
+    def test_registering_invalidates_cache(self, registry):
+        assert error_message('"ab" * 2') == "'*' requires two numbers, got 'string' and 'number'"
+        register_binary("*", PulseString, PulseNumber, lambda interp, tok, left, right: PulseString(left.value * int(right.value)))
+        assert run('"ab" * 2').value == "abab"
+    
+    def test_unregistered_pairs_keep_default_errors(self, registry):
+        register_binary("+", Money, Money, lambda interp, tok, left, right: Money(0))
+        with pytest.raises(PulseRuntimeException):
+            run("a + 1", a=Money(1))
@@ -0,0 +1,193 @@
+import pytest
+import io
+import sys
+import numpy as np
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.optimizer import Optimizer
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+from src.values import PulseNumber, PulseString, PulseBoolean, PulseTensor
+import src.expressions as expressions
+import src.statements as statements
+
+def optimize(source: str) -> list:
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    return Optimizer(Interpreter(Environment())).optimize(ast)
+
+def folded(source: str):
+    """The expression of a single-statement program after optimization."""
+    return optimize(source)[0].expression
+
+def run(source: str, optimized: bool = True):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = Interpreter(Environment())
+    if optimized:
+        ast = Optimizer(interp).optimize(ast)
+    Resolver(interp).resolve(ast)
+    PulseRuntimeError.clear_stack()
+    return interp.interpret(ast, source)
+
+def run_output(source: str, optimized: bool = True) -> str:
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        run(source, optimized)
+    finally:
+        sys.stdout = sys.__stdout__
+    return output.getvalue().strip()
+
+def same_as_unoptimized(source: str):
+    assert run_output(source) == run_output(source, optimized=False)
+
+# ----------------------------------------
+# 1. Literal pre-boxing
+# ----------------------------------------
+class TestPreBoxing:
+    def test_literals_are_boxed(self):
+        expr = folded("x")
+        assert isinstance(expr, expressions.Variable)
+        
+        assert isinstance(folded("42").value, PulseNumber)
+        assert isinstance(folded('"hi"').value, PulseString)
+        assert isinstance(folded("True").value, PulseBoolean)
+    
+    def test_literal_evaluates_to_the_same_box(self):
+        interp = Interpreter(Environment())
+        expr = folded("42")
+        assert interp.evaluate(expr) is interp.evaluate(expr)
+    
+    def test_literals_inside_functions_are_boxed(self):
+        func = optimize("def f():\n    return 7")[0]
+        assert isinstance(func.body.statements[0].value.value, PulseNumber)
+
+# ----------------------------------------
+# 2. Constant folding
+# ----------------------------------------
+class TestFolding:
+    @pytest.mark.parametrize("source, expected", [
+        ("1 + 2 * 3", 7),
+        ("(10 - 4) / 3", 2.0),
+        ("7 // 2", 3),
+        ("7 % 4", 3),
+        ("2 ** 10", 1024),
+        ("-(3 + 4)", -7),
+    ])
+    def test_arithmetic(self, source, expected):
+        expr = folded(source)
+        assert isinstance(expr, expressions.Literal)
+        assert expr.value.value == expected
+    
+    def test_string_concatenation(self):
+        assert folded('"ab" + "cd"').value.value == "abcd"
+    
+    @pytest.mark.parametrize("source, expected", [
+        ("1 < 2", True),
+        ("3 >= 4", False),
+        ('"a" == "a"', True),
+        ("1 != 1", False),
+        ("not 0", True),
+    ])
+    def test_comparisons(self, source, expected):
+        assert folded(source).value.value is expected
+    
+    def test_partial_folding(self):
+        expr = folded("x + 2 * 3")
+        assert isinstance(expr, expressions.Binary)
+        assert expr.right.value.value == 6
+    
+    def test_division_by_zero_is_not_folded(self):
+        assert isinstance(folded("1 / 0"), expressions.Binary)
+        with pytest.raises(PulseRuntimeException):
+            run("1 / 0")
+    
+    def test_type_errors_are_not_folded(self):
+        assert isinstance(folded('1 + "a"'), expressions.Binary)
+        assert isinstance(folded("True + 1"), expressions.Binary)
+    
+    def test_huge_powers_are_not_folded(self):
+        assert isinstance(folded("10 ** 100000"), expressions.Binary)
+    
+    def test_constant_logical_and_ternary(self):
+        assert isinstance(folded("True or x"), expressions.Literal)
+        assert isinstance(folded("True and x"), expressions.Variable)
+        assert isinstance(folded("x if False else y"), expressions.Variable)
+        assert folded("x if False else y").name.lexeme == "y"
+
+# ----------------------------------------
+# 3. Dead branch elimination
+# ----------------------------------------
+class TestDeadBranches:
+    def test_false_if_becomes_pass(self):
+        assert isinstance(optimize("if False:\n    print(1)")[0], statements.Pass)
+    
+    def test_true_if_keeps_then_branch(self):
+        stmt = optimize("if 1 < 2:\n    print(1)\nelse:\n    print(2)")[0]
+        assert isinstance(stmt, statements.Block)
+    
+    def test_false_conditions_fall_through_to_elif(self):
+        stmt = optimize("if False:\n    print(1)\nelif x:\n    print(2)\nelse:\n    print(3)")[0]
+        assert isinstance(stmt, statements.If)
+        assert isinstance(stmt.condition, expressions.Variable)
+        assert stmt.elif_branches == []
+    
+    def test_branch_that_binds_is_kept(self):
+        stmt = optimize("def f():\n    if False:\n        x = 1\n    return x")[0]
+        assert isinstance(stmt.body.statements[0], statements.If)
+    
+    def test_binding_in_dead_branch_still_makes_name_local(self):
+        with pytest.raises(PulseRuntimeException):
+            run("x = 5\ndef f():\n    if False:\n        x = 1\n    print(x)\nf()")
+    
+    def test_same_output(self):
+        same_as_unoptimized(
+            "for i in range(3):\n"
+            "    if 2 > 1:\n"
+            "        print(i)\n"
+            "    elif i:\n"
+            "        print(-i)\n"
+            "    if 0:\n"
+            "        print('never')\n"
+        )
+
+# ----------------------------------------
+# 4. Tensor literals
+# ----------------------------------------
+class TestTensorLiterals:
+    def test_materialized_read_only(self):
+        expr = folded("@[1, 2, 3]")
+        assert isinstance(expr.value, np.ndarray)
+        assert not expr.value.flags.writeable
+    
+    def test_evaluations_share_the_array(self):
+        interp = Interpreter(Environment())
+        expr = folded("@[[1, 2], [3, 4]]")
+        first, second = interp.evaluate(expr), interp.evaluate(expr)
+        assert first is not second
+        assert first.array is second.array
+    
+    def test_copy_on_write(self):
+        interp = Interpreter(Environment())
+        expr = folded("@[1, 2, 3]")
+        tensor = interp.evaluate(expr)
+        tensor.writable_array()[0] = 99
+        assert tensor.array[0] == 99
+        assert interp.evaluate(expr).array[0] == 1
+    
+    def test_writable_array_does_not_copy_owned_arrays(self):
+        tensor = PulseTensor(np.array([1.0, 2.0]))
+        assert tensor.writable_array() is tensor.array
+    
+    def test_invalid_tensor_still_fails_at_runtime(self):
+        expr = folded("@[[1, 2], [3]]")
+        assert isinstance(expr.value, list)
+        with pytest.raises(PulseRuntimeException):
+            run("@[[1, 2], [3]]")
+    
+    def test_tensor_arithmetic_unchanged(self):
+        same_as_unoptimized("t = @[1, 2, 3]\nfor i in range(3):\n    t = t + @[1, 1, 1]\nprint(t)")
@@ -389,6 +389,60 @@ class TestResolveLocal:
         expr = variable_expr("x")
         r.resolve_local(expr, expr.name)
         interp.resolve.assert_called_once_with(expr, 1)
+    
+    def test_resolves_slot_within_scope(self):
+        interp = make_interpreter()
+        r = make_resolver(interp)
+        r.begin_scope()
+        r.scopes[-1]["a"] = True
+        r.scopes[-1]["b"] = True
+        expr = variable_expr("b")
+        r.resolve_local(expr, expr.name)
+        interp.resolve_slot.assert_called_once_with(expr, 1)
+    
+    def test_no_slot_for_global_var(self):
+        interp = make_interpreter()
+        r = make_resolver(interp)
+        r.scopes[0]["x"] = True
+        expr = variable_expr("x")
+        r.resolve_local(expr, expr.name)
+        interp.resolve_slot.assert_not_called()
+    
+    def test_reference_from_nested_function_marks_scope_captured(self):
+        interp = make_interpreter()
+        r = make_resolver(interp)
+        node = MagicMock()
+        r.begin_scope()
+        r.scopes[-1]["x"] = True
+        r.begin_scope(is_function=True)
+        expr = variable_expr("x")
+        r.resolve_local(expr, expr.name)
+        r.end_scope()
+        r.end_scope(node)
+        interp.resolve_captured.assert_called_once_with(node)
+    
+    def test_reference_without_function_boundary_is_not_captured(self):
+        interp = make_interpreter()
+        r = make_resolver(interp)
+        node = MagicMock()
+        r.begin_scope()
+        r.scopes[-1]["x"] = True
+        r.begin_scope()
+        expr = variable_expr("x")
+        r.resolve_local(expr, expr.name)
+        r.end_scope()
+        r.end_scope(node)
+        interp.resolve_captured.assert_not_called()
+    
+    def test_end_scope_reports_layout(self):
+        interp = make_interpreter()
+        r = make_resolver(interp)
+        node = MagicMock()
+        r.begin_scope()
+        r.scopes[-1]["x"] = True
+        r.scopes[-1]["y"] = True
+        r.end_scope(node)
+        interp.resolve_scope.assert_called_once_with(node, {"x": 0, "y": 1})
 
 class TestVariableExpr:
     def test_variable_before_assignment_raises(self):
@@ -461,6 +515,19 @@ class TestBreakContinueStatements:
         r = make_resolver()
         r.loop_depth = 1
         r.visit_continue_stmt(continue_stmt())
+    
+    def test_break_in_function_nested_in_loop_raises(self):
+        r = make_resolver()
+        r.loop_depth = 1
+        fn = function_stmt(body=block_stmt(stmts=[break_stmt()]))
+        with pytest.raises(PulseSemanticError, match="'break'"):
+            r.visit_function_stmt(fn)
+    
+    def test_function_restores_loop_depth(self):
+        r = make_resolver()
+        r.loop_depth = 1
+        r.visit_function_stmt(function_stmt())
+        assert r.loop_depth == 1
 
 class TestWhileStatement:
     def test_while_increments_and_decrements_loop_depth(self):
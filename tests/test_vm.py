@@ -0,0 +1,222 @@
+import pytest
+import io
+import sys
+import inspect
+from src.lexer import Lexer
+from src.parser import Parser
+from src.interpreter import Interpreter
+from src.vm import VirtualMachine
+from src.bytecode import disassemble
+from src.environment import Environment
+from src.resolver import Resolver
+from src.runtime import PulseRuntimeException
+from src.error import PulseRuntimeError
+
+def run(source: str, engine=VirtualMachine):
+    tokens = Lexer(source).scan_tokens()
+    ast = Parser(tokens, source).parse()
+    interp = engine(Environment())
+    resolver = Resolver(interp)
+    resolver.resolve(ast)
+    PulseRuntimeError.clear_stack()
+    return interp.interpret(ast, source)
+
+def run_output(source: str, engine=VirtualMachine):
+    output = io.StringIO()
+    sys.stdout = output
+    try:
+        run(source, engine)
+    finally:
+        sys.stdout = sys.__stdout__
+    return output.getvalue().strip()
+
+def same_as_tree(source: str):
+    assert run_output(source) == run_output(source, Interpreter)
+
+def dis(source: str) -> str:
+    vm = VirtualMachine(Environment())
+    ast = Parser(Lexer(source).scan_tokens(), source).parse()
+    Resolver(vm).resolve(ast)
+    return disassemble(vm.compiler.compile_program(ast))
+
+# ----------------------------------------
+# 1. Execution
+# ----------------------------------------
+class TestExecution:
+    def test_arithmetic(self):
+        assert run("1 + 2 * 3 - 4 / 2").value == 5.0
+    
+    def test_last_statement_value(self):
+        assert run("x = 1\nif x > 0:\n    x + 1").value == 2
+    
+    def test_last_statement_loop_is_null(self):
+        assert run("x = 1\nwhile x < 3:\n    x += 1") is None
+    
+    def test_logical_short_circuit(self):
+        assert run("0 or 5").value == 5
+        assert run("0 and 5").value == 0
+    
+    def test_listcomp(self):
+        result = run("[x * x for x in range(5) if x % 2 == 0]")
+        assert [e.value for e in result.elements] == [0, 4, 16]
+    
+    def test_dict_and_fstring(self):
+        assert run('d = {"a": 1}\nf"a={d["a"]}"').value == "a=1"
+    
+    def test_keyword_and_default_arguments(self):
+        assert run("def f(a, b=2, c=3):\n    return a + b * c\nf(1, c=10)").value == 21
+    
+    def test_closure_counter(self):
+        result = run("""
+def make():
+    count = 0
+    def inc():
+        count = count + 1
+        return count
+    return inc
+c = make()
+c()
+c()
+""")
+        assert result.value == 2
+    
+    def test_methods_and_init(self):
+        result = run("""
+class Point:
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+    def total(self):
+        return self.x + self.y
+Point(2, 3).total()
+""")
+        assert result.value == 5
+
+# ----------------------------------------
+# 2. Control flow
+# ----------------------------------------
+class TestControlFlow:
+    def test_nested_loops_break_continue(self):
+        same_as_tree("""
+out = []
+for i in range(4):
+    j = 0
+    while True:
+        j += 1
+        if j > i:
+            break
+        if j == 2:
+            continue
+        out.append([i, j])
+print(out)
+""")
+    
+    def test_break_from_delegated_try(self):
+        same_as_tree("""
+log = []
+for i in range(5):
+    try:
+        if i == 2:
+            break
+        log.append(i)
+    finally:
+        log.append("f")
+print(log)
+""")
+    
+    def test_continue_from_delegated_match(self):
+        same_as_tree("""
+log = []
+for i in range(4):
+    match i:
+        case 1:
+            continue
+        case _:
+            log.append(i)
+print(log)
+""")
+    
+    def test_return_from_delegated_try(self):
+        result = run("""
+log = []
+def f():
+    for i in range(3):
+        try:
+            return i + 10
+        finally:
+            log.append("finally")
+f() + log.length()
+""")
+        assert result.value == 11
+
+# ----------------------------------------
+# 3. Frames & errors
+# ----------------------------------------
+class TestFrames:
+    def test_recursion_does_not_grow_python_stack(self):
+        limit = sys.getrecursionlimit()
+        sys.setrecursionlimit(len(inspect.stack()) + 150)
+        try:
+            result = run("""
+def down(n):
+    if n == 0:
+        return 0
+    return 1 + down(n - 1)
+down(900)
+""")
+        finally:
+            sys.setrecursionlimit(limit)
+        assert result.value == 900
+    
+    def test_max_recursion_depth_reported(self):
+        with pytest.raises(PulseRuntimeException, match="Maximum recursion depth"):
+            run("def f(n):\n    return f(n + 1)\nf(0)")
+    
+    def test_error_in_callee_is_catchable(self):
+        result = run("""
+def bad(n):
+    return n / 0
+caught = False
+try:
+    bad(1)
+except ZeroDivisionError:
+    caught = True
+caught
+""")
+        assert result.value is True
+    
+    def test_environment_restored_after_error(self):
+        vm = VirtualMachine(Environment())
+        source = "def bad():\n    x = [1]\n    return x[5]\nbad()"
+        ast = Parser(Lexer(source).scan_tokens(), source).parse()
+        Resolver(vm).resolve(ast)
+        with pytest.raises(PulseRuntimeException):
+            vm.interpret(ast, source)
+        assert vm.environment is vm.globals
+        assert vm._call_depth == 0
+
+# ----------------------------------------
+# 4. Disassembler
+# ----------------------------------------
+class TestDisassembler:
+    def test_lists_function_code(self):
+        listing = dis("def add(a, b):\n    return a + b\nadd(1, 2)")
+        assert "Disassembly of <code <module>>" in listing
+        assert "Disassembly of <code add>" in listing
+        assert "MAKE_FUNCTION" in listing
+        assert "BINARY_ARITH           +" in listing
+    
+    def test_loop_jumps_are_marked(self):
+        listing = dis("for i in range(3):\n    if i == 1:\n        break\n    print(i)")
+        assert "FOR_ITER" in listing
+        assert ">>" in listing
+        assert "GET_ITER" in listing
+    
+    def test_constants_are_pooled(self):
+        listing = dis('x = "hi"\ny = "hi"')
+        assert listing.count("LOAD_CONST             0 ('hi')") == 2
+    
+    def test_locals_use_slots(self):
+        listing = dis("def add(a, b):\n    return a + b\nadd(1, 2)")
+        assert "LOAD_LOCAL             0 (a)" in listing
+        assert "LOAD_LOCAL             1 (b)" in listing